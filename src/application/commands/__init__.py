@@ -10,16 +10,20 @@ from application.commands.game import (
     DeleteTwichGame,
     DeleteTwichGameByName,
     ParseTwichGame,
+    ParseTwichGames,
 )
 from application.commands.stream import (
+    CrawlTwichStreams,
     DeleteTwichStream,
     DeleteTwichStreamByUserLogin,
     ParseTwichStream,
+    ParseTwichStreams,
 )
 from application.commands.user import (
     DeleteTwichUser,
     DeleteTwichUserByLogin,
     ParseTwichUser,
+    ParseTwichUsers,
 )
 
 
@@ -31,11 +35,15 @@ __all__: list[str] = [
     'DeleteTwichGame',
     'DeleteTwichGameByName',
     'ParseTwichGame',
+    'ParseTwichGames',
+    'CrawlTwichStreams',
     'DeleteTwichStream',
     'DeleteTwichStreamByUserLogin',
     'ParseTwichStream',
+    'ParseTwichStreams',
     'DeleteTwichUser',
     'DeleteTwichUserByLogin',
     'ParseTwichUser',
+    'ParseTwichUsers',
     'C',
 ]
@@ -13,6 +13,11 @@ class ParseTwichGame(Command):
     name: str
 
 
+@dataclass(frozen=True)
+class ParseTwichGames(Command):
+    names: list[str]
+
+
 @dataclass(frozen=True)
 class DeleteTwichGame(Command):
     id: int
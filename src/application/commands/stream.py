@@ -13,6 +13,16 @@ class ParseTwichStream(Command):
     user_login: str
 
 
+@dataclass(frozen=True)
+class ParseTwichStreams(Command):
+    user_logins: list[str]
+
+
+@dataclass(frozen=True)
+class CrawlTwichStreams(Command):
+    game_id: str
+
+
 @dataclass(frozen=True)
 class DeleteTwichStream(Command):
     id: int
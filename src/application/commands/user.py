@@ -13,6 +13,11 @@ class ParseTwichUser(Command):
     login: str
 
 
+@dataclass(frozen=True)
+class ParseTwichUsers(Command):
+    logins: list[str]
+
+
 @dataclass(frozen=True)
 class DeleteTwichUser(Command):
     id: int
@@ -13,7 +13,11 @@ from application.dto.game import (
 )
 from application.dto.stream import (
     TwichStreamDTO,
+    TwichStreamHistoryDTO,
     TwichStreamsDTO,
+    TwichStreamsExportDTO,
+    TwichStreamSnapshotDTO,
+    TwichStreamTagsDTO,
 )
 from application.dto.user import (
     TwichUserDTO,
@@ -31,6 +35,10 @@ __all__: list[str] = [
     'TwichGamesDTO',
     'TwichStreamDTO',
     'TwichStreamsDTO',
+    'TwichStreamsExportDTO',
+    'TwichStreamSnapshotDTO',
+    'TwichStreamHistoryDTO',
+    'TwichStreamTagsDTO',
     'TwichUserDTO',
     'TwichUsersDTO',
     'RD',
@@ -5,7 +5,10 @@ game.py: File, containing twich game dto.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Sequence
+from typing import (
+    Optional,
+    Sequence,
+)
 
 from application.dto.base import DTO
 
@@ -22,3 +25,4 @@ class TwichGameDTO(DTO):
 @dataclass(frozen=True)
 class TwichGamesDTO(DTO):
     data: Sequence[TwichGameDTO]
+    cursor: Optional[str] = None
@@ -5,7 +5,11 @@ stream.py: File, containing twich stream dto.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Sequence
+from typing import (
+    AsyncIterator,
+    Optional,
+    Sequence,
+)
 
 from application.dto.base import DTO
 
@@ -30,3 +34,28 @@ class TwichStreamDTO(DTO):
 @dataclass(frozen=True)
 class TwichStreamsDTO(DTO):
     data: Sequence[TwichStreamDTO]
+    cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TwichStreamsExportDTO(DTO):
+    data: AsyncIterator[TwichStreamDTO]
+
+
+@dataclass(frozen=True)
+class TwichStreamSnapshotDTO(DTO):
+    stream_id: int
+    user_login: str
+    game_id: int
+    viewer_count: int
+    parsed_at: datetime
+
+
+@dataclass(frozen=True)
+class TwichStreamHistoryDTO(DTO):
+    data: Sequence[TwichStreamSnapshotDTO]
+
+
+@dataclass(frozen=True)
+class TwichStreamTagsDTO(DTO):
+    data: dict[str, int]
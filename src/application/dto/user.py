@@ -5,7 +5,10 @@ user.py: File, containing twich user dto.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Sequence
+from typing import (
+    Optional,
+    Sequence,
+)
 
 from application.dto.base import DTO
 
@@ -27,3 +30,4 @@ class TwichUserDTO(DTO):
 @dataclass(frozen=True)
 class TwichUsersDTO(DTO):
     data: Sequence[TwichUserDTO]
+    cursor: Optional[str] = None
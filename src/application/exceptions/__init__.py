@@ -6,6 +6,7 @@ __init__.py: File, containing other exception modules to simplify import.
 from typing import TypeVar
 
 from application.exceptions.application import ApplicationException
+from application.exceptions.invalid_cursor import InvalidCursorException
 from application.exceptions.object_not_found import ObjectNotFoundException
 from application.exceptions.parser import ParserException
 from application.exceptions.twich_get_object_bad_request import TwichGetObjectBadRequestException
@@ -19,6 +20,7 @@ E = TypeVar('E', bound=ApplicationException)
 
 __all__: list[str] = [
     'ApplicationException',
+    'InvalidCursorException',
     'ObjectNotFoundException',
     'ParserException',
     'TwichGetObjectBadRequestException',
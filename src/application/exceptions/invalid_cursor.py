@@ -0,0 +1,13 @@
+"""
+invalid_cursor.py: File, containing invalid cursor exception.
+"""
+
+
+from dataclasses import dataclass
+
+from application.exceptions.application import ApplicationException
+
+
+@dataclass(frozen=True)
+class InvalidCursorException(ApplicationException):
+    pass
@@ -6,34 +6,44 @@ __init__.py: File, containing other command handler modules to simplify import.
 from application.handlers.command.decorators import (
     CommandHandlerDecorator,
     ExceptionHandlingDecorator,
+    SingleFlightDecorator,
 )
 from application.handlers.command.game import (
     DeleteTwichGameByNameHandler,
     DeleteTwichGameHandler,
     ParseTwichGameHandler,
+    ParseTwichGamesHandler,
 )
 from application.handlers.command.stream import (
+    CrawlTwichStreamsHandler,
     DeleteTwichStreamByUserLoginHandler,
     DeleteTwichStreamHandler,
     ParseTwichStreamHandler,
+    ParseTwichStreamsHandler,
 )
 from application.handlers.command.user import (
     DeleteTwichUserByLoginHandler,
     DeleteTwichUserHandler,
     ParseTwichUserHandler,
+    ParseTwichUsersHandler,
 )
 
 
 __all__: list[str] = [
     'CommandHandlerDecorator',
     'ExceptionHandlingDecorator',
+    'SingleFlightDecorator',
     'DeleteTwichGameByNameHandler',
     'DeleteTwichGameHandler',
     'ParseTwichGameHandler',
+    'ParseTwichGamesHandler',
+    'CrawlTwichStreamsHandler',
     'DeleteTwichStreamByUserLoginHandler',
     'DeleteTwichStreamHandler',
     'ParseTwichStreamHandler',
+    'ParseTwichStreamsHandler',
     'DeleteTwichUserByLoginHandler',
     'DeleteTwichUserHandler',
     'ParseTwichUserHandler',
+    'ParseTwichUsersHandler',
 ]
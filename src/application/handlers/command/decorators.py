@@ -3,9 +3,17 @@ decorators.py: File, containing decorators for command handlers.
 """
 
 
+from asyncio import (
+    Task,
+    create_task,
+    shield,
+)
 from typing import Optional
 
-from application.commands import C
+from application.commands import (
+    C,
+    Command,
+)
 from application.dto import ResultDTO
 from application.exceptions import ApplicationException
 from application.interfaces.handler import (
@@ -50,3 +58,29 @@ class ExceptionHandlingDecorator(CommandHandlerDecorator):
         except Exception as exc:
             self.logger.critical(str(exc))
             raise exc
+
+
+class SingleFlightDecorator(CommandHandlerDecorator):
+    def __init__(
+        self,
+        command_handler: ICommandHandler,
+        in_flight_commands: dict[Command, Task],
+    ) -> None:
+        super().__init__(command_handler)
+        self._in_flight_commands: dict[Command, Task] = in_flight_commands
+
+    def _complete(self, command: Command, task: Task) -> None:
+        del self._in_flight_commands[command]
+
+        if not task.cancelled():
+            task.exception()
+
+    async def handle(self, command: C) -> ResultDTO:
+        task: Optional[Task] = self._in_flight_commands.get(command)
+
+        if task is None:
+            task = create_task(super().handle(command))
+            task.add_done_callback(lambda done: self._complete(command, done))
+            self._in_flight_commands[command] = task
+
+        return await shield(task)
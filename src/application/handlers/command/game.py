@@ -7,6 +7,7 @@ from application.commands import (
     DeleteTwichGame,
     DeleteTwichGameByName,
     ParseTwichGame,
+    ParseTwichGames,
 )
 from application.dto import ResultDTO
 from application.interfaces.handler import ICommandHandler
@@ -29,8 +30,11 @@ class ParseTwichGameHandler(ICommandHandler[ParseTwichGame]):
 
     async def handle(self, command: ParseTwichGame) -> ResultDTO:
         game: TwichGame = await self.parser.parse_game(command.name)
-        await self.repository.add_or_update(game)
-        await self.publisher.publish(game.pull_events())
+        content_hashes: dict[int, str] = await self.repository.get_content_hashes([game.id])
+
+        if content_hashes.get(game.id) != game.content_hash:
+            await self.repository.add_or_update(game)
+            await self.publisher.publish(game.pull_events())
 
         return ResultDTO(
             data={'id': game.id},
@@ -39,6 +43,45 @@ class ParseTwichGameHandler(ICommandHandler[ParseTwichGame]):
         )
 
 
+class ParseTwichGamesHandler(ICommandHandler[ParseTwichGames]):
+    def __init__(
+        self,
+        parser: ITwichGameParser,
+        publisher: ITwichGamePublisher,
+        repository: ITwichGameRepository,
+    ) -> None:
+        self.parser: ITwichGameParser = parser
+        self.publisher: ITwichGamePublisher = publisher
+        self.repository: ITwichGameRepository = repository
+
+    async def handle(self, command: ParseTwichGames) -> ResultDTO:
+        games: list[TwichGame] = await self.parser.parse_games(command.names)
+        content_hashes: dict[int, str] = await self.repository.get_content_hashes(
+            [game.id for game in games],
+        )
+        changed_games: list[TwichGame] = [
+            game for game in games if content_hashes.get(game.id) != game.content_hash
+        ]
+        failures: dict[int, str] = await self.repository.add_or_update_many(changed_games)
+        await self.publisher.publish(
+            [
+                event
+                for game in changed_games
+                if game.id not in failures
+                for event in game.pull_events()
+            ]
+        )
+
+        return ResultDTO(
+            data={
+                'ids': [game.id for game in games if game.id not in failures],
+                'failures': failures,
+            },
+            status='OK',
+            description='Command has executed successfully.',
+        )
+
+
 class DeleteTwichGameHandler(ICommandHandler[DeleteTwichGame]):
     def __init__(
         self,
@@ -49,9 +92,8 @@ class DeleteTwichGameHandler(ICommandHandler[DeleteTwichGame]):
         self.repository: ITwichGameRepository = repository
 
     async def handle(self, command: DeleteTwichGame) -> ResultDTO:
-        game: TwichGame = await self.repository.get_by_id(command.id)
+        game: TwichGame = await self.repository.delete_by_id(command.id)
         game.delete()
-        await self.repository.delete(game)
         await self.publisher.publish(game.pull_events())
 
         return ResultDTO(
@@ -71,9 +113,8 @@ class DeleteTwichGameByNameHandler(ICommandHandler[DeleteTwichGameByName]):
         self.repository: ITwichGameRepository = repository
 
     async def handle(self, command: DeleteTwichGameByName) -> ResultDTO:
-        game: TwichGame = await self.repository.get_game_by_name(command.name)
+        game: TwichGame = await self.repository.delete_game_by_name(command.name)
         game.delete()
-        await self.repository.delete(game)
         await self.publisher.publish(game.pull_events())
 
         return ResultDTO(
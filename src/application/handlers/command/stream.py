@@ -4,15 +4,20 @@ stream.py: File, containing command handler for a twich stream.
 
 
 from application.commands import (
+    CrawlTwichStreams,
     DeleteTwichStream,
     DeleteTwichStreamByUserLogin,
     ParseTwichStream,
+    ParseTwichStreams,
 )
 from application.dto import ResultDTO
 from application.interfaces.handler import ICommandHandler
 from application.interfaces.parser import ITwichStreamParser
 from application.interfaces.publisher import ITwichStreamPublisher
-from application.interfaces.repository import ITwichStreamRepository
+from application.interfaces.repository import (
+    ITwichStreamHistoryRepository,
+    ITwichStreamRepository,
+)
 from domain.models import TwichStream
 
 
@@ -22,15 +27,22 @@ class ParseTwichStreamHandler(ICommandHandler[ParseTwichStream]):
         parser: ITwichStreamParser,
         publisher: ITwichStreamPublisher,
         repository: ITwichStreamRepository,
+        history_repository: ITwichStreamHistoryRepository,
     ) -> None:
         self.parser: ITwichStreamParser = parser
         self.publisher: ITwichStreamPublisher = publisher
         self.repository: ITwichStreamRepository = repository
+        self.history_repository: ITwichStreamHistoryRepository = history_repository
 
     async def handle(self, command: ParseTwichStream) -> ResultDTO:
         stream: TwichStream = await self.parser.parse_stream(command.user_login)
-        await self.repository.add_or_update(stream)
-        await self.publisher.publish(stream.pull_events())
+        content_hashes: dict[int, str] = await self.repository.get_content_hashes([stream.id])
+
+        if content_hashes.get(stream.id) != stream.content_hash:
+            await self.repository.add_or_update(stream)
+            await self.publisher.publish(stream.pull_events())
+
+        await self.history_repository.add_many([stream.snapshot()])
 
         return ResultDTO(
             data={'id': stream.id},
@@ -39,6 +51,101 @@ class ParseTwichStreamHandler(ICommandHandler[ParseTwichStream]):
         )
 
 
+class ParseTwichStreamsHandler(ICommandHandler[ParseTwichStreams]):
+    def __init__(
+        self,
+        parser: ITwichStreamParser,
+        publisher: ITwichStreamPublisher,
+        repository: ITwichStreamRepository,
+        history_repository: ITwichStreamHistoryRepository,
+    ) -> None:
+        self.parser: ITwichStreamParser = parser
+        self.publisher: ITwichStreamPublisher = publisher
+        self.repository: ITwichStreamRepository = repository
+        self.history_repository: ITwichStreamHistoryRepository = history_repository
+
+    async def handle(self, command: ParseTwichStreams) -> ResultDTO:
+        streams: list[TwichStream] = await self.parser.parse_streams(command.user_logins)
+        content_hashes: dict[int, str] = await self.repository.get_content_hashes(
+            [stream.id for stream in streams],
+        )
+        changed_streams: list[TwichStream] = [
+            stream for stream in streams if content_hashes.get(stream.id) != stream.content_hash
+        ]
+        failures: dict[int, str] = await self.repository.add_or_update_many(changed_streams)
+        await self.publisher.publish(
+            [
+                event
+                for stream in changed_streams
+                if stream.id not in failures
+                for event in stream.pull_events()
+            ]
+        )
+        await self.history_repository.add_many(
+            [stream.snapshot() for stream in streams if stream.id not in failures],
+        )
+
+        return ResultDTO(
+            data={
+                'ids': [stream.id for stream in streams if stream.id not in failures],
+                'failures': failures,
+            },
+            status='OK',
+            description='Command has executed successfully.',
+        )
+
+
+class CrawlTwichStreamsHandler(ICommandHandler[CrawlTwichStreams]):
+    def __init__(
+        self,
+        parser: ITwichStreamParser,
+        publisher: ITwichStreamPublisher,
+        repository: ITwichStreamRepository,
+        history_repository: ITwichStreamHistoryRepository,
+    ) -> None:
+        self.parser: ITwichStreamParser = parser
+        self.publisher: ITwichStreamPublisher = publisher
+        self.repository: ITwichStreamRepository = repository
+        self.history_repository: ITwichStreamHistoryRepository = history_repository
+
+    async def handle(self, command: CrawlTwichStreams) -> ResultDTO:
+        ids: list[int] = []
+        failures: dict[int, str] = {}
+
+        async for streams in self.parser.crawl_streams(command.game_id):
+            content_hashes: dict[int, str] = await self.repository.get_content_hashes(
+                [stream.id for stream in streams],
+            )
+            changed_streams: list[TwichStream] = [
+                stream for stream in streams if content_hashes.get(stream.id) != stream.content_hash
+            ]
+            batch_failures: dict[int, str] = await self.repository.add_or_update_many(
+                changed_streams,
+            )
+            await self.publisher.publish(
+                [
+                    event
+                    for stream in changed_streams
+                    if stream.id not in batch_failures
+                    for event in stream.pull_events()
+                ]
+            )
+            await self.history_repository.add_many(
+                [stream.snapshot() for stream in streams if stream.id not in batch_failures],
+            )
+            ids.extend(stream.id for stream in streams if stream.id not in batch_failures)
+            failures.update(batch_failures)
+
+        return ResultDTO(
+            data={
+                'ids': ids,
+                'failures': failures,
+            },
+            status='OK',
+            description='Command has executed successfully.',
+        )
+
+
 class DeleteTwichStreamHandler(ICommandHandler[DeleteTwichStream]):
     def __init__(
         self,
@@ -49,9 +156,8 @@ class DeleteTwichStreamHandler(ICommandHandler[DeleteTwichStream]):
         self.repository: ITwichStreamRepository = repository
 
     async def handle(self, command: DeleteTwichStream) -> ResultDTO:
-        stream: TwichStream = await self.repository.get_by_id(command.id)
+        stream: TwichStream = await self.repository.delete_by_id(command.id)
         stream.delete()
-        await self.repository.delete(stream)
         await self.publisher.publish(stream.pull_events())
 
         return ResultDTO(
@@ -71,9 +177,8 @@ class DeleteTwichStreamByUserLoginHandler(ICommandHandler[DeleteTwichStreamByUse
         self.repository: ITwichStreamRepository = repository
 
     async def handle(self, command: DeleteTwichStreamByUserLogin) -> ResultDTO:
-        stream: TwichStream = await self.repository.get_stream_by_user_login(command.user_login)
+        stream: TwichStream = await self.repository.delete_stream_by_user_login(command.user_login)
         stream.delete()
-        await self.repository.delete(stream)
         await self.publisher.publish(stream.pull_events())
 
         return ResultDTO(
@@ -7,6 +7,7 @@ from application.commands import (
     DeleteTwichUser,
     DeleteTwichUserByLogin,
     ParseTwichUser,
+    ParseTwichUsers,
 )
 from application.dto import ResultDTO
 from application.interfaces.handler import ICommandHandler
@@ -29,8 +30,11 @@ class ParseTwichUserHandler(ICommandHandler[ParseTwichUser]):
 
     async def handle(self, command: ParseTwichUser) -> ResultDTO:
         user: TwichUser = await self.parser.parse_user(command.login)
-        await self.repository.add_or_update(user)
-        await self.publisher.publish(user.pull_events())
+        content_hashes: dict[int, str] = await self.repository.get_content_hashes([user.id])
+
+        if content_hashes.get(user.id) != user.content_hash:
+            await self.repository.add_or_update(user)
+            await self.publisher.publish(user.pull_events())
 
         return ResultDTO(
             data={'id': user.id},
@@ -39,6 +43,45 @@ class ParseTwichUserHandler(ICommandHandler[ParseTwichUser]):
         )
 
 
+class ParseTwichUsersHandler(ICommandHandler[ParseTwichUsers]):
+    def __init__(
+        self,
+        parser: ITwichUserParser,
+        publisher: ITwichUserPublisher,
+        repository: ITwichUserRepository,
+    ) -> None:
+        self.parser: ITwichUserParser = parser
+        self.publisher: ITwichUserPublisher = publisher
+        self.repository: ITwichUserRepository = repository
+
+    async def handle(self, command: ParseTwichUsers) -> ResultDTO:
+        users: list[TwichUser] = await self.parser.parse_users(command.logins)
+        content_hashes: dict[int, str] = await self.repository.get_content_hashes(
+            [user.id for user in users],
+        )
+        changed_users: list[TwichUser] = [
+            user for user in users if content_hashes.get(user.id) != user.content_hash
+        ]
+        failures: dict[int, str] = await self.repository.add_or_update_many(changed_users)
+        await self.publisher.publish(
+            [
+                event
+                for user in changed_users
+                if user.id not in failures
+                for event in user.pull_events()
+            ]
+        )
+
+        return ResultDTO(
+            data={
+                'ids': [user.id for user in users if user.id not in failures],
+                'failures': failures,
+            },
+            status='OK',
+            description='Command has executed successfully.',
+        )
+
+
 class DeleteTwichUserHandler(ICommandHandler[DeleteTwichUser]):
     def __init__(
         self,
@@ -49,9 +92,8 @@ class DeleteTwichUserHandler(ICommandHandler[DeleteTwichUser]):
         self.repository: ITwichUserRepository = repository
 
     async def handle(self, command: DeleteTwichUser) -> ResultDTO:
-        user: TwichUser = await self.repository.get_by_id(command.id)
+        user: TwichUser = await self.repository.delete_by_id(command.id)
         user.delete()
-        await self.repository.delete(user)
         await self.publisher.publish(user.pull_events())
 
         return ResultDTO(
@@ -71,9 +113,8 @@ class DeleteTwichUserByLoginHandler(ICommandHandler[DeleteTwichUserByLogin]):
         self.repository: ITwichUserRepository = repository
 
     async def handle(self, command: DeleteTwichUserByLogin) -> ResultDTO:
-        user: TwichUser = await self.repository.get_user_by_login(command.login)
+        user: TwichUser = await self.repository.delete_user_by_login(command.login)
         user.delete()
-        await self.repository.delete(user)
         await self.publisher.publish(user.pull_events())
 
         return ResultDTO(
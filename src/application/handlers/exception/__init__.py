@@ -3,6 +3,7 @@ __init__.py: File, containing other exception handler modules to simplify import
 """
 
 
+from application.handlers.exception.invalid_cursor import InvalidCursorExceptionHandler
 from application.handlers.exception.object_not_found import ObjectNotFoundExceptionHandler
 from application.handlers.exception.parser import ParserExceptionHandler
 from application.handlers.exception.twich_get_object_bad_request import (
@@ -18,6 +19,7 @@ from application.handlers.exception.twich_token_not_obtained import (
 
 
 __all__: list[str] = [
+    'InvalidCursorExceptionHandler',
     'ObjectNotFoundExceptionHandler',
     'ParserExceptionHandler',
     'TwichGetObjectBadRequestExceptionHandler',
@@ -0,0 +1,17 @@
+"""
+invalid_cursor.py: File, containing invalid cursor exception handler.
+"""
+
+
+from application.exceptions import InvalidCursorException
+from application.interfaces.handler import IExceptionHandler
+from shared.interfaces import ILogger
+
+
+class InvalidCursorExceptionHandler(IExceptionHandler[InvalidCursorException]):
+    def __init__(self, logger: ILogger) -> None:
+        self.logger: ILogger = logger
+
+    async def handle(self, exception: InvalidCursorException) -> None:
+        self.logger.info(exception.message)
+        raise exception
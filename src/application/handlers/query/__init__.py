@@ -13,9 +13,12 @@ from application.handlers.query.game import (
     GetTwichGameHandler,
 )
 from application.handlers.query.stream import (
+    ExportTwichStreamsHandler,
     GetAllTwichStreamsHandler,
     GetTwichStreamByUserLoginHandler,
     GetTwichStreamHandler,
+    GetTwichStreamHistoryHandler,
+    GetTwichStreamTagsHandler,
 )
 from application.handlers.query.user import (
     GetAllTwichUsersHandler,
@@ -30,9 +33,12 @@ __all__: list[str] = [
     'GetAllTwichGamesHandler',
     'GetTwichGameByNameHandler',
     'GetTwichGameHandler',
+    'ExportTwichStreamsHandler',
     'GetAllTwichStreamsHandler',
     'GetTwichStreamByUserLoginHandler',
     'GetTwichStreamHandler',
+    'GetTwichStreamHistoryHandler',
+    'GetTwichStreamTagsHandler',
     'GetAllTwichUsersHandler',
     'GetTwichUserByLoginHandler',
     'GetTwichUserHandler',
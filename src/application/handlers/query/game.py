@@ -3,7 +3,10 @@ game.py: File, containing twich game query handlers.
 """
 
 
-from dataclasses import asdict
+from typing import (
+    Callable,
+    Optional,
+)
 
 from application.dto import (
     TwichGameDTO,
@@ -17,6 +20,7 @@ from application.queries import (
     GetTwichGameByName,
 )
 from domain.models import TwichGame
+from shared.utils import compile_mapper
 
 
 class GetTwichGameHandler(IQueryHandler[GetTwichGame, TwichGameDTO]):
@@ -25,11 +29,12 @@ class GetTwichGameHandler(IQueryHandler[GetTwichGame, TwichGameDTO]):
         repository: ITwichGameRepository,
     ) -> None:
         self.repository: ITwichGameRepository = repository
+        self.to_dto: Callable[[TwichGame], TwichGameDTO] = compile_mapper(TwichGameDTO)
 
     async def handle(self, query: GetTwichGame) -> TwichGameDTO:
         game: TwichGame = await self.repository.get_by_id(query.id)
 
-        return TwichGameDTO(**asdict(game, dict_factory=TwichGame.dict))
+        return self.to_dto(game)
 
 
 class GetTwichGameByNameHandler(IQueryHandler[GetTwichGameByName, TwichGameDTO]):
@@ -38,11 +43,12 @@ class GetTwichGameByNameHandler(IQueryHandler[GetTwichGameByName, TwichGameDTO])
         repository: ITwichGameRepository,
     ) -> None:
         self.repository: ITwichGameRepository = repository
+        self.to_dto: Callable[[TwichGame], TwichGameDTO] = compile_mapper(TwichGameDTO)
 
     async def handle(self, query: GetTwichGameByName) -> TwichGameDTO:
         game: TwichGame = await self.repository.get_game_by_name(query.name)
 
-        return TwichGameDTO(**asdict(game, dict_factory=TwichGame.dict))
+        return self.to_dto(game)
 
 
 class GetAllTwichGamesHandler(IQueryHandler[GetAllTwichGames, TwichGamesDTO]):
@@ -51,10 +57,17 @@ class GetAllTwichGamesHandler(IQueryHandler[GetAllTwichGames, TwichGamesDTO]):
         repository: ITwichGameRepository,
     ) -> None:
         self.repository: ITwichGameRepository = repository
+        self.to_dto: Callable[[TwichGame], TwichGameDTO] = compile_mapper(TwichGameDTO)
 
     async def handle(self, query: GetAllTwichGames) -> TwichGamesDTO:
-        games: list[TwichGame] = await self.repository.all()
+        fields: Optional[list[str]] = None
+
+        if query.fields:
+            fields = [field for field in query.fields if field in TwichGameDTO.__dataclass_fields__]
+
+        games, cursor = await self.repository.paginate(query.limit, query.cursor, fields)
 
         return TwichGamesDTO(
-            [TwichGameDTO(**asdict(game, dict_factory=TwichGame.dict)) for game in games]
+            data=[self.to_dto(game) for game in games],
+            cursor=cursor,
         )
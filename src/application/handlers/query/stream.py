@@ -3,20 +3,38 @@ stream.py: File, containing twich stream query handlers.
 """
 
 
-from dataclasses import asdict
+from typing import (
+    AsyncIterator,
+    Callable,
+    Optional,
+)
 
 from application.dto import (
     TwichStreamDTO,
+    TwichStreamHistoryDTO,
     TwichStreamsDTO,
+    TwichStreamsExportDTO,
+    TwichStreamSnapshotDTO,
+    TwichStreamTagsDTO,
 )
 from application.interfaces.handler import IQueryHandler
-from application.interfaces.repository import ITwichStreamRepository
+from application.interfaces.repository import (
+    ITwichStreamHistoryRepository,
+    ITwichStreamRepository,
+)
 from application.queries import (
+    ExportTwichStreams,
     GetAllTwichStreams,
     GetTwichStream,
     GetTwichStreamByUserLogin,
+    GetTwichStreamHistory,
+    GetTwichStreamTags,
+)
+from domain.models import (
+    TwichStream,
+    TwichStreamSnapshot,
 )
-from domain.models import TwichStream
+from shared.utils import compile_mapper
 
 
 class GetTwichStreamHandler(IQueryHandler[GetTwichStream, TwichStreamDTO]):
@@ -25,11 +43,12 @@ class GetTwichStreamHandler(IQueryHandler[GetTwichStream, TwichStreamDTO]):
         repository: ITwichStreamRepository,
     ) -> None:
         self.repository: ITwichStreamRepository = repository
+        self.to_dto: Callable[[TwichStream], TwichStreamDTO] = compile_mapper(TwichStreamDTO)
 
     async def handle(self, query: GetTwichStream) -> TwichStreamDTO:
         stream: TwichStream = await self.repository.get_by_id(query.id)
 
-        return TwichStreamDTO(**asdict(stream, dict_factory=TwichStream.dict))
+        return self.to_dto(stream)
 
 
 class GetTwichStreamByUserLoginHandler(IQueryHandler[GetTwichStreamByUserLogin, TwichStreamDTO]):
@@ -38,11 +57,12 @@ class GetTwichStreamByUserLoginHandler(IQueryHandler[GetTwichStreamByUserLogin,
         repository: ITwichStreamRepository,
     ) -> None:
         self.repository: ITwichStreamRepository = repository
+        self.to_dto: Callable[[TwichStream], TwichStreamDTO] = compile_mapper(TwichStreamDTO)
 
     async def handle(self, query: GetTwichStreamByUserLogin) -> TwichStreamDTO:
         stream: TwichStream = await self.repository.get_stream_by_user_login(query.user_login)
 
-        return TwichStreamDTO(**asdict(stream, dict_factory=TwichStream.dict))
+        return self.to_dto(stream)
 
 
 class GetAllTwichStreamsHandler(IQueryHandler[GetAllTwichStreams, TwichStreamsDTO]):
@@ -51,10 +71,84 @@ class GetAllTwichStreamsHandler(IQueryHandler[GetAllTwichStreams, TwichStreamsDT
         repository: ITwichStreamRepository,
     ) -> None:
         self.repository: ITwichStreamRepository = repository
+        self.to_dto: Callable[[TwichStream], TwichStreamDTO] = compile_mapper(TwichStreamDTO)
 
     async def handle(self, query: GetAllTwichStreams) -> TwichStreamsDTO:
-        streams: list[TwichStream] = await self.repository.all()
+        fields: Optional[list[str]] = None
+
+        if query.fields:
+            fields = [
+                field for field in query.fields if field in TwichStreamDTO.__dataclass_fields__
+            ]
+
+        streams, cursor = await self.repository.paginate(
+            query.limit,
+            query.cursor,
+            fields,
+            query.tags,
+        )
 
         return TwichStreamsDTO(
-            [TwichStreamDTO(**asdict(stream, dict_factory=TwichStream.dict)) for stream in streams]
+            data=[self.to_dto(stream) for stream in streams],
+            cursor=cursor,
+        )
+
+
+class ExportTwichStreamsHandler(IQueryHandler[ExportTwichStreams, TwichStreamsExportDTO]):
+    def __init__(
+        self,
+        repository: ITwichStreamRepository,
+    ) -> None:
+        self.repository: ITwichStreamRepository = repository
+        self.to_dto: Callable[[TwichStream], TwichStreamDTO] = compile_mapper(TwichStreamDTO)
+
+    async def _export(self, streams: AsyncIterator[TwichStream]) -> AsyncIterator[TwichStreamDTO]:
+        async for stream in streams:
+            yield self.to_dto(stream)
+
+    async def handle(self, query: ExportTwichStreams) -> TwichStreamsExportDTO:
+        fields: Optional[list[str]] = None
+
+        if query.fields:
+            fields = [
+                field for field in query.fields if field in TwichStreamDTO.__dataclass_fields__
+            ]
+
+        return TwichStreamsExportDTO(
+            data=self._export(self.repository.all(query.page_size, fields)),
+        )
+
+
+class GetTwichStreamTagsHandler(IQueryHandler[GetTwichStreamTags, TwichStreamTagsDTO]):
+    def __init__(
+        self,
+        repository: ITwichStreamRepository,
+    ) -> None:
+        self.repository: ITwichStreamRepository = repository
+
+    async def handle(self, query: GetTwichStreamTags) -> TwichStreamTagsDTO:
+        tag_counts: dict[str, int] = await self.repository.get_tag_counts(query.size)
+
+        return TwichStreamTagsDTO(data=tag_counts)
+
+
+class GetTwichStreamHistoryHandler(IQueryHandler[GetTwichStreamHistory, TwichStreamHistoryDTO]):
+    def __init__(
+        self,
+        repository: ITwichStreamHistoryRepository,
+    ) -> None:
+        self.repository: ITwichStreamHistoryRepository = repository
+        self.to_dto: Callable[[TwichStreamSnapshot], TwichStreamSnapshotDTO] = compile_mapper(
+            TwichStreamSnapshotDTO,
+        )
+
+    async def handle(self, query: GetTwichStreamHistory) -> TwichStreamHistoryDTO:
+        snapshots: list[TwichStreamSnapshot] = await self.repository.get_history(
+            query.id,
+            query.start,
+            query.end,
+        )
+
+        return TwichStreamHistoryDTO(
+            data=[self.to_dto(snapshot) for snapshot in snapshots],
         )
@@ -3,7 +3,10 @@ user.py: File, containing twich user query handlers.
 """
 
 
-from dataclasses import asdict
+from typing import (
+    Callable,
+    Optional,
+)
 
 from application.dto import (
     TwichUserDTO,
@@ -17,6 +20,7 @@ from application.queries import (
     GetTwichUserByLogin,
 )
 from domain.models import TwichUser
+from shared.utils import compile_mapper
 
 
 class GetTwichUserHandler(IQueryHandler[GetTwichUser, TwichUserDTO]):
@@ -25,11 +29,12 @@ class GetTwichUserHandler(IQueryHandler[GetTwichUser, TwichUserDTO]):
         repository: ITwichUserRepository,
     ) -> None:
         self.repository: ITwichUserRepository = repository
+        self.to_dto: Callable[[TwichUser], TwichUserDTO] = compile_mapper(TwichUserDTO)
 
     async def handle(self, query: GetTwichUser) -> TwichUserDTO:
         user: TwichUser = await self.repository.get_by_id(query.id)
 
-        return TwichUserDTO(**asdict(user, dict_factory=TwichUser.dict))
+        return self.to_dto(user)
 
 
 class GetTwichUserByLoginHandler(IQueryHandler[GetTwichUserByLogin, TwichUserDTO]):
@@ -38,11 +43,12 @@ class GetTwichUserByLoginHandler(IQueryHandler[GetTwichUserByLogin, TwichUserDTO
         repository: ITwichUserRepository,
     ) -> None:
         self.repository: ITwichUserRepository = repository
+        self.to_dto: Callable[[TwichUser], TwichUserDTO] = compile_mapper(TwichUserDTO)
 
     async def handle(self, query: GetTwichUserByLogin) -> TwichUserDTO:
         user: TwichUser = await self.repository.get_user_by_login(query.login)
 
-        return TwichUserDTO(**asdict(user, dict_factory=TwichUser.dict))
+        return self.to_dto(user)
 
 
 class GetAllTwichUsersHandler(IQueryHandler[GetAllTwichUsers, TwichUsersDTO]):
@@ -51,10 +57,17 @@ class GetAllTwichUsersHandler(IQueryHandler[GetAllTwichUsers, TwichUsersDTO]):
         repository: ITwichUserRepository,
     ) -> None:
         self.repository: ITwichUserRepository = repository
+        self.to_dto: Callable[[TwichUser], TwichUserDTO] = compile_mapper(TwichUserDTO)
 
     async def handle(self, query: GetAllTwichUsers) -> TwichUsersDTO:
-        users: list[TwichUser] = await self.repository.all()
+        fields: Optional[list[str]] = None
+
+        if query.fields:
+            fields = [field for field in query.fields if field in TwichUserDTO.__dataclass_fields__]
+
+        users, cursor = await self.repository.paginate(query.limit, query.cursor, fields)
 
         return TwichUsersDTO(
-            [TwichUserDTO(**asdict(user, dict_factory=TwichUser.dict)) for user in users]
+            data=[self.to_dto(user) for user in users],
+            cursor=cursor,
         )
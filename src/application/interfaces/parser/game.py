@@ -13,3 +13,7 @@ class ITwichGameParser(IParser):
     @abstractmethod
     async def parse_game(self, name: str) -> TwichGame:
         raise NotImplementedError
+
+    @abstractmethod
+    async def parse_games(self, names: list[str]) -> list[TwichGame]:
+        raise NotImplementedError
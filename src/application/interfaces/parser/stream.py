@@ -4,6 +4,7 @@ stream.py: File, containing parser interface for a twich stream.
 
 
 from abc import abstractmethod
+from typing import AsyncIterator
 
 from application.interfaces.parser.base import IParser
 from domain.models import TwichStream
@@ -13,3 +14,11 @@ class ITwichStreamParser(IParser):
     @abstractmethod
     async def parse_stream(self, user_login: str) -> TwichStream:
         raise NotImplementedError
+
+    @abstractmethod
+    async def parse_streams(self, user_logins: list[str]) -> list[TwichStream]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def crawl_streams(self, game_id: str) -> AsyncIterator[list[TwichStream]]:
+        raise NotImplementedError
@@ -13,3 +13,7 @@ class ITwichUserParser(IParser):
     @abstractmethod
     async def parse_user(self, login: str) -> TwichUser:
         raise NotImplementedError
+
+    @abstractmethod
+    async def parse_users(self, logins: list[str]) -> list[TwichUser]:
+        raise NotImplementedError
@@ -5,7 +5,10 @@ __init__.py: File, containing other repository interface modules to simplify imp
 
 from application.interfaces.repository.base import IRepository
 from application.interfaces.repository.game import ITwichGameRepository
-from application.interfaces.repository.stream import ITwichStreamRepository
+from application.interfaces.repository.stream import (
+    ITwichStreamHistoryRepository,
+    ITwichStreamRepository,
+)
 from application.interfaces.repository.user import ITwichUserRepository
 
 
@@ -13,5 +16,6 @@ __all__: list[str] = [
     'IRepository',
     'ITwichGameRepository',
     'ITwichStreamRepository',
+    'ITwichStreamHistoryRepository',
     'ITwichUserRepository',
 ]
@@ -7,7 +7,11 @@ from abc import (
     ABC as Interface,
     abstractmethod,
 )
-from typing import Generic
+from typing import (
+    AsyncIterator,
+    Generic,
+    Optional,
+)
 
 from domain.models import DM
 
@@ -17,14 +21,43 @@ class IRepository(Interface, Generic[DM]):
     async def add_or_update(self, instance: DM) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_or_update_many(self, instances: list[DM]) -> dict[int, str]:
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, instance: DM) -> None:
         raise NotImplementedError
 
     @abstractmethod
-    async def all(self) -> list[DM]:
+    async def delete_by_id(self, id: int) -> DM:
+        raise NotImplementedError
+
+    @abstractmethod
+    def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[DM]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[DM], Optional[str]]:
         raise NotImplementedError
 
     @abstractmethod
     async def get_by_id(self, id: int) -> DM:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(self, ids: list[int]) -> list[DM]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        raise NotImplementedError
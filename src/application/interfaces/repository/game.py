@@ -13,3 +13,7 @@ class ITwichGameRepository(IRepository[TwichGame]):
     @abstractmethod
     async def get_game_by_name(self, name: str) -> TwichGame:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_game_by_name(self, name: str) -> TwichGame:
+        raise NotImplementedError
@@ -3,13 +3,54 @@ stream.py: File, containing repository interface for a twich stream.
 """
 
 
-from abc import abstractmethod
+from abc import (
+    ABC as Interface,
+    abstractmethod,
+)
+from datetime import datetime
+from typing import Optional
 
 from application.interfaces.repository.base import IRepository
-from domain.models import TwichStream
+from domain.models import (
+    TwichStream,
+    TwichStreamSnapshot,
+)
 
 
 class ITwichStreamRepository(IRepository[TwichStream]):
+    @abstractmethod
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+    ) -> tuple[list[TwichStream], Optional[str]]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_stream_by_user_login(self, user_login: str) -> TwichStream:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_stream_by_user_login(self, user_login: str) -> TwichStream:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_tag_counts(self, size: int) -> dict[str, int]:
+        raise NotImplementedError
+
+
+class ITwichStreamHistoryRepository(Interface):
+    @abstractmethod
+    async def add_many(self, snapshots: list[TwichStreamSnapshot]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_history(
+        self,
+        stream_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list[TwichStreamSnapshot]:
+        raise NotImplementedError
@@ -13,3 +13,7 @@ class ITwichUserRepository(IRepository[TwichUser]):
     @abstractmethod
     async def get_user_by_login(self, login: str) -> TwichUser:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_user_by_login(self, login: str) -> TwichUser:
+        raise NotImplementedError
@@ -12,9 +12,12 @@ from application.queries.game import (
     GetTwichGameByName,
 )
 from application.queries.stream import (
+    ExportTwichStreams,
     GetAllTwichStreams,
     GetTwichStream,
     GetTwichStreamByUserLogin,
+    GetTwichStreamHistory,
+    GetTwichStreamTags,
 )
 from application.queries.user import (
     GetAllTwichUsers,
@@ -31,9 +34,12 @@ __all__: list[str] = [
     'GetAllTwichGames',
     'GetTwichGame',
     'GetTwichGameByName',
+    'ExportTwichStreams',
     'GetAllTwichStreams',
     'GetTwichStream',
     'GetTwichStreamByUserLogin',
+    'GetTwichStreamHistory',
+    'GetTwichStreamTags',
     'GetAllTwichUsers',
     'GetTwichUser',
     'GetTwichUserByLogin',
@@ -4,6 +4,7 @@ game.py: File, containing twich game queries.
 
 
 from dataclasses import dataclass
+from typing import Optional
 
 from application.queries.base import Query
 
@@ -20,4 +21,6 @@ class GetTwichGameByName(Query):
 
 @dataclass(frozen=True)
 class GetAllTwichGames(Query):
-    pass
+    limit: int = 100
+    cursor: Optional[str] = None
+    fields: Optional[list[str]] = None
@@ -4,6 +4,8 @@ game.py: File, containing twich stream queries.
 
 
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
 
 from application.queries.base import Query
 
@@ -20,4 +22,25 @@ class GetTwichStreamByUserLogin(Query):
 
 @dataclass(frozen=True)
 class GetAllTwichStreams(Query):
-    pass
+    limit: int = 100
+    cursor: Optional[str] = None
+    fields: Optional[list[str]] = None
+    tags: Optional[list[str]] = None
+
+
+@dataclass(frozen=True)
+class ExportTwichStreams(Query):
+    page_size: int = 1000
+    fields: Optional[list[str]] = None
+
+
+@dataclass(frozen=True)
+class GetTwichStreamTags(Query):
+    size: int = 10
+
+
+@dataclass(frozen=True)
+class GetTwichStreamHistory(Query):
+    id: int
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
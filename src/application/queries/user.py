@@ -4,6 +4,7 @@ user.py: File, containing twich user queries.
 
 
 from dataclasses import dataclass
+from typing import Optional
 
 from application.queries.base import Query
 
@@ -20,4 +21,6 @@ class GetTwichUserByLogin(Query):
 
 @dataclass(frozen=True)
 class GetAllTwichUsers(Query):
-    pass
+    limit: int = 100
+    cursor: Optional[str] = None
+    fields: Optional[list[str]] = None
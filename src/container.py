@@ -12,11 +12,14 @@ from dependency_injector.providers import (
     Dependency,
     Dict,
     Factory,
+    Object,
     Resource,
+    Selector,
     Singleton,
 )
 
 from application.commands import (
+    CrawlTwichStreams,
     DeleteTwichGame,
     DeleteTwichGameByName,
     DeleteTwichStream,
@@ -24,10 +27,14 @@ from application.commands import (
     DeleteTwichUser,
     DeleteTwichUserByLogin,
     ParseTwichGame,
+    ParseTwichGames,
     ParseTwichStream,
+    ParseTwichStreams,
     ParseTwichUser,
+    ParseTwichUsers,
 )
 from application.exceptions import (
+    InvalidCursorException,
     ObjectNotFoundException,
     ParserException,
     TwichGetObjectBadRequestException,
@@ -36,6 +43,7 @@ from application.exceptions import (
     TwichTokenNotObtainedException,
 )
 from application.handlers.command import (
+    CrawlTwichStreamsHandler,
     DeleteTwichGameByNameHandler,
     DeleteTwichGameHandler,
     DeleteTwichStreamByUserLoginHandler,
@@ -44,10 +52,15 @@ from application.handlers.command import (
     DeleteTwichUserHandler,
     ExceptionHandlingDecorator as CExceptionHandlingDecorator,
     ParseTwichGameHandler,
+    ParseTwichGamesHandler,
     ParseTwichStreamHandler,
+    ParseTwichStreamsHandler,
     ParseTwichUserHandler,
+    ParseTwichUsersHandler,
+    SingleFlightDecorator,
 )
 from application.handlers.exception import (
+    InvalidCursorExceptionHandler,
     ObjectNotFoundExceptionHandler,
     ParserExceptionHandler,
     TwichGetObjectBadRequestExceptionHandler,
@@ -57,6 +70,7 @@ from application.handlers.exception import (
 )
 from application.handlers.query import (
     ExceptionHandlingDecorator as QExceptionHandlingDecorator,
+    ExportTwichStreamsHandler,
     GetAllTwichGamesHandler,
     GetAllTwichStreamsHandler,
     GetAllTwichUsersHandler,
@@ -64,10 +78,13 @@ from application.handlers.query import (
     GetTwichGameHandler,
     GetTwichStreamByUserLoginHandler,
     GetTwichStreamHandler,
+    GetTwichStreamHistoryHandler,
+    GetTwichStreamTagsHandler,
     GetTwichUserByLoginHandler,
     GetTwichUserHandler,
 )
 from application.queries import (
+    ExportTwichStreams,
     GetAllTwichGames,
     GetAllTwichStreams,
     GetAllTwichUsers,
@@ -75,6 +92,8 @@ from application.queries import (
     GetTwichGameByName,
     GetTwichStream,
     GetTwichStreamByUserLogin,
+    GetTwichStreamHistory,
+    GetTwichStreamTags,
     GetTwichUser,
     GetTwichUserByLogin,
 )
@@ -86,15 +105,46 @@ from infrastructure.parsers.aiohttp import (
     TwichStreamParser,
     TwichUserParser,
 )
-from infrastructure.parsers.aiohttp.dependencies import get_twich_api_token
+from infrastructure.parsers.aiohttp.dependencies import (
+    TwichCircuitBreaker,
+    TwichLatencyHistogram,
+    TwichRequestHedger,
+    TwichRequestScheduler,
+    get_twich_api_token,
+    get_twich_client_session,
+)
+from infrastructure.persistence.connections.elastic.async_database import (
+    get_elastic_async_database,
+)
 from infrastructure.persistence.connections.elastic.database import ElasticSearchDatabase
 from infrastructure.persistence.connections.mongo.database import MongoDatabase
+from infrastructure.persistence.connections.mongo.motor import MongoMotorDatabase
+from infrastructure.persistence.migrations.elastic import migrate_indices
+from infrastructure.persistence.migrations.mongo import ensure_indexes
 from infrastructure.persistence.repositories.elastic.game import TwichGameElasticRepository
 from infrastructure.persistence.repositories.elastic.stream import TwichStreamElasticRepository
 from infrastructure.persistence.repositories.elastic.user import TwichUserElasticRepository
+from infrastructure.persistence.repositories.elastic_async.game import (
+    TwichGameAsyncElasticRepository,
+)
+from infrastructure.persistence.repositories.elastic_async.stream import (
+    TwichStreamAsyncElasticRepository,
+)
+from infrastructure.persistence.repositories.elastic_async.user import (
+    TwichUserAsyncElasticRepository,
+)
 from infrastructure.persistence.repositories.mongo.game import TwichGameMongoRepository
-from infrastructure.persistence.repositories.mongo.stream import TwichStreamMongoRepository
+from infrastructure.persistence.repositories.mongo.stream import (
+    TwichStreamHistoryMongoRepository,
+    TwichStreamMongoRepository,
+)
 from infrastructure.persistence.repositories.mongo.user import TwichUserMongoRepository
+from infrastructure.persistence.repositories.motor.game import TwichGameMotorRepository
+from infrastructure.persistence.repositories.motor.stream import (
+    TwichStreamHistoryMotorRepository,
+    TwichStreamMotorRepository,
+)
+from infrastructure.persistence.repositories.motor.user import TwichUserMotorRepository
 from infrastructure.publishers.connections.kafka.producer import KafkaProducerConnection
 from infrastructure.publishers.kafka.game import TwichGameKafkaPublisher
 from infrastructure.publishers.kafka.stream import TwichStreamKafkaPublisher
@@ -103,12 +153,14 @@ from presentation.api.rest.v1.controllers import (
     ControllerExceptionHandlingDecorator,
     TwichGameCommandController,
     TwichGameQueryController,
+    TwichMetricsController,
     TwichStreamCommandController,
     TwichStreamQueryController,
     TwichUserCommandController,
     TwichUserQueryController,
 )
 from presentation.api.rest.v1.handlers.exception import (
+    InvalidCursorExceptionHandler as RestInvalidCursorExceptionHandler,
     ObjectNotFoundExceptionHandler as RestObjectNotFoundExceptionHandler,
     ParserExceptionHandler as RestParserExceptionHandler,
     TwichGetObjectBadRequestExceptionHandler as RestTwichGetObjectBadRequestExceptionHandler,
@@ -125,11 +177,18 @@ from shared.config import settings
 class TwichGameContainer(DeclarativeContainer):
     # ---------------- change ------------------------
 
+    twich_client_session: Dependency = Dependency()
     twich_api_token: Dependency = Dependency()
+    twich_request_scheduler: Dependency = Dependency()
+    twich_circuit_breaker: Dependency = Dependency()
+    twich_request_hedger: Dependency = Dependency()
     kafka_producer: Dependency = Dependency()
     mongo: Dependency = Dependency()
+    mongo_motor: Dependency = Dependency()
     elastic: Dependency = Dependency()
+    elastic_async: Dependency = Dependency()
     logger: Dependency = Dependency()
+    in_flight_commands: Dependency = Dependency()
     command_exception_handlers: Dependency = Dependency()
     query_exception_handlers: Dependency = Dependency()
     rest_v1_controller_exception_handlers: Dependency = Dependency()
@@ -141,14 +200,28 @@ class TwichGameContainer(DeclarativeContainer):
 
     # -------------- end change ----------------------
 
-    game_command_repository: Factory = Factory(
-        TwichGameMongoRepository,
-        db=mongo,
+    game_command_repository: Selector = Selector(
+        Object(settings.DB_MONGO_DRIVER),
+        mongoengine=Factory(
+            TwichGameMongoRepository,
+            db=mongo,
+        ),
+        motor=Factory(
+            TwichGameMotorRepository,
+            db=mongo_motor,
+        ),
     )
 
-    game_query_repository: Factory = Factory(
-        TwichGameElasticRepository,
-        db=elastic,
+    game_query_repository: Selector = Selector(
+        Object(settings.ELASTIC_DRIVER),
+        elasticsearch_dsl=Factory(
+            TwichGameElasticRepository,
+            db=elastic,
+        ),
+        elasticsearch_async=Factory(
+            TwichGameAsyncElasticRepository,
+            db=elastic_async,
+        ),
     )
 
     # ------------- change ---------------------------
@@ -158,11 +231,26 @@ class TwichGameContainer(DeclarativeContainer):
         bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
         api_version=settings.KAFKA_CONSUMER_API_VERSION,
         topic=settings.KAFKA_GAME_TOPIC,
-        repository=game_query_repository,
+        repository=Factory(
+            TwichGameElasticRepository,
+            db=elastic,
+        ),
+        logger=logger,
+        batch_size=settings.KAFKA_PROJECTION_BATCH_SIZE,
+        flush_interval=settings.KAFKA_PROJECTION_FLUSH_INTERVAL,
     )
 
     # ------------- end change ------------------------
 
+    game_parser: Factory = Factory(
+        TwichGameParser,
+        session=twich_client_session,
+        token=twich_api_token,
+        scheduler=twich_request_scheduler,
+        circuit_breaker=twich_circuit_breaker,
+        hedger=twich_request_hedger,
+    )
+
     command_bus: Factory = Factory(
         InMemoryCommandBus,
         command_handlers=Dict(
@@ -170,12 +258,30 @@ class TwichGameContainer(DeclarativeContainer):
                 ParseTwichGame: Factory(
                     CExceptionHandlingDecorator,
                     command_handler=Factory(
-                        ParseTwichGameHandler,
-                        parser=Factory(
-                            TwichGameParser,
-                            token=twich_api_token,
+                        SingleFlightDecorator,
+                        command_handler=Factory(
+                            ParseTwichGameHandler,
+                            parser=game_parser,
+                            repository=Factory(
+                                game_command_repository,
+                                write_concern=settings.DB_MONGO_WRITE_CONCERN.get('ParseTwichGame'),
+                            ),
+                            publisher=game_kafka_publisher,
+                        ),
+                        in_flight_commands=in_flight_commands,
+                    ),
+                    exception_handlers=command_exception_handlers,
+                    logger=logger,
+                ),
+                ParseTwichGames: Factory(
+                    CExceptionHandlingDecorator,
+                    command_handler=Factory(
+                        ParseTwichGamesHandler,
+                        parser=game_parser,
+                        repository=Factory(
+                            game_command_repository,
+                            write_concern=settings.DB_MONGO_WRITE_CONCERN.get('ParseTwichGames'),
                         ),
-                        repository=game_command_repository,
                         publisher=game_kafka_publisher,
                     ),
                     exception_handlers=command_exception_handlers,
@@ -262,11 +368,18 @@ class TwichGameContainer(DeclarativeContainer):
 class TwichStreamContainer(DeclarativeContainer):
     # ---------------- change ------------------------
 
+    twich_client_session: Dependency = Dependency()
     twich_api_token: Dependency = Dependency()
+    twich_request_scheduler: Dependency = Dependency()
+    twich_circuit_breaker: Dependency = Dependency()
+    twich_request_hedger: Dependency = Dependency()
     kafka_producer: Dependency = Dependency()
     mongo: Dependency = Dependency()
+    mongo_motor: Dependency = Dependency()
     elastic: Dependency = Dependency()
+    elastic_async: Dependency = Dependency()
     logger: Dependency = Dependency()
+    in_flight_commands: Dependency = Dependency()
     command_exception_handlers: Dependency = Dependency()
     query_exception_handlers: Dependency = Dependency()
     rest_v1_controller_exception_handlers: Dependency = Dependency()
@@ -278,14 +391,40 @@ class TwichStreamContainer(DeclarativeContainer):
 
     # -------------- end change ----------------------
 
-    stream_command_repository: Factory = Factory(
-        TwichStreamMongoRepository,
-        db=mongo,
+    stream_command_repository: Selector = Selector(
+        Object(settings.DB_MONGO_DRIVER),
+        mongoengine=Factory(
+            TwichStreamMongoRepository,
+            db=mongo,
+        ),
+        motor=Factory(
+            TwichStreamMotorRepository,
+            db=mongo_motor,
+        ),
+    )
+
+    stream_history_repository: Selector = Selector(
+        Object(settings.DB_MONGO_DRIVER),
+        mongoengine=Factory(
+            TwichStreamHistoryMongoRepository,
+            db=mongo,
+        ),
+        motor=Factory(
+            TwichStreamHistoryMotorRepository,
+            db=mongo_motor,
+        ),
     )
 
-    stream_query_repository: Factory = Factory(
-        TwichStreamElasticRepository,
-        db=elastic,
+    stream_query_repository: Selector = Selector(
+        Object(settings.ELASTIC_DRIVER),
+        elasticsearch_dsl=Factory(
+            TwichStreamElasticRepository,
+            db=elastic,
+        ),
+        elasticsearch_async=Factory(
+            TwichStreamAsyncElasticRepository,
+            db=elastic_async,
+        ),
     )
 
     # ---------------- change ------------------------
@@ -295,11 +434,26 @@ class TwichStreamContainer(DeclarativeContainer):
         bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
         api_version=settings.KAFKA_CONSUMER_API_VERSION,
         topic=settings.KAFKA_STREAM_TOPIC,
-        repository=stream_query_repository,
+        repository=Factory(
+            TwichStreamElasticRepository,
+            db=elastic,
+        ),
+        logger=logger,
+        batch_size=settings.KAFKA_PROJECTION_BATCH_SIZE,
+        flush_interval=settings.KAFKA_PROJECTION_FLUSH_INTERVAL,
     )
 
     # -------------- end change ----------------------
 
+    stream_parser: Factory = Factory(
+        TwichStreamParser,
+        session=twich_client_session,
+        token=twich_api_token,
+        scheduler=twich_request_scheduler,
+        circuit_breaker=twich_circuit_breaker,
+        hedger=twich_request_hedger,
+    )
+
     command_bus: Factory = Factory(
         InMemoryCommandBus,
         command_handlers=Dict(
@@ -307,17 +461,60 @@ class TwichStreamContainer(DeclarativeContainer):
                 ParseTwichStream: Factory(
                     CExceptionHandlingDecorator,
                     command_handler=Factory(
-                        ParseTwichStreamHandler,
-                        parser=Factory(
-                            TwichStreamParser,
-                            token=twich_api_token,
+                        SingleFlightDecorator,
+                        command_handler=Factory(
+                            ParseTwichStreamHandler,
+                            parser=stream_parser,
+                            repository=Factory(
+                                stream_command_repository,
+                                write_concern=settings.DB_MONGO_WRITE_CONCERN.get(
+                                    'ParseTwichStream'
+                                ),
+                            ),
+                            history_repository=stream_history_repository,
+                            publisher=stream_kafka_publisher,
                         ),
-                        repository=stream_command_repository,
+                        in_flight_commands=in_flight_commands,
+                    ),
+                    exception_handlers=command_exception_handlers,
+                    logger=logger,
+                ),
+                ParseTwichStreams: Factory(
+                    CExceptionHandlingDecorator,
+                    command_handler=Factory(
+                        ParseTwichStreamsHandler,
+                        parser=stream_parser,
+                        repository=Factory(
+                            stream_command_repository,
+                            write_concern=settings.DB_MONGO_WRITE_CONCERN.get('ParseTwichStreams'),
+                        ),
+                        history_repository=stream_history_repository,
                         publisher=stream_kafka_publisher,
                     ),
                     exception_handlers=command_exception_handlers,
                     logger=logger,
                 ),
+                CrawlTwichStreams: Factory(
+                    CExceptionHandlingDecorator,
+                    command_handler=Factory(
+                        SingleFlightDecorator,
+                        command_handler=Factory(
+                            CrawlTwichStreamsHandler,
+                            parser=stream_parser,
+                            repository=Factory(
+                                stream_command_repository,
+                                write_concern=settings.DB_MONGO_WRITE_CONCERN.get(
+                                    'CrawlTwichStreams'
+                                ),
+                            ),
+                            history_repository=stream_history_repository,
+                            publisher=stream_kafka_publisher,
+                        ),
+                        in_flight_commands=in_flight_commands,
+                    ),
+                    exception_handlers=command_exception_handlers,
+                    logger=logger,
+                ),
                 DeleteTwichStream: Factory(
                     CExceptionHandlingDecorator,
                     command_handler=Factory(
@@ -346,6 +543,15 @@ class TwichStreamContainer(DeclarativeContainer):
         InMemoryQueryBus,
         query_handlers=Dict(
             {
+                ExportTwichStreams: Factory(
+                    QExceptionHandlingDecorator,
+                    query_handler=Factory(
+                        ExportTwichStreamsHandler,
+                        repository=stream_query_repository,
+                    ),
+                    exception_handlers=query_exception_handlers,
+                    logger=logger,
+                ),
                 GetAllTwichStreams: Factory(
                     QExceptionHandlingDecorator,
                     query_handler=Factory(
@@ -373,6 +579,24 @@ class TwichStreamContainer(DeclarativeContainer):
                     exception_handlers=query_exception_handlers,
                     logger=logger,
                 ),
+                GetTwichStreamHistory: Factory(
+                    QExceptionHandlingDecorator,
+                    query_handler=Factory(
+                        GetTwichStreamHistoryHandler,
+                        repository=stream_history_repository,
+                    ),
+                    exception_handlers=query_exception_handlers,
+                    logger=logger,
+                ),
+                GetTwichStreamTags: Factory(
+                    QExceptionHandlingDecorator,
+                    query_handler=Factory(
+                        GetTwichStreamTagsHandler,
+                        repository=stream_query_repository,
+                    ),
+                    exception_handlers=query_exception_handlers,
+                    logger=logger,
+                ),
             }
         ),
     )
@@ -399,11 +623,18 @@ class TwichStreamContainer(DeclarativeContainer):
 class TwichUserContainer(DeclarativeContainer):
     # ---------------- change ------------------------
 
+    twich_client_session: Dependency = Dependency()
     twich_api_token: Dependency = Dependency()
+    twich_request_scheduler: Dependency = Dependency()
+    twich_circuit_breaker: Dependency = Dependency()
+    twich_request_hedger: Dependency = Dependency()
     kafka_producer: Dependency = Dependency()
     mongo: Dependency = Dependency()
+    mongo_motor: Dependency = Dependency()
     elastic: Dependency = Dependency()
+    elastic_async: Dependency = Dependency()
     logger: Dependency = Dependency()
+    in_flight_commands: Dependency = Dependency()
     command_exception_handlers: Dependency = Dependency()
     query_exception_handlers: Dependency = Dependency()
     rest_v1_controller_exception_handlers: Dependency = Dependency()
@@ -415,14 +646,28 @@ class TwichUserContainer(DeclarativeContainer):
 
     # -------------- end change ----------------------
 
-    user_command_repository: Factory = Factory(
-        TwichUserMongoRepository,
-        db=mongo,
+    user_command_repository: Selector = Selector(
+        Object(settings.DB_MONGO_DRIVER),
+        mongoengine=Factory(
+            TwichUserMongoRepository,
+            db=mongo,
+        ),
+        motor=Factory(
+            TwichUserMotorRepository,
+            db=mongo_motor,
+        ),
     )
 
-    user_query_repository: Factory = Factory(
-        TwichUserElasticRepository,
-        db=elastic,
+    user_query_repository: Selector = Selector(
+        Object(settings.ELASTIC_DRIVER),
+        elasticsearch_dsl=Factory(
+            TwichUserElasticRepository,
+            db=elastic,
+        ),
+        elasticsearch_async=Factory(
+            TwichUserAsyncElasticRepository,
+            db=elastic_async,
+        ),
     )
 
     # ---------------- change ------------------------
@@ -432,11 +677,26 @@ class TwichUserContainer(DeclarativeContainer):
         bootstrap_servers=settings.KAFKA_BOOTSTRAP_SERVERS,
         api_version=settings.KAFKA_CONSUMER_API_VERSION,
         topic=settings.KAFKA_USER_TOPIC,
-        repository=user_query_repository,
+        repository=Factory(
+            TwichUserElasticRepository,
+            db=elastic,
+        ),
+        logger=logger,
+        batch_size=settings.KAFKA_PROJECTION_BATCH_SIZE,
+        flush_interval=settings.KAFKA_PROJECTION_FLUSH_INTERVAL,
     )
 
     # -------------- end change ----------------------
 
+    user_parser: Factory = Factory(
+        TwichUserParser,
+        session=twich_client_session,
+        token=twich_api_token,
+        scheduler=twich_request_scheduler,
+        circuit_breaker=twich_circuit_breaker,
+        hedger=twich_request_hedger,
+    )
+
     command_bus: Factory = Factory(
         InMemoryCommandBus,
         command_handlers=Dict(
@@ -444,12 +704,30 @@ class TwichUserContainer(DeclarativeContainer):
                 ParseTwichUser: Factory(
                     CExceptionHandlingDecorator,
                     command_handler=Factory(
-                        ParseTwichUserHandler,
-                        parser=Factory(
-                            TwichUserParser,
-                            token=twich_api_token,
+                        SingleFlightDecorator,
+                        command_handler=Factory(
+                            ParseTwichUserHandler,
+                            parser=user_parser,
+                            repository=Factory(
+                                user_command_repository,
+                                write_concern=settings.DB_MONGO_WRITE_CONCERN.get('ParseTwichUser'),
+                            ),
+                            publisher=user_kafka_publisher,
+                        ),
+                        in_flight_commands=in_flight_commands,
+                    ),
+                    exception_handlers=command_exception_handlers,
+                    logger=logger,
+                ),
+                ParseTwichUsers: Factory(
+                    CExceptionHandlingDecorator,
+                    command_handler=Factory(
+                        ParseTwichUsersHandler,
+                        parser=user_parser,
+                        repository=Factory(
+                            user_command_repository,
+                            write_concern=settings.DB_MONGO_WRITE_CONCERN.get('ParseTwichUsers'),
                         ),
-                        repository=user_command_repository,
                         publisher=user_kafka_publisher,
                     ),
                     exception_handlers=command_exception_handlers,
@@ -537,13 +815,47 @@ class RootContainer(DeclarativeContainer):
     wiring_config: WiringConfiguration = WiringConfiguration(
         modules=[
             'presentation.api.rest.v1.routes.game',
+            'presentation.api.rest.v1.routes.metrics',
             'presentation.api.rest.v1.routes.stream',
             'presentation.api.rest.v1.routes.user',
         ]
     )
 
+    logger: Singleton = Singleton(
+        StreamLogger,
+    )
+
+    twich_client_session: Resource = Resource(
+        get_twich_client_session,
+    )
+
     twich_api_token: Resource = Resource(
         get_twich_api_token,
+        session=twich_client_session,
+        logger=logger,
+    )
+
+    twich_request_scheduler: Singleton = Singleton(
+        TwichRequestScheduler,
+        limit=settings.TWICH_RATE_LIMIT,
+    )
+
+    twich_circuit_breaker: Singleton = Singleton(
+        TwichCircuitBreaker,
+        failure_threshold=settings.TWICH_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout=settings.TWICH_CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    )
+
+    twich_latency_histogram: Singleton = Singleton(
+        TwichLatencyHistogram,
+    )
+
+    twich_request_hedger: Singleton = Singleton(
+        TwichRequestHedger,
+        enabled=settings.TWICH_HEDGING_ENABLED,
+        percentile=settings.TWICH_HEDGING_PERCENTILE,
+        budget=settings.TWICH_HEDGING_BUDGET,
+        histogram=twich_latency_histogram,
     )
 
     kafka_producer: Singleton = Singleton(
@@ -562,6 +874,21 @@ class RootContainer(DeclarativeContainer):
         authentication_source=settings.DB_MONGO_AUTH_SOURCE,
     )
 
+    mongo_motor: Singleton = Singleton(
+        MongoMotorDatabase,
+        db_name=settings.DB_MONGO_NAME,
+        username=settings.DB_MONGO_USERNAME,
+        password=settings.DB_MONGO_PASSWORD,
+        host=settings.DB_MONGO_HOST,
+        port=settings.DB_MONGO_PORT,
+        authentication_source=settings.DB_MONGO_AUTH_SOURCE,
+    )
+
+    mongo_migrations: Resource = Resource(
+        ensure_indexes,
+        db=mongo_motor,
+    )
+
     elastic: Singleton = Singleton(
         ElasticSearchDatabase,
         protocol=settings.ELASTIC_PROTOCOL,
@@ -569,8 +896,22 @@ class RootContainer(DeclarativeContainer):
         port=settings.ELASTIC_PORT,
     )
 
-    logger: Singleton = Singleton(
-        StreamLogger,
+    elastic_async: Resource = Resource(
+        get_elastic_async_database,
+        protocol=settings.ELASTIC_PROTOCOL,
+        host=settings.ELASTIC_HOST,
+        port=settings.ELASTIC_PORT,
+        timeout=settings.ELASTIC_REQUEST_TIMEOUT,
+        maxsize=settings.ELASTIC_CONNECTIONS_LIMIT,
+    )
+
+    elastic_migrations: Resource = Resource(
+        migrate_indices,
+        db=elastic,
+    )
+
+    in_flight_commands: Singleton = Singleton(
+        dict,
     )
 
     command_exception_handlers: Dict = Dict(
@@ -604,6 +945,10 @@ class RootContainer(DeclarativeContainer):
 
     query_exception_handlers: Dict = Dict(
         {
+            InvalidCursorException: Singleton(
+                InvalidCursorExceptionHandler,
+                logger=logger,
+            ),
             ObjectNotFoundException: Singleton(
                 ObjectNotFoundExceptionHandler,
                 logger=logger,
@@ -613,6 +958,9 @@ class RootContainer(DeclarativeContainer):
 
     rest_v1_controller_exception_handlers: Dict = Dict(
         {
+            InvalidCursorException: Singleton(
+                RestInvalidCursorExceptionHandler,
+            ),
             ObjectNotFoundException: Singleton(
                 RestObjectNotFoundExceptionHandler,
             ),
@@ -634,13 +982,31 @@ class RootContainer(DeclarativeContainer):
         }
     )
 
+    rest_v1_metrics_controller: Factory = Factory(
+        TwichMetricsController,
+        sources=Dict(
+            {
+                'scheduler': twich_request_scheduler,
+                'latency': twich_latency_histogram,
+                'hedging': twich_request_hedger,
+            }
+        ),
+    )
+
     game_container: Container = Container(
         TwichGameContainer,
+        twich_client_session=twich_client_session,
         twich_api_token=twich_api_token,
+        twich_request_scheduler=twich_request_scheduler,
+        twich_circuit_breaker=twich_circuit_breaker,
+        twich_request_hedger=twich_request_hedger,
         kafka_producer=kafka_producer,
         mongo=mongo,
+        mongo_motor=mongo_motor,
         elastic=elastic,
+        elastic_async=elastic_async,
         logger=logger,
+        in_flight_commands=in_flight_commands,
         command_exception_handlers=command_exception_handlers,
         query_exception_handlers=query_exception_handlers,
         rest_v1_controller_exception_handlers=rest_v1_controller_exception_handlers,
@@ -648,11 +1014,18 @@ class RootContainer(DeclarativeContainer):
 
     stream_container: Container = Container(
         TwichStreamContainer,
+        twich_client_session=twich_client_session,
         twich_api_token=twich_api_token,
+        twich_request_scheduler=twich_request_scheduler,
+        twich_circuit_breaker=twich_circuit_breaker,
+        twich_request_hedger=twich_request_hedger,
         kafka_producer=kafka_producer,
         mongo=mongo,
+        mongo_motor=mongo_motor,
         elastic=elastic,
+        elastic_async=elastic_async,
         logger=logger,
+        in_flight_commands=in_flight_commands,
         command_exception_handlers=command_exception_handlers,
         query_exception_handlers=query_exception_handlers,
         rest_v1_controller_exception_handlers=rest_v1_controller_exception_handlers,
@@ -660,11 +1033,18 @@ class RootContainer(DeclarativeContainer):
 
     user_container: Container = Container(
         TwichUserContainer,
+        twich_client_session=twich_client_session,
         twich_api_token=twich_api_token,
+        twich_request_scheduler=twich_request_scheduler,
+        twich_circuit_breaker=twich_circuit_breaker,
+        twich_request_hedger=twich_request_hedger,
         kafka_producer=kafka_producer,
         mongo=mongo,
+        mongo_motor=mongo_motor,
         elastic=elastic,
+        elastic_async=elastic_async,
         logger=logger,
+        in_flight_commands=in_flight_commands,
         command_exception_handlers=command_exception_handlers,
         query_exception_handlers=query_exception_handlers,
         rest_v1_controller_exception_handlers=rest_v1_controller_exception_handlers,
@@ -8,7 +8,10 @@ from typing import TypeVar
 from domain.models.agroot import AggregateRoot
 from domain.models.base import DomainModel
 from domain.models.game import TwichGame
-from domain.models.stream import TwichStream
+from domain.models.stream import (
+    TwichStream,
+    TwichStreamSnapshot,
+)
 from domain.models.user import TwichUser
 
 
@@ -20,6 +23,7 @@ __all__: list[str] = [
     'DomainModel',
     'TwichGame',
     'TwichStream',
+    'TwichStreamSnapshot',
     'TwichUser',
     'DM',
 ]
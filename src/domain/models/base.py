@@ -4,10 +4,24 @@ base.py: File, containing base domain model.
 
 
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    fields,
+)
 from datetime import datetime
+from hashlib import sha256
 
 
 @dataclass(frozen=False)
 class DomainModel(ABC):
     parsed_at: datetime
+
+    @property
+    def content_hash(self) -> str:
+        content: list[tuple[str, str]] = sorted(
+            (field.name, repr(getattr(self, field.name)))
+            for field in fields(self)
+            if field.init and field.name != 'parsed_at'
+        )
+
+        return sha256(repr(content).encode('utf-8')).hexdigest()
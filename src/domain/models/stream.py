@@ -17,6 +17,14 @@ from domain.models.agroot import AggregateRoot
 from domain.models.base import DomainModel
 
 
+@dataclass(frozen=False)
+class TwichStreamSnapshot(DomainModel):
+    stream_id: int
+    user_login: str
+    game_id: int
+    viewer_count: int
+
+
 @dataclass(frozen=False)
 class TwichStream(DomainModel, AggregateRoot[TwichStreamDomainEvent]):
     id: int
@@ -86,6 +94,15 @@ class TwichStream(DomainModel, AggregateRoot[TwichStreamDomainEvent]):
 
         return stream
 
+    def snapshot(self) -> TwichStreamSnapshot:
+        return TwichStreamSnapshot(
+            stream_id=self.id,
+            user_login=self.user_login,
+            game_id=self.game_id,
+            viewer_count=self.viewer_count,
+            parsed_at=self.parsed_at,
+        )
+
     def delete(self) -> None:
         event: TwichStreamDeleted = TwichStreamDeleted(id=self.id)
         self.register_event(event)
@@ -0,0 +1,175 @@
+"""
+base.py: File, containing base parser for twich api.
+"""
+
+
+from asyncio import (
+    FIRST_COMPLETED,
+    Task,
+    TimeoutError,
+    create_task,
+    sleep,
+    wait,
+)
+from random import uniform
+from time import monotonic
+from typing import (
+    Awaitable,
+    Callable,
+    ClassVar,
+    Optional,
+)
+
+from aiohttp import (
+    ClientConnectionError,
+    ClientSession,
+    ClientTimeout,
+)
+
+from application.exceptions import (
+    TwichGetObjectBadRequestException,
+    TwichRequestTimeoutException,
+    TwichRequestUnauthorizedException,
+)
+from infrastructure.parsers.aiohttp.dependencies import (
+    TwichAPIToken,
+    TwichAPITokenManager,
+    TwichCircuitBreaker,
+    TwichRequestHedger,
+    TwichRequestScheduler,
+)
+from shared.config import settings
+from shared.utils import json_loads
+
+
+class TwichParser:
+    batch_size: ClassVar[int] = 100
+
+    def __init__(
+        self,
+        session: ClientSession,
+        token: TwichAPITokenManager,
+        scheduler: TwichRequestScheduler,
+        circuit_breaker: TwichCircuitBreaker,
+        hedger: TwichRequestHedger,
+    ) -> None:
+        self.session: ClientSession = session
+        self.token: TwichAPITokenManager = token
+        self.scheduler: TwichRequestScheduler = scheduler
+        self.circuit_breaker: TwichCircuitBreaker = circuit_breaker
+        self.hedger: TwichRequestHedger = hedger
+        self.timeout: ClientTimeout = ClientTimeout(total=settings.TWICH_REQUEST_TIMEOUT)
+
+    def _backoff(self, attempt: int) -> float:
+        backoff: float = settings.TWICH_REQUEST_BACKOFF_BASE * 2**attempt
+
+        return uniform(0, min(settings.TWICH_REQUEST_BACKOFF_MAX, backoff))
+
+    async def _send(
+        self,
+        url: str,
+        params: list[tuple[str, str]],
+        token: TwichAPIToken,
+    ) -> tuple[int, Optional[dict]]:
+        for attempt in range(settings.TWICH_REQUEST_RETRIES + 1):
+            if not self.circuit_breaker.allow():
+                raise TwichRequestTimeoutException('Twich API is unavailable, circuit is open.')
+
+            probe: bool = self.circuit_breaker.is_open
+
+            try:
+                if attempt > 0:
+                    await sleep(self._backoff(attempt))
+
+                await self.scheduler.acquire()
+
+                async with self.session.get(
+                    url,
+                    params=params,
+                    headers=token.headers,
+                    timeout=self.timeout,
+                ) as response:
+                    self.scheduler.update(response.headers)
+
+                    if response.status >= 500:
+                        self.circuit_breaker.record_failure()
+                        continue
+
+                    self.circuit_breaker.record_success()
+
+                    if response.status == 429:
+                        self.scheduler.exhaust()
+                        continue
+
+                    if response.status != 200:
+                        return response.status, None
+
+                    return response.status, await response.json(loads=json_loads)
+            except (TimeoutError, ClientConnectionError):
+                self.circuit_breaker.record_failure()
+            except BaseException:
+                if probe:
+                    self.circuit_breaker.record_abort()
+
+                raise
+
+        raise TwichRequestTimeoutException('Request to Twich API has failed after retries.')
+
+    async def _hedged_send(
+        self,
+        url: str,
+        params: list[tuple[str, str]],
+        token: TwichAPIToken,
+    ) -> tuple[int, Optional[dict]]:
+        started_at: float = monotonic()
+        delay: Optional[float] = self.hedger.delay()
+        tasks: set[Task] = {create_task(self._send(url, params, token))}
+
+        try:
+            if delay is not None:
+                done, _ = await wait(tasks, timeout=delay)
+
+                if not done and self.hedger.acquire(self.scheduler.limit):
+                    tasks.add(create_task(self._send(url, params, token)))
+
+            failed: list[Task] = []
+
+            while tasks:
+                done, tasks = await wait(tasks, return_when=FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        self.hedger.histogram.observe(monotonic() - started_at)
+                        return task.result()
+
+                    failed.append(task)
+
+            return failed[0].result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _get(
+        self,
+        url: str,
+        params: list[tuple[str, str]],
+        bad_request_message: str,
+        hedge: bool = False,
+    ) -> dict:
+        send: Callable[..., Awaitable[tuple[int, Optional[dict]]]] = (
+            self._hedged_send if hedge else self._send
+        )
+        token: TwichAPIToken = await self.token.get_token()
+        status, json = await send(url, params, token)
+
+        if status == 401:
+            token = await self.token.refresh(token)
+            status, json = await send(url, params, token)
+
+        if status == 400:
+            raise TwichGetObjectBadRequestException(bad_request_message)
+
+        if status == 401:
+            raise TwichRequestUnauthorizedException('Request to Twich API is unauthorized.')
+
+        return json or {}
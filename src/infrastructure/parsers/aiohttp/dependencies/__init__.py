@@ -3,13 +3,27 @@ __init__.py: File, containing other dependency modules to simplify import.
 """
 
 
+from infrastructure.parsers.aiohttp.dependencies.circuit_breaker import TwichCircuitBreaker
 from infrastructure.parsers.aiohttp.dependencies.common import (
     TwichAPIToken,
+    TwichAPITokenManager,
     get_twich_api_token,
+    get_twich_client_session,
 )
+from infrastructure.parsers.aiohttp.dependencies.hedging import (
+    TwichLatencyHistogram,
+    TwichRequestHedger,
+)
+from infrastructure.parsers.aiohttp.dependencies.scheduler import TwichRequestScheduler
 
 
 __all__: list[str] = [
     'TwichAPIToken',
+    'TwichAPITokenManager',
+    'TwichCircuitBreaker',
+    'TwichLatencyHistogram',
+    'TwichRequestHedger',
+    'TwichRequestScheduler',
     'get_twich_api_token',
+    'get_twich_client_session',
 ]
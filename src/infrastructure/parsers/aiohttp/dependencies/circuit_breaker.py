@@ -0,0 +1,79 @@
+"""
+circuit_breaker.py: File, containing circuit breaker for twich api.
+"""
+
+
+from time import monotonic
+from typing import Optional
+
+
+class TwichCircuitBreaker:
+    """
+    TwichCircuitBreaker: Class, that stops sending requests to twich api while it is degraded.
+    After recovery timeout a single probe request is allowed to check whether api is healthy.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float) -> None:
+        """
+        __init__: Initialize twich circuit breaker.
+
+        Args:
+            failure_threshold (int): Number of consecutive failures that opens the circuit.
+            recovery_timeout (float): Seconds to wait before probing twich api again.
+        """
+
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self.failures: int = 0
+        self.opened_at: Optional[float] = None
+        self._probing: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        """
+        allow: Check whether request to twich api can be sent.
+
+        Returns:
+            bool: True if circuit is closed or probe request is allowed, False otherwise.
+        """
+
+        if self.opened_at is None:
+            return True
+
+        if self._probing or monotonic() - self.opened_at < self.recovery_timeout:
+            return False
+
+        self._probing = True
+
+        return True
+
+    def record_success(self) -> None:
+        """
+        record_success: Close the circuit after twich api has responded.
+        """
+
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_abort(self) -> None:
+        """
+        record_abort: Release the probe of a request that has ended without twich api response,
+        so next request after recovery timeout can probe again.
+        """
+
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """
+        record_failure: Count failure and open the circuit when threshold is reached.
+        """
+
+        self.failures += 1
+        self._probing = False
+
+        if self.failures >= self.failure_threshold:
+            self.opened_at = monotonic()
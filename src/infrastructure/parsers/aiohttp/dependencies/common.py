@@ -3,17 +3,28 @@ common.py: File, containing common dependencies.
 """
 
 
-from typing import AsyncGenerator
+from asyncio import Lock
+from time import monotonic
+from typing import (
+    AsyncGenerator,
+    Optional,
+)
 
-from aiohttp import ClientSession
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
 
 from application.exceptions import TwichTokenNotObtainedException
 from shared.config import settings
+from shared.interfaces import ILogger
 
 
 class TwichAPIToken:
-    def __init__(self, access_token: str) -> None:
+    def __init__(self, access_token: str, expires_at: float) -> None:
         self._access_token: str = access_token
+        self.expires_at: float = expires_at
 
     @property
     def headers(self) -> dict[str, str]:
@@ -22,23 +33,81 @@ class TwichAPIToken:
             'Client-Id': settings.TWICH_CLIENT_ID,
         }
 
+    @property
+    def is_expiring(self) -> bool:
+        return monotonic() >= self.expires_at - settings.TWICH_API_TOKEN_REFRESH_MARGIN
+
+
+class TwichAPITokenManager:
+    def __init__(self, session: ClientSession) -> None:
+        self.session: ClientSession = session
+        self._token: Optional[TwichAPIToken] = None
+        self._lock: Lock = Lock()
+
+    async def get_token(self) -> TwichAPIToken:
+        token: Optional[TwichAPIToken] = self._token
+
+        if token is None or token.is_expiring:
+            return await self.refresh(token)
+
+        return token
+
+    async def refresh(self, stale_token: Optional[TwichAPIToken] = None) -> TwichAPIToken:
+        async with self._lock:
+            token: Optional[TwichAPIToken] = self._token
+
+            if token is not None and token is not stale_token and not token.is_expiring:
+                return token
+
+            self._token = await self._obtain_token()
+
+            return self._token
 
-async def get_twich_api_token() -> AsyncGenerator[TwichAPIToken, None]:
-    async with ClientSession() as session:
-        async with session.post(
-            settings.TWICH_TOKEN_URL,
-            headers={
-                'Content-Type': settings.TWICH_API_CONTENT_TYPE,
-            },
-            data={
-                'client_id': settings.TWICH_CLIENT_ID,
-                'client_secret': settings.TWICH_CLIENT_SECRET,
-                'grant_type': settings.TWICH_API_GRANT_TYPE,
-            },
-        ) as response:
-            try:
+    async def _obtain_token(self) -> TwichAPIToken:
+        try:
+            async with self.session.post(
+                settings.TWICH_TOKEN_URL,
+                headers={
+                    'Content-Type': settings.TWICH_API_CONTENT_TYPE,
+                },
+                data={
+                    'client_id': settings.TWICH_CLIENT_ID,
+                    'client_secret': settings.TWICH_CLIENT_SECRET,
+                    'grant_type': settings.TWICH_API_GRANT_TYPE,
+                },
+                timeout=ClientTimeout(total=settings.TWICH_REQUEST_TIMEOUT),
+            ) as response:
                 json_response: dict = await response.json()
-                access_token: str = json_response['access_token']
-                yield TwichAPIToken(access_token)
-            except Exception as exception:
-                raise TwichTokenNotObtainedException(f'Error during obtaining token: {exception}')
+
+            access_token: str = json_response['access_token']
+            expires_in: int = json_response['expires_in']
+        except Exception as exception:
+            raise TwichTokenNotObtainedException(f'Error during obtaining token: {exception}')
+
+        return TwichAPIToken(access_token, monotonic() + expires_in)
+
+
+async def get_twich_client_session() -> AsyncGenerator[ClientSession, None]:
+    connector: TCPConnector = TCPConnector(
+        limit=settings.TWICH_HTTP_CONNECTIONS_LIMIT,
+        limit_per_host=settings.TWICH_HTTP_CONNECTIONS_LIMIT_PER_HOST,
+        ttl_dns_cache=settings.TWICH_HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=settings.TWICH_HTTP_KEEPALIVE_TIMEOUT,
+    )
+
+    async with ClientSession(connector=connector) as session:
+        yield session
+
+
+async def get_twich_api_token(
+    session: ClientSession,
+    logger: ILogger,
+) -> AsyncGenerator[TwichAPITokenManager, None]:
+    token_manager: TwichAPITokenManager = TwichAPITokenManager(session)
+
+    try:
+        await token_manager.refresh()
+    except TwichTokenNotObtainedException as exception:
+        logger.warning(f'Token prefetch has failed, it will be obtained on demand: {exception}')
+
+    yield token_manager
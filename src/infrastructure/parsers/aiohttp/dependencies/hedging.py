@@ -0,0 +1,187 @@
+"""
+hedging.py: File, containing latency histogram and request hedger for twich api.
+"""
+
+
+from bisect import bisect_left
+from time import monotonic
+from typing import (
+    ClassVar,
+    Optional,
+)
+
+from shared.interfaces import IMetrics
+
+
+class TwichLatencyHistogram(IMetrics):
+    """
+    TwichLatencyHistogram: Class, that counts twich api response latencies in fixed buckets.
+    """
+
+    buckets: ClassVar[tuple[float, ...]] = (
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        float('inf'),
+    )
+
+    def __init__(self) -> None:
+        """
+        __init__: Initialize empty latency histogram.
+        """
+
+        self.counts: list[int] = [0] * len(self.buckets)
+        self.total: int = 0
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        """
+        metrics: Returns bucket counts and main percentiles.
+
+        Returns:
+            dict[str, float]: Count of responses per bucket upper bound and p50, p95, p99.
+        """
+
+        metrics: dict[str, float] = {
+            f'le_{bound}': count for bound, count in zip(self.buckets, self.counts)
+        }
+
+        for percentile in (0.5, 0.95, 0.99):
+            metrics[f'p{int(percentile * 100)}'] = self.percentile(percentile) or 0.0
+
+        return metrics
+
+    def observe(self, latency: float) -> None:
+        """
+        observe: Add response latency to the histogram.
+
+        Args:
+            latency (float): Response latency in seconds.
+        """
+
+        self.counts[bisect_left(self.buckets, latency)] += 1
+        self.total += 1
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        percentile: Returns upper bound of the bucket containing given percentile.
+
+        Args:
+            percentile (float): Percentile in range (0, 1].
+
+        Returns:
+            Optional[float]: Latency in seconds or None if histogram is empty.
+        """
+
+        if self.total == 0:
+            return None
+
+        rank: float = percentile * self.total
+        seen: int = 0
+
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+
+            if seen >= rank:
+                return bound
+
+        return self.buckets[-1]
+
+
+class TwichRequestHedger(IMetrics):
+    """
+    TwichRequestHedger: Class, that decides when a duplicate request to twich api should be sent.
+    Hedges are sent after percentile based delay and limited by a fraction of the rate limit.
+    """
+
+    window: ClassVar[float] = 60.0
+    min_samples: ClassVar[int] = 20
+
+    def __init__(
+        self,
+        enabled: bool,
+        percentile: float,
+        budget: float,
+        histogram: TwichLatencyHistogram,
+    ) -> None:
+        """
+        __init__: Initialize twich request hedger.
+
+        Args:
+            enabled (bool): Whether hedging is enabled.
+            percentile (float): Latency percentile after which hedge is sent.
+            budget (float): Max fraction of the rate limit that can be spent on hedges.
+            histogram (TwichLatencyHistogram): Histogram of twich api response latencies.
+        """
+
+        self.enabled: bool = enabled
+        self.percentile: float = percentile
+        self.budget: float = budget
+        self.histogram: TwichLatencyHistogram = histogram
+        self.hedges: int = 0
+        self._window_hedges: int = 0
+        self._window_started_at: float = monotonic()
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        """
+        metrics: Returns hedging state.
+
+        Returns:
+            dict[str, float]: Total hedges, hedges in current window and current hedge delay.
+        """
+
+        return {
+            'hedges': self.hedges,
+            'window_hedges': self._window_hedges,
+            'delay': self.delay() or 0.0,
+        }
+
+    def delay(self) -> Optional[float]:
+        """
+        delay: Returns how long to wait for primary response before sending a hedge.
+
+        Returns:
+            Optional[float]: Delay in seconds or None if request must not be hedged.
+        """
+
+        if not self.enabled or self.histogram.total < self.min_samples:
+            return None
+
+        delay: Optional[float] = self.histogram.percentile(self.percentile)
+
+        if delay is None or delay == float('inf'):
+            return None
+
+        return delay
+
+    def acquire(self, limit: int) -> bool:
+        """
+        acquire: Take one hedge from the budget.
+
+        Args:
+            limit (int): Current twich api rate limit per window.
+
+        Returns:
+            bool: True if hedge can be sent, False if budget is spent.
+        """
+
+        now: float = monotonic()
+
+        if now - self._window_started_at >= self.window:
+            self._window_started_at = now
+            self._window_hedges = 0
+
+        if self._window_hedges >= self.budget * limit:
+            return False
+
+        self._window_hedges += 1
+        self.hedges += 1
+
+        return True
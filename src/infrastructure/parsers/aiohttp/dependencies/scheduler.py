@@ -0,0 +1,102 @@
+"""
+scheduler.py: File, containing rate limit aware request scheduler for twich api.
+"""
+
+
+from asyncio import (
+    Lock,
+    sleep,
+)
+from time import time
+from typing import Mapping
+
+from shared.interfaces import IMetrics
+
+
+class TwichRequestScheduler(IMetrics):
+    """
+    TwichRequestScheduler: Class, that paces requests to twich api according to its rate limit.
+    Bucket state is taken from Ratelimit-* response headers, excess requests wait in a queue.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        __init__: Initialize twich request scheduler.
+
+        Args:
+            limit (int): Initial bucket size, used until twich api reports its own.
+        """
+
+        self.limit: int = limit
+        self.remaining: int = limit
+        self.reset_at: float = 0.0
+        self.queued: int = 0
+        self._next_request_at: float = 0.0
+        self._lock: Lock = Lock()
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        """
+        metrics: Returns current bucket state.
+
+        Returns:
+            dict[str, float]: Bucket limit, remaining points, seconds to reset and queue size.
+        """
+
+        return {
+            'limit': self.limit,
+            'remaining': self.remaining,
+            'reset_in': max(0.0, self.reset_at - time()),
+            'queued': self.queued,
+        }
+
+    async def acquire(self) -> None:
+        """
+        acquire: Wait until request can be sent without exceeding the rate limit.
+        """
+
+        self.queued += 1
+
+        try:
+            async with self._lock:
+                now: float = time()
+
+                if now >= self.reset_at:
+                    self.remaining = self.limit
+
+                if self.remaining <= 0:
+                    await sleep(self.reset_at - now)
+                    now = time()
+                    self.remaining = self.limit
+
+                if now < self._next_request_at:
+                    await sleep(self._next_request_at - now)
+                    now = time()
+
+                interval: float = max(0.0, self.reset_at - now) / max(self.remaining, 1)
+                self._next_request_at = now + interval
+                self.remaining -= 1
+        finally:
+            self.queued -= 1
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        update: Update bucket state from twich api response headers.
+
+        Args:
+            headers (Mapping[str, str]): Response headers.
+        """
+
+        try:
+            self.limit = int(headers['Ratelimit-Limit'])
+            self.remaining = int(headers['Ratelimit-Remaining'])
+            self.reset_at = float(headers['Ratelimit-Reset'])
+        except (KeyError, ValueError):
+            return
+
+    def exhaust(self) -> None:
+        """
+        exhaust: Mark bucket as empty, so next requests wait for its reset.
+        """
+
+        self.remaining = 0
@@ -6,49 +6,51 @@ game.py: File, containing parser for a twich game.
 from datetime import datetime
 from typing import Optional
 
-from aiohttp import ClientSession
-
-from application.exceptions import (
-    ObjectNotFoundException,
-    TwichGetObjectBadRequestException,
-    TwichRequestUnauthorizedException,
-)
+from application.exceptions import ObjectNotFoundException
 from application.interfaces.parser import ITwichGameParser
 from domain.models import TwichGame
-from infrastructure.parsers.aiohttp.dependencies import TwichAPIToken
+from infrastructure.parsers.aiohttp.base import TwichParser
 from shared.config import settings
 
 
-class TwichGameParser(ITwichGameParser):
-    def __init__(self, token: TwichAPIToken) -> None:
-        self.token: TwichAPIToken = token
-
+class TwichGameParser(TwichParser, ITwichGameParser):
     async def parse_game(self, name: str) -> TwichGame:
-        async with ClientSession() as session:
-            async with session.get(
-                f'{settings.TWICH_GET_GAME_BASE_URL}?name={name}',
-                headers=self.token.headers,
-                timeout=10,
-            ) as response:
-                if response.status == 400:
-                    raise TwichGetObjectBadRequestException('Get game bad request to Twich API')
-
-                if response.status == 401:
-                    raise TwichRequestUnauthorizedException('Request to Twich API is unauthorized.')
-
-                game_json: Optional[dict] = await response.json()
-
-                if not game_json:
-                    raise ObjectNotFoundException('Game is not found.')
-
-                game_data: Optional[list] = game_json.get('data')
-
-                if not game_data:
-                    raise ObjectNotFoundException('Game is not found.')
-
-                game: TwichGame = TwichGame.create(
-                    **game_data[0],
-                    parsed_at=datetime.utcnow(),
+        game_json: dict = await self._get(
+            settings.TWICH_GET_GAME_BASE_URL,
+            params=[('name', name)],
+            bad_request_message='Get game bad request to Twich API',
+        )
+
+        game_data: Optional[list] = game_json.get('data')
+
+        if not game_data:
+            raise ObjectNotFoundException('Game is not found.')
+
+        game: TwichGame = TwichGame.create(
+            **game_data[0],
+            parsed_at=datetime.utcnow(),
+        )
+
+        return game
+
+    async def parse_games(self, names: list[str]) -> list[TwichGame]:
+        games: list[TwichGame] = []
+
+        for start in range(0, len(names), self.batch_size):
+            chunk: list[str] = names[start : start + self.batch_size]
+
+            games_json: dict = await self._get(
+                settings.TWICH_GET_GAME_BASE_URL,
+                params=[('name', name) for name in chunk],
+                bad_request_message='Get games bad request to Twich API',
+            )
+
+            for game_data in games_json.get('data') or []:
+                games.append(
+                    TwichGame.create(
+                        **game_data,
+                        parsed_at=datetime.utcnow(),
+                    )
                 )
 
-                return game
+        return games
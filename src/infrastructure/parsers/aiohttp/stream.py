@@ -4,55 +4,99 @@ stream.py: File, containing parser for a twich stream.
 
 
 from datetime import datetime
-from typing import Optional
-
-from aiohttp import ClientSession
-
-from application.exceptions import (
-    ObjectNotFoundException,
-    TwichGetObjectBadRequestException,
-    TwichRequestUnauthorizedException,
+from typing import (
+    AsyncIterator,
+    Optional,
 )
+
+from application.exceptions import ObjectNotFoundException
 from application.interfaces.parser import ITwichStreamParser
 from domain.models import TwichStream
-from infrastructure.parsers.aiohttp.dependencies import TwichAPIToken
+from infrastructure.parsers.aiohttp.base import TwichParser
 from shared.config import settings
 
 
-class TwichStreamParser(ITwichStreamParser):
-    def __init__(self, token: TwichAPIToken) -> None:
-        self.token: TwichAPIToken = token
+class TwichStreamParser(TwichParser, ITwichStreamParser):
+    def _create_stream(self, stream_data: dict) -> TwichStream:
+        stream: TwichStream = TwichStream.create(
+            **stream_data,
+            parsed_at=datetime.utcnow(),
+        )
+        stream.started_at = datetime.strptime(
+            stream_data['started_at'],
+            '%Y-%m-%dT%H:%M:%SZ',
+        )
+
+        return stream
 
     async def parse_stream(self, user_login: str) -> TwichStream:
-        async with ClientSession() as session:
-            async with session.get(
-                f'{settings.TWICH_GET_STREAM_BASE_URL}?user_login={user_login}',
-                headers=self.token.headers,
-                timeout=10,
-            ) as response:
-                if response.status == 400:
-                    raise TwichGetObjectBadRequestException('Get stream bad request to Twich API.')
+        stream_json: dict = await self._get(
+            settings.TWICH_GET_STREAM_BASE_URL,
+            params=[('user_login', user_login)],
+            bad_request_message='Get stream bad request to Twich API.',
+            hedge=True,
+        )
 
-                if response.status == 401:
-                    raise TwichRequestUnauthorizedException('Request to Twich API is unauthorized.')
+        stream_data: Optional[list] = stream_json.get('data')
 
-                stream_json: Optional[dict] = await response.json()
+        if not stream_data:
+            raise ObjectNotFoundException('Stream is not found.')
 
-                if not stream_json:
-                    raise ObjectNotFoundException('Stream is not found.')
+        return self._create_stream(stream_data[0])
 
-                stream_data: Optional[list] = stream_json.get('data')
+    async def parse_streams(self, user_logins: list[str]) -> list[TwichStream]:
+        streams: list[TwichStream] = []
 
-                if not stream_data:
-                    raise ObjectNotFoundException('Stream is not found.')
+        for start in range(0, len(user_logins), self.batch_size):
+            chunk: list[str] = user_logins[start : start + self.batch_size]
+            cursor: Optional[str] = None
 
-                stream: TwichStream = TwichStream.create(
-                    **stream_data[0],
-                    parsed_at=datetime.utcnow(),
-                )
-                stream.started_at = datetime.strptime(
-                    stream_data[0]['started_at'],
-                    '%Y-%m-%dT%H:%M:%SZ',
+            while True:
+                params: list[tuple[str, str]] = [('user_login', user_login) for user_login in chunk]
+                params.append(('first', str(self.batch_size)))
+
+                if cursor:
+                    params.append(('after', cursor))
+
+                streams_json: dict = await self._get(
+                    settings.TWICH_GET_STREAM_BASE_URL,
+                    params=params,
+                    bad_request_message='Get streams bad request to Twich API.',
                 )
 
-                return stream
+                streams_data: list = streams_json.get('data') or []
+                streams.extend(self._create_stream(stream_data) for stream_data in streams_data)
+                cursor = (streams_json.get('pagination') or {}).get('cursor')
+
+                if not streams_data or not cursor:
+                    break
+
+        return streams
+
+    async def crawl_streams(self, game_id: str) -> AsyncIterator[list[TwichStream]]:
+        cursor: Optional[str] = None
+
+        while True:
+            params: list[tuple[str, str]] = [
+                ('game_id', game_id),
+                ('first', str(self.batch_size)),
+            ]
+
+            if cursor:
+                params.append(('after', cursor))
+
+            streams_json: dict = await self._get(
+                settings.TWICH_GET_STREAM_BASE_URL,
+                params=params,
+                bad_request_message='Crawl streams bad request to Twich API.',
+            )
+
+            streams_data: list = streams_json.get('data') or []
+
+            if streams_data:
+                yield [self._create_stream(stream_data) for stream_data in streams_data]
+
+            cursor = (streams_json.get('pagination') or {}).get('cursor')
+
+            if not streams_data or not cursor:
+                return
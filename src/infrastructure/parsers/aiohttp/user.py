@@ -6,53 +6,59 @@ user.py: File, containing parser for a twich user.
 from datetime import datetime
 from typing import Optional
 
-from aiohttp import ClientSession
-
-from application.exceptions import (
-    ObjectNotFoundException,
-    TwichGetObjectBadRequestException,
-    TwichRequestUnauthorizedException,
-)
+from application.exceptions import ObjectNotFoundException
 from application.interfaces.parser import ITwichUserParser
 from domain.models import TwichUser
-from infrastructure.parsers.aiohttp.dependencies import TwichAPIToken
+from infrastructure.parsers.aiohttp.base import TwichParser
 from shared.config import settings
 
 
-class TwichUserParser(ITwichUserParser):
-    def __init__(self, token: TwichAPIToken) -> None:
-        self.token: TwichAPIToken = token
-
+class TwichUserParser(TwichParser, ITwichUserParser):
     async def parse_user(self, login: str) -> TwichUser:
-        async with ClientSession() as session:
-            async with session.get(
-                f'{settings.TWICH_GET_USER_BASE_URL}?login={login}',
-                headers=self.token.headers,
-                timeout=10,
-            ) as response:
-                if response.status == 400:
-                    raise TwichGetObjectBadRequestException('Get user bad request to Twich API.')
+        user_json: dict = await self._get(
+            settings.TWICH_GET_USER_BASE_URL,
+            params=[('login', login)],
+            bad_request_message='Get user bad request to Twich API.',
+            hedge=True,
+        )
+
+        user_data: Optional[list] = user_json.get('data')
+
+        if not user_data:
+            raise ObjectNotFoundException('User is not found.')
 
-                if response.status == 401:
-                    raise TwichRequestUnauthorizedException('Request to Twich API is unauthorized.')
+        user: TwichUser = TwichUser.create(
+            **user_data[0],
+            parsed_at=datetime.utcnow(),
+        )
+        user.created_at = datetime.strptime(
+            user_data[0]['created_at'],
+            '%Y-%m-%dT%H:%M:%SZ',
+        )
 
-                user_json: Optional[dict] = await response.json()
+        return user
 
-                if not user_json:
-                    raise ObjectNotFoundException('User is not found.')
+    async def parse_users(self, logins: list[str]) -> list[TwichUser]:
+        users: list[TwichUser] = []
 
-                user_data: Optional[list] = user_json.get('data')
+        for start in range(0, len(logins), self.batch_size):
+            chunk: list[str] = logins[start : start + self.batch_size]
 
-                if not user_data:
-                    raise ObjectNotFoundException('User is not found.')
+            users_json: dict = await self._get(
+                settings.TWICH_GET_USER_BASE_URL,
+                params=[('login', login) for login in chunk],
+                bad_request_message='Get users bad request to Twich API.',
+            )
 
+            for user_data in users_json.get('data') or []:
                 user: TwichUser = TwichUser.create(
-                    **user_data[0],
+                    **user_data,
                     parsed_at=datetime.utcnow(),
                 )
                 user.created_at = datetime.strptime(
-                    user_data[0]['created_at'],
+                    user_data['created_at'],
                     '%Y-%m-%dT%H:%M:%SZ',
                 )
+                users.append(user)
 
-                return user
+        return users
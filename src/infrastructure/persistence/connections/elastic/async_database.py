@@ -0,0 +1,59 @@
+"""
+async_database.py: File, containing async elastic search database connection.
+"""
+
+
+from typing import AsyncGenerator
+
+from elasticsearch import AsyncElasticsearch
+
+
+class ElasticSearchAsyncDatabase:
+    """
+    ElasticSearchAsyncDatabase: Class, that represents async connection with elastic search db.
+    """
+
+    def __init__(
+        self,
+        protocol: str,
+        host: str,
+        port: int,
+        timeout: float,
+        maxsize: int,
+    ) -> None:
+        """
+        __init__: Connect to elasticsearch database with async client.
+
+        Args:
+            protocol (str): Database connection protocol.
+            host (str): Database host.
+            port (int): Database port.
+            timeout (float): Request timeout in seconds.
+            maxsize (int): Maximum number of pooled connections per node.
+        """
+
+        self.connection: AsyncElasticsearch = AsyncElasticsearch(
+            hosts=[f'{protocol}://{host}:{port}'],
+            timeout=timeout,
+            maxsize=maxsize,
+        )
+
+
+async def get_elastic_async_database(
+    protocol: str,
+    host: str,
+    port: int,
+    timeout: float,
+    maxsize: int,
+) -> AsyncGenerator[ElasticSearchAsyncDatabase, None]:
+    db: ElasticSearchAsyncDatabase = ElasticSearchAsyncDatabase(
+        protocol=protocol,
+        host=host,
+        port=port,
+        timeout=timeout,
+        maxsize=maxsize,
+    )
+
+    yield db
+
+    await db.connection.close()
@@ -0,0 +1,45 @@
+"""
+motor.py: File, containing async mongo database connection.
+"""
+
+
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorDatabase,
+)
+
+
+class MongoMotorDatabase:
+    """
+    MongoMotorDatabase: Class, that represents async connection with mongo db.
+    """
+
+    def __init__(
+        self,
+        db_name: str,
+        username: str,
+        password: str,
+        host: str,
+        port: int,
+        authentication_source: str,
+    ) -> None:
+        """
+        __init__: Connect to mongo database with async motor driver.
+
+        Args:
+            db_name (str): Name of the database.
+            username (str): Name of the user of the database.
+            password (str): Password of the database.
+            host (str): Database host.
+            port (int): Database port.
+            authentication_source (str): The database to authentificate on.
+        """
+
+        self.connection: AsyncIOMotorClient = AsyncIOMotorClient(
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            authSource=authentication_source,
+        )
+        self.database: AsyncIOMotorDatabase = self.connection[db_name]
@@ -0,0 +1,274 @@
+"""
+elastic.py: File, containing versioned index migrations for elastic search.
+"""
+
+
+from datetime import (
+    datetime,
+    timedelta,
+)
+from time import (
+    monotonic,
+    sleep,
+)
+from typing import (
+    Optional,
+    Type,
+)
+
+from elasticsearch import Elasticsearch
+from elasticsearch.exceptions import (
+    NotFoundError,
+    RequestError,
+)
+from elasticsearch_dsl import Document
+
+from infrastructure.persistence.connections.elastic.database import ElasticSearchDatabase
+from infrastructure.persistence.models.elastic.game import TwichGameDAO
+from infrastructure.persistence.models.elastic.stream import TwichStreamDAO
+from infrastructure.persistence.models.elastic.user import TwichUserDAO
+from shared.config import settings
+
+
+documents: list[Type[Document]] = [
+    TwichGameDAO,
+    TwichStreamDAO,
+    TwichUserDAO,
+]
+
+
+def alias_targets(connection: Elasticsearch, alias: str) -> list[str]:
+    """
+    alias_targets: Returns names of the indices the alias points to.
+
+    Args:
+        connection (Elasticsearch): Elastic search connection.
+        alias (str): Name of the alias.
+
+    Returns:
+        list[str]: Index names, empty if alias does not exist.
+    """
+
+    if not connection.indices.exists_alias(name=alias):
+        return []
+
+    return list(connection.indices.get_alias(name=alias))
+
+
+def running_reindex(connection: Elasticsearch, name: str) -> Optional[str]:
+    """
+    running_reindex: Returns id of the running reindex task into the index.
+
+    Args:
+        connection (Elasticsearch): Elastic search connection.
+        name (str): Name of the destination index.
+
+    Returns:
+        Optional[str]: Task id or None if there is no such task.
+    """
+
+    response: dict = connection.tasks.list(actions='indices:data/write/reindex', detailed=True)
+
+    for node in response.get('nodes', {}).values():
+        for task_id, task in node.get('tasks', {}).items():
+            if f'to [{name}]' in task.get('description', ''):
+                return task_id
+
+    return None
+
+
+def wait_for_task(
+    connection: Elasticsearch,
+    task_id: str,
+    poll_interval: float,
+    timeout: float,
+) -> None:
+    """
+    wait_for_task: Poll elastic search task until it is completed.
+    Task is left running on timeout, so a restarted migration waits for it again.
+
+    Args:
+        connection (Elasticsearch): Elastic search connection.
+        task_id (str): Task id.
+        poll_interval (float): Seconds between polls.
+        timeout (float): Seconds to wait for the task.
+
+    Raises:
+        RuntimeError: Raised when task has failed.
+        TimeoutError: Raised when task is not completed in time.
+    """
+
+    deadline: float = monotonic() + timeout
+
+    while True:
+        task: dict = connection.tasks.get(task_id=task_id)
+
+        if task.get('completed'):
+            break
+
+        if monotonic() >= deadline:
+            raise TimeoutError(f'Task {task_id} is not completed in {timeout} seconds.')
+
+        sleep(poll_interval)
+
+    failures: list = task.get('response', {}).get('failures', [])
+
+    if task.get('error') or failures:
+        raise RuntimeError(f'Task {task_id} has failed: {task.get("error") or failures}')
+
+
+def reindex(
+    connection: Elasticsearch,
+    document: Type[Document],
+    old_names: list[str],
+    name: str,
+    poll_interval: float,
+    timeout: float,
+    query: Optional[dict] = None,
+) -> None:
+    """
+    reindex: Copy documents of the old indices into the new one by a background task.
+
+    Args:
+        connection (Elasticsearch): Elastic search connection.
+        document (Type[Document]): Document class, which reindex script is applied.
+        old_names (list[str]): Names of the source indices.
+        name (str): Name of the destination index.
+        poll_interval (float): Seconds between polls of the reindex task.
+        timeout (float): Seconds to wait for the reindex task.
+        query (Optional[dict]): Query, selecting source documents. Defaults to all documents.
+    """
+
+    body: dict = {'source': {'index': old_names}, 'dest': {'index': name}}
+    script: Optional[str] = getattr(document, 'reindex_script', None)
+
+    if query:
+        body['source']['query'] = query
+
+    if script:
+        body['script'] = {'source': script, 'lang': 'painless'}
+
+    response: dict = connection.reindex(body=body, wait_for_completion=False)
+    wait_for_task(connection, response['task'], poll_interval, timeout)
+
+
+def block_writes(connection: Elasticsearch, names: list[str], blocked: bool) -> None:
+    """
+    block_writes: Set or clear write block of the indices.
+
+    Args:
+        connection (Elasticsearch): Elastic search connection.
+        names (list[str]): Index names.
+        blocked (bool): Whether writes are blocked.
+    """
+
+    connection.indices.put_settings(index=names, body={'index.blocks.write': blocked})
+
+
+def migrate_index(
+    connection: Elasticsearch,
+    document: Type[Document],
+    poll_interval: float = 1.0,
+    timeout: float = 3600.0,
+    catch_up_margin: timedelta = timedelta(minutes=10),
+) -> None:
+    """
+    migrate_index: Create versioned index of the document and point its alias to it.
+    Documents of the previous version (or of the legacy index with the alias name) are reindexed
+    into the new index, through the document reindex script if it has one, by a background task,
+    that is polled, so long reindexes are not cut by the request timeout. Writes stay open during
+    the bulk reindex. Then the old indices are write-blocked, documents parsed since the reindex
+    start (minus catch_up_margin, covering delivery lag) are reindexed again, and the alias is
+    switched in one atomic update. The write block is cleared if migration fails.
+
+    Migration is complete only when the alias points to the new index, so an interrupted one is
+    resumed on next start. Concurrent workers wait for the running reindex task, and a lost race
+    on the alias switch is detected by checking the alias target again.
+
+    Args:
+        connection (Elasticsearch): Elastic search connection.
+        document (Type[Document]): Document class with mapping and mapping version.
+        poll_interval (float): Seconds between polls of the reindex task.
+        timeout (float): Seconds to wait for each reindex task.
+        catch_up_margin (timedelta): How far before the reindex start the catch-up reindex reaches.
+    """
+
+    alias: str = document._index._name
+    name: str = f'{alias}_v{document.mapping_version}'
+
+    if name in alias_targets(connection, alias):
+        return
+
+    try:
+        document._index.clone(name=name).create(using=connection)
+    except RequestError as exception:
+        if exception.error != 'resource_already_exists_exception':
+            raise
+
+        task_id: Optional[str] = running_reindex(connection, name)
+
+        if task_id:
+            wait_for_task(connection, task_id, poll_interval, timeout)
+
+        if name in alias_targets(connection, alias):
+            return
+
+    old_names: list[str] = alias_targets(connection, alias)
+    actions: list[dict] = [{'add': {'index': name, 'alias': alias}}]
+
+    if old_names:
+        actions.extend({'remove': {'index': old_name, 'alias': alias}} for old_name in old_names)
+    elif connection.indices.exists(index=alias):
+        old_names = [alias]
+        actions.append({'remove_index': {'index': alias}})
+
+    if not old_names:
+        connection.indices.update_aliases(body={'actions': actions})
+
+        return
+
+    started_at: datetime = datetime.utcnow()
+    reindex(connection, document, old_names, name, poll_interval, timeout)
+    block_writes(connection, old_names, True)
+
+    try:
+        reindex(
+            connection,
+            document,
+            old_names,
+            name,
+            poll_interval,
+            timeout,
+            query={'range': {'parsed_at': {'gte': (started_at - catch_up_margin).isoformat()}}},
+        )
+        connection.indices.refresh(index=name)
+        connection.indices.update_aliases(body={'actions': actions})
+    except NotFoundError:
+        if name not in alias_targets(connection, alias):
+            block_writes(connection, old_names, False)
+            raise
+    except BaseException:
+        block_writes(connection, old_names, False)
+        raise
+
+
+def migrate_indices(db: ElasticSearchDatabase) -> None:
+    """
+    migrate_indices: Apply versioned mappings of all elastic search documents.
+
+    Args:
+        db (ElasticSearchDatabase): Elastic search database.
+    """
+
+    for document in documents:
+        migrate_index(db.connection, document)
+
+
+if __name__ == '__main__':
+    migrate_indices(
+        ElasticSearchDatabase(
+            protocol=settings.ELASTIC_PROTOCOL,
+            host=settings.ELASTIC_HOST,
+            port=settings.ELASTIC_PORT,
+        )
+    )
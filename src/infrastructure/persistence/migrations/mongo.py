@@ -0,0 +1,61 @@
+"""
+mongo.py: File, containing index migrations for mongo.
+"""
+
+
+import asyncio
+from typing import Type
+
+from mongoengine import Document
+from pymongo import IndexModel
+
+from infrastructure.persistence.connections.mongo.motor import MongoMotorDatabase
+from infrastructure.persistence.models.mongo.game import TwichGameDAO
+from infrastructure.persistence.models.mongo.stream import TwichStreamDAO
+from infrastructure.persistence.models.mongo.user import TwichUserDAO
+from shared.config import settings
+
+
+documents: list[Type[Document]] = [
+    TwichGameDAO,
+    TwichStreamDAO,
+    TwichUserDAO,
+]
+
+
+async def ensure_indexes(db: MongoMotorDatabase) -> None:
+    """
+    ensure_indexes: Create indexes, declared in meta of mongo documents.
+    Mongoengine creates them on first collection access only, so they are ensured at startup
+    whichever mongo driver is configured.
+
+    Args:
+        db (MongoMotorDatabase): Async mongo database.
+    """
+
+    for document in documents:
+        indexes: list[IndexModel] = [
+            IndexModel(
+                index_spec['fields'],
+                background=document._meta.get('index_background', False),
+                **{key: value for key, value in index_spec.items() if key != 'fields'},
+            )
+            for index_spec in document._meta['index_specs']
+        ]
+
+        await db.database[document._get_collection_name()].create_indexes(indexes)
+
+
+if __name__ == '__main__':
+    asyncio.run(
+        ensure_indexes(
+            MongoMotorDatabase(
+                db_name=settings.DB_MONGO_NAME,
+                username=settings.DB_MONGO_USERNAME,
+                password=settings.DB_MONGO_PASSWORD,
+                host=settings.DB_MONGO_HOST,
+                port=settings.DB_MONGO_PORT,
+                authentication_source=settings.DB_MONGO_AUTH_SOURCE,
+            )
+        )
+    )
@@ -3,9 +3,12 @@ game_model: File, containing twich game model for elastic search.
 """
 
 
+from typing import ClassVar
+
 from elasticsearch_dsl import (
     Date,
     Document,
+    Keyword,
     Long,
     Text,
 )
@@ -20,10 +23,12 @@ class TwichGameDAO(Document):
     """
 
     id: Long = Long()
-    name: Text = Text()
+    name: Text = Text(fields={'keyword': Keyword()})
     igdb_id: Text = Text()
     box_art_url: Text = Text()
     parsed_at: Date = Date(default_timezone='UTC')
 
+    mapping_version: ClassVar[int] = 2
+
     class Index:
         name: str = 'twich_game'
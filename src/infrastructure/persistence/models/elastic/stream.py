@@ -3,28 +3,18 @@ stream_model: File, containing twich stream model for elastic search.
 """
 
 
+from typing import ClassVar
+
 from elasticsearch_dsl import (
     Date,
     Document,
-    InnerDoc,
     Integer,
+    Keyword,
     Long,
-    Nested,
     Text,
 )
 
 
-class Tag(InnerDoc):
-    """
-    Tag: Class, that represents twich stream tag.
-
-    Args:
-        InnerDoc (_type_): Base superclass for Tag class.
-    """
-
-    tag: Text = Text()
-
-
 class TwichStreamDAO(Document):
     """
     TwichStreamDAO: Class, that represents twich stream document in mongo database.
@@ -35,17 +25,26 @@ class TwichStreamDAO(Document):
 
     id: Long = Long()
     user_id: Integer = Integer()
-    user_name: Text = Text()
-    user_login: Text = Text()
+    user_name: Text = Text(fields={'keyword': Keyword()})
+    user_login: Text = Text(fields={'keyword': Keyword()})
     game_id: Integer = Integer()
-    game_name: Text = Text()
-    language: Text = Text()
+    game_name: Text = Text(fields={'keyword': Keyword()})
+    language: Text = Text(fields={'keyword': Keyword()})
     title: Text = Text()
-    tags: Nested = Nested(Tag)
+    tags: Keyword = Keyword(multi=True)
     started_at: Date = Date(default_timezone='UTC')
     viewer_count: Integer = Integer()
-    type: Text = Text()
+    type: Text = Text(fields={'keyword': Keyword()})
     parsed_at: Date = Date(default_timezone='UTC')
 
+    mapping_version: ClassVar[int] = 3
+    reindex_script: ClassVar[str] = (
+        'if (ctx._source.tags != null) {'
+        ' def tags = [];'
+        ' for (tag in ctx._source.tags) { tags.add(tag instanceof Map ? tag.tag : tag); }'
+        ' ctx._source.tags = tags;'
+        ' }'
+    )
+
     class Index:
         name: str = 'twich_stream'
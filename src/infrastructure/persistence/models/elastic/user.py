@@ -3,9 +3,12 @@ user_model: File, containing twich user model for elastic search.
 """
 
 
+from typing import ClassVar
+
 from elasticsearch_dsl import (
     Date,
     Document,
+    Keyword,
     Long,
     Text,
 )
@@ -20,15 +23,17 @@ class TwichUserDAO(Document):
     """
 
     id: Long = Long()
-    login: Text = Text()
+    login: Text = Text(fields={'keyword': Keyword()})
     description: Text = Text()
-    display_name: Text = Text()
-    type: Text = Text()
-    broadcaster_type: Text = Text()
+    display_name: Text = Text(fields={'keyword': Keyword()})
+    type: Text = Text(fields={'keyword': Keyword()})
+    broadcaster_type: Text = Text(fields={'keyword': Keyword()})
     profile_image_url: Text = Text()
     offline_image_url: Text = Text()
     created_at: Date = Date(default_timezone='UTC')
     parsed_at: Date = Date(default_timezone='UTC')
 
+    mapping_version: ClassVar[int] = 2
+
     class Index:
         name: str = 'twich_user'
@@ -47,12 +47,15 @@ class TwichGameDAO(Document):
         default=datetime.utcnow,
     )
 
+    content_hash: StringField = StringField(
+        max_length=64,
+    )
+
     meta: dict = {
-        'ordering': ['-parsed_at'],
         'index_opts': {},
         'index_background': True,
         'index_cls': False,
         'auto_create_index': True,
         'auto_create_index_on_save': False,
-        'indexes': ['name'],
+        'indexes': ['name', ('-parsed_at', '-id')],
     }
@@ -82,12 +82,62 @@ class TwichStreamDAO(Document):
         default=datetime.utcnow,
     )
 
+    content_hash: StringField = StringField(
+        max_length=64,
+    )
+
     meta: dict = {
-        'ordering': ['-parsed_at'],
         'index_opts': {},
         'index_background': True,
         'index_cls': False,
         'auto_create_index': True,
         'auto_create_index_on_save': False,
-        'indexes': ['user_name', 'user_login', 'game_name'],
+        'indexes': [
+            'user_name',
+            ('user_login', '-parsed_at'),
+            'game_name',
+            ('-parsed_at', '-id'),
+        ],
+    }
+
+
+class TwichStreamSnapshotDAO(Document):
+    """
+    TwichStreamSnapshotDAO: Class, that represents twich stream snapshot in mongo time series.
+
+    Args:
+        Document (_type_): Base superclass for TwichStreamSnapshotDAO class.
+    """
+
+    stream_id: IntField = IntField(
+        min_value=0,
+        required=True,
+    )
+
+    user_login: StringField = StringField(
+        min_length=1,
+        max_length=128,
+    )
+
+    game_id: IntField = IntField(
+        min_value=0,
+    )
+
+    viewer_count: IntField = IntField(
+        min_value=0,
+    )
+
+    parsed_at: DateTimeField = DateTimeField(
+        required=True,
+    )
+
+    meta: dict = {
+        'index_cls': False,
+        'auto_create_index': False,
+        'timeseries': {
+            'timeField': 'parsed_at',
+            'metaField': 'stream_id',
+            'granularity': 'minutes',
+        },
+        'indexes': [('stream_id', 'parsed_at')],
     }
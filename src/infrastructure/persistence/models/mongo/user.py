@@ -69,12 +69,15 @@ class TwichUserDAO(Document):
         default=datetime.utcnow,
     )
 
+    content_hash: StringField = StringField(
+        max_length=64,
+    )
+
     meta: dict = {
-        'ordering': ['-parsed_at'],
         'index_opts': {},
         'index_background': True,
         'index_cls': False,
         'auto_create_index': True,
         'auto_create_index_on_save': False,
-        'indexes': ['login', 'display_name'],
+        'indexes': ['login', 'display_name', ('-parsed_at', '-id')],
     }
@@ -0,0 +1,59 @@
+"""
+cursor.py: File, containing keyset pagination cursor encoding.
+"""
+
+
+from base64 import (
+    urlsafe_b64decode,
+    urlsafe_b64encode,
+)
+from binascii import Error as BinasciiError
+from datetime import (
+    datetime,
+    timezone,
+)
+
+from application.exceptions import InvalidCursorException
+from shared.utils import (
+    json_dumps,
+    json_loads,
+)
+
+
+def encode_cursor(parsed_at: datetime, id: int) -> str:
+    """
+    encode_cursor: Encode (parsed_at, id) keyset position to opaque cursor token.
+
+    Args:
+        parsed_at (datetime): Parsed at of the last object of the page.
+        id (int): Identifier of the last object of the page.
+
+    Returns:
+        str: Cursor token.
+    """
+
+    if parsed_at.tzinfo is not None:
+        parsed_at = parsed_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return urlsafe_b64encode(json_dumps([parsed_at.isoformat(), int(id)])).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    decode_cursor: Decode opaque cursor token to (parsed_at, id) keyset position.
+
+    Args:
+        cursor (str): Cursor token.
+
+    Raises:
+        InvalidCursorException: Raised when cursor token is malformed.
+
+    Returns:
+        tuple[datetime, int]: Parsed at (naive, UTC) and identifier.
+    """
+
+    try:
+        parsed_at, id = json_loads(urlsafe_b64decode(cursor.encode('ascii')))
+        return datetime.fromisoformat(parsed_at), int(id)
+    except (BinasciiError, TypeError, ValueError):
+        raise InvalidCursorException('Cursor is not valid.')
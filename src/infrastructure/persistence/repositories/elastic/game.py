@@ -3,24 +3,37 @@ game.py: File, containing twich game elastic repository implementation.
 """
 
 
-from typing import Collection
+from datetime import timezone
+from typing import (
+    AsyncIterator,
+    Callable,
+    Collection,
+    Optional,
+)
 
-from automapper import mapper
+from elasticsearch.helpers import bulk
+from elasticsearch_dsl import Search
 
 from application.exceptions import ObjectNotFoundException
 from application.interfaces.repository import ITwichGameRepository
 from domain.models import TwichGame
 from infrastructure.persistence.connections.elastic.database import ElasticSearchDatabase
 from infrastructure.persistence.models.elastic.game import TwichGameDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.pit import scan_point_in_time
+from shared.utils import compile_mapper
 
 
 class TwichGameElasticRepository(ITwichGameRepository):
     def __init__(self, db: ElasticSearchDatabase) -> None:
         self.db: ElasticSearchDatabase = db
-        TwichGameDAO.init()
+        self.to_domain: Callable[[TwichGameDAO], TwichGame] = compile_mapper(TwichGame)
 
-    async def add_or_update(self, game: TwichGame) -> None:
-        game_persistence = TwichGameDAO(
+    def _to_dao(self, game: TwichGame) -> TwichGameDAO:
+        game_persistence: TwichGameDAO = TwichGameDAO(
             id=game.id,
             name=game.name,
             igdb_id=game.igdb_id,
@@ -28,33 +41,122 @@ class TwichGameElasticRepository(ITwichGameRepository):
             parsed_at=game.parsed_at,
         )
         game_persistence.meta.id = game_persistence.id
+
+        return game_persistence
+
+    async def add_or_update(self, game: TwichGame) -> None:
+        game_persistence: TwichGameDAO = self._to_dao(game)
         game_persistence.save()
 
         return
 
-    async def all(self) -> list[TwichGame]:
-        return [
-            mapper.to(TwichGame).map(game_persistence)
-            for game_persistence in TwichGameDAO.search().query()
+    async def add_or_update_many(self, games: list[TwichGame]) -> dict[int, str]:
+        if not games:
+            return {}
+
+        ids: dict[str, int] = {str(game.id): game.id for game in games}
+
+        _, errors = bulk(
+            self.db.connection,
+            [self._to_dao(game).to_dict(include_meta=True) for game in games],
+            raise_on_error=False,
+        )
+
+        return {ids[error['index']['_id']]: str(error['index'].get('error')) for error in errors}
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichGame]:
+        search: Search = TwichGameDAO.search().sort('-parsed_at', '-id')
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        for hit in scan_point_in_time(
+            self.db.connection,
+            TwichGameDAO._index._name,
+            search,
+            page_size,
+        ):
+            yield self.to_domain(TwichGameDAO.from_es(hit))
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[TwichGame], Optional[str]]:
+        search: Search = TwichGameDAO.search().sort('-parsed_at', '-id').extra(size=limit + 1)
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            search = search.extra(
+                search_after=[int(parsed_at.replace(tzinfo=timezone.utc).timestamp() * 1000), id],
+            )
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        game_persistences: list[TwichGameDAO] = list(search.execute())
+        next_cursor: Optional[str] = None
+
+        if len(game_persistences) > limit:
+            game_persistences = game_persistences[:limit]
+            next_cursor = encode_cursor(
+                game_persistences[-1].parsed_at,
+                game_persistences[-1].id,
+            )
+
+        games: list[TwichGame] = [
+            self.to_domain(game_persistence) for game_persistence in game_persistences
         ]
 
+        return games, next_cursor
+
     async def delete(self, game: TwichGame) -> None:
-        TwichGameDAO.search().query('match', name=game.name).delete()
+        TwichGameDAO.search().filter('term', name__keyword=game.name).delete()
 
         return
 
+    async def delete_by_id(self, id: int) -> TwichGame:
+        game: TwichGame = await self.get_by_id(id)
+        await self.delete(game)
+
+        return game
+
+    async def delete_game_by_name(self, name: str) -> TwichGame:
+        game: TwichGame = await self.get_game_by_name(name)
+        await self.delete(game)
+
+        return game
+
     async def get_by_id(self, id: int) -> TwichGame:
-        games: Collection[TwichGameDAO] = TwichGameDAO.search().query('match', id=id).execute()
+        game_persistence: Optional[TwichGameDAO] = TwichGameDAO.get(id=id, ignore=404)
 
-        if len(games) == 0:
+        if not game_persistence:
             raise ObjectNotFoundException('Game is not found.')
 
-        return mapper.to(TwichGame).map(next(iter(games)))
+        return self.to_domain(game_persistence)
+
+    async def get_many(self, ids: list[int]) -> list[TwichGame]:
+        if not ids:
+            return []
+
+        game_persistences: list[TwichGameDAO] = TwichGameDAO.mget(ids, missing='skip')
+
+        return [self.to_domain(game_persistence) for game_persistence in game_persistences]
 
     async def get_game_by_name(self, name: str) -> TwichGame:
-        games: Collection[TwichGameDAO] = TwichGameDAO.search().query('match', name=name).execute()
+        games: Collection[TwichGameDAO] = (
+            TwichGameDAO.search().filter('term', name__keyword=name).execute()
+        )
 
         if len(games) == 0:
             raise ObjectNotFoundException('Game is not found.')
 
-        return mapper.to(TwichGame).map(next(iter(games)))
+        return self.to_domain(next(iter(games)))
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        return {}
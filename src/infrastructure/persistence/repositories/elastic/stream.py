@@ -3,151 +3,180 @@ stream.py: File, containing twich stream elastic repository implementation.
 """
 
 
-from typing import Collection
+from datetime import timezone
+from typing import (
+    AsyncIterator,
+    Callable,
+    Collection,
+    Optional,
+)
+
+from elasticsearch.helpers import bulk
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Response
 
 from application.exceptions import ObjectNotFoundException
 from application.interfaces.repository import ITwichStreamRepository
 from domain.models import TwichStream
 from infrastructure.persistence.connections.elastic.database import ElasticSearchDatabase
-from infrastructure.persistence.models.elastic.stream import (
-    Tag,
-    TwichStreamDAO,
+from infrastructure.persistence.models.elastic.stream import TwichStreamDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
 )
+from infrastructure.persistence.repositories.pit import scan_point_in_time
+from shared.utils import compile_mapper
 
 
 class TwichStreamElasticRepository(ITwichStreamRepository):
     def __init__(self, db: ElasticSearchDatabase) -> None:
         self.db: ElasticSearchDatabase = db
-        TwichStreamDAO.init()
-
-    async def add_or_update(self, stream: TwichStream) -> None:
-        tags = []
-
-        for tag in stream.tags:
-            tags.append(Tag(tag=tag))
-
-        stream_persistence = TwichStreamDAO(
-            id=stream.id,
-            user_id=stream.user_id,
-            user_name=stream.user_name,
-            user_login=stream.user_login,
-            game_id=stream.game_id,
-            game_name=stream.game_name,
-            language=stream.language,
-            title=stream.title,
-            tags=tags,
-            started_at=stream.started_at,
-            viewer_count=stream.viewer_count,
-            type=stream.type,
-            parsed_at=stream.parsed_at,
+        self.to_domain: Callable[[TwichStreamDAO], TwichStream] = compile_mapper(
+            TwichStream,
+            converters=(('tags', list),),
+        )
+        self.to_dao: Callable[[TwichStream], TwichStreamDAO] = compile_mapper(
+            TwichStreamDAO,
+            fields_of=TwichStream,
         )
+
+    def _to_dao(self, stream: TwichStream) -> TwichStreamDAO:
+        stream_persistence: TwichStreamDAO = self.to_dao(stream)
         stream_persistence.meta.id = stream_persistence.id
+
+        return stream_persistence
+
+    async def add_or_update(self, stream: TwichStream) -> None:
+        stream_persistence: TwichStreamDAO = self._to_dao(stream)
         stream_persistence.save()
 
         return
 
-    async def all(self) -> list[TwichStream]:
-        streams = []
-
-        for stream in TwichStreamDAO.search().query():
-            tags = []
-
-            for tag in stream.tags:
-                tags.append(tag['tag'])
-
-            streams.append(
-                TwichStream(
-                    id=stream.id,
-                    user_id=stream.user_id,
-                    user_name=stream.user_name,
-                    user_login=stream.user_login,
-                    game_id=stream.game_id,
-                    game_name=stream.game_name,
-                    language=stream.language,
-                    title=stream.title,
-                    tags=tags,
-                    started_at=stream.started_at,
-                    viewer_count=stream.viewer_count,
-                    type=stream.type,
-                    parsed_at=stream.parsed_at,
-                )
+    async def add_or_update_many(self, streams: list[TwichStream]) -> dict[int, str]:
+        if not streams:
+            return {}
+
+        ids: dict[str, int] = {str(stream.id): stream.id for stream in streams}
+
+        _, errors = bulk(
+            self.db.connection,
+            [self._to_dao(stream).to_dict(include_meta=True) for stream in streams],
+            raise_on_error=False,
+        )
+
+        return {ids[error['index']['_id']]: str(error['index'].get('error')) for error in errors}
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichStream]:
+        search: Search = TwichStreamDAO.search().sort('-parsed_at', '-id')
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        for hit in scan_point_in_time(
+            self.db.connection,
+            TwichStreamDAO._index._name,
+            search,
+            page_size,
+        ):
+            yield self.to_domain(TwichStreamDAO.from_es(hit))
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+    ) -> tuple[list[TwichStream], Optional[str]]:
+        search: Search = TwichStreamDAO.search().sort('-parsed_at', '-id').extra(size=limit + 1)
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            search = search.extra(
+                search_after=[int(parsed_at.replace(tzinfo=timezone.utc).timestamp() * 1000), id],
             )
 
-        return streams
+        for tag in tags or []:
+            search = search.filter('term', tags=tag)
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        stream_persistences: list[TwichStreamDAO] = list(search.execute())
+        next_cursor: Optional[str] = None
+
+        if len(stream_persistences) > limit:
+            stream_persistences = stream_persistences[:limit]
+            next_cursor = encode_cursor(
+                stream_persistences[-1].parsed_at,
+                stream_persistences[-1].id,
+            )
+
+        streams: list[TwichStream] = [
+            self.to_domain(stream_persistence) for stream_persistence in stream_persistences
+        ]
+
+        return streams, next_cursor
 
     async def delete(self, stream: TwichStream) -> None:
-        TwichStreamDAO.search().query('match', user_login=stream.user_login).delete()
+        TwichStreamDAO.search().filter('term', user_login__keyword=stream.user_login).delete()
 
         return
 
+    async def delete_by_id(self, id: int) -> TwichStream:
+        stream: TwichStream = await self.get_by_id(id)
+        TwichStreamDAO(meta={'id': id}).delete(ignore=404)
+
+        return stream
+
+    async def delete_stream_by_user_login(self, user_login: str) -> TwichStream:
+        stream: TwichStream = await self.get_stream_by_user_login(user_login)
+        await self.delete(stream)
+
+        return stream
+
     async def get_by_id(self, id: int) -> TwichStream:
-        streams: Collection[TwichStreamDAO] = (
-            TwichStreamDAO.search()
-            .query(
-                'match',
-                id=id,
-            )
-            .execute()
-        )
+        stream_persistence: Optional[TwichStreamDAO] = TwichStreamDAO.get(id=id, ignore=404)
 
-        if len(streams) == 0:
+        if not stream_persistence:
             raise ObjectNotFoundException('Stream is not found.')
 
-        stream = next(iter(streams))
-
-        tags = []
-
-        for tag in stream.tags:
-            tags.append(tag['tag'])
-
-        return TwichStream(
-            id=stream.id,
-            user_id=stream.user_id,
-            user_name=stream.user_name,
-            user_login=stream.user_login,
-            game_id=stream.game_id,
-            game_name=stream.game_name,
-            language=stream.language,
-            title=stream.title,
-            tags=tags,
-            started_at=stream.started_at,
-            viewer_count=stream.viewer_count,
-            type=stream.type,
-            parsed_at=stream.parsed_at,
-        )
+        return self.to_domain(stream_persistence)
+
+    async def get_many(self, ids: list[int]) -> list[TwichStream]:
+        if not ids:
+            return []
+
+        stream_persistences: list[TwichStreamDAO] = TwichStreamDAO.mget(ids, missing='skip')
+
+        return [self.to_domain(stream_persistence) for stream_persistence in stream_persistences]
 
     async def get_stream_by_user_login(self, user_login: str) -> TwichStream:
         streams: Collection[TwichStreamDAO] = (
             TwichStreamDAO.search()
-            .query(
-                'match',
-                user_login=user_login,
+            .filter(
+                'term',
+                user_login__keyword=user_login,
             )
+            .sort('-parsed_at')
+            .extra(size=1)
             .execute()
         )
 
         if len(streams) == 0:
             raise ObjectNotFoundException('Stream is not found.')
 
-        stream = next(iter(streams))
-
-        tags = []
-
-        for tag in stream.tags:
-            tags.append(tag['tag'])
-
-        return TwichStream(
-            id=stream.id,
-            user_id=stream.user_id,
-            user_name=stream.user_name,
-            user_login=stream.user_login,
-            game_id=stream.game_id,
-            game_name=stream.game_name,
-            language=stream.language,
-            title=stream.title,
-            tags=tags,
-            started_at=stream.started_at,
-            viewer_count=stream.viewer_count,
-            type=stream.type,
-            parsed_at=stream.parsed_at,
-        )
+        return self.to_domain(next(iter(streams)))
+
+    async def get_tag_counts(self, size: int) -> dict[str, int]:
+        search: Search = TwichStreamDAO.search().extra(size=0)
+        search.aggs.bucket('tags', 'terms', field='tags', size=size)
+        response: Response = search.execute()
+
+        return {bucket.key: bucket.doc_count for bucket in response.aggregations.tags.buckets}
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        return {}
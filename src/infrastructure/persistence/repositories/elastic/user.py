@@ -3,24 +3,37 @@ user.py: File, containing twich user elastic repository implementation.
 """
 
 
-from typing import Collection
+from datetime import timezone
+from typing import (
+    AsyncIterator,
+    Callable,
+    Collection,
+    Optional,
+)
 
-from automapper import mapper
+from elasticsearch.helpers import bulk
+from elasticsearch_dsl import Search
 
 from application.exceptions import ObjectNotFoundException
 from application.interfaces.repository import ITwichUserRepository
 from domain.models import TwichUser
 from infrastructure.persistence.connections.elastic.database import ElasticSearchDatabase
 from infrastructure.persistence.models.elastic.user import TwichUserDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.pit import scan_point_in_time
+from shared.utils import compile_mapper
 
 
 class TwichUserElasticRepository(ITwichUserRepository):
     def __init__(self, db: ElasticSearchDatabase) -> None:
         self.db: ElasticSearchDatabase = db
-        TwichUserDAO.init()
+        self.to_domain: Callable[[TwichUserDAO], TwichUser] = compile_mapper(TwichUser)
 
-    async def add_or_update(self, user: TwichUser) -> None:
-        user_persistence = TwichUserDAO(
+    def _to_dao(self, user: TwichUser) -> TwichUserDAO:
+        user_persistence: TwichUserDAO = TwichUserDAO(
             id=user.id,
             login=user.login,
             description=user.description,
@@ -33,42 +46,119 @@ class TwichUserElasticRepository(ITwichUserRepository):
             parsed_at=user.parsed_at,
         )
         user_persistence.meta.id = user_persistence.id
+
+        return user_persistence
+
+    async def add_or_update(self, user: TwichUser) -> None:
+        user_persistence: TwichUserDAO = self._to_dao(user)
         user_persistence.save()
 
         return
 
-    async def all(self) -> list[TwichUser]:
-        return [
-            mapper.to(TwichUser).map(user_persistence)
-            for user_persistence in TwichUserDAO.search().query()
+    async def add_or_update_many(self, users: list[TwichUser]) -> dict[int, str]:
+        if not users:
+            return {}
+
+        ids: dict[str, int] = {str(user.id): user.id for user in users}
+
+        _, errors = bulk(
+            self.db.connection,
+            [self._to_dao(user).to_dict(include_meta=True) for user in users],
+            raise_on_error=False,
+        )
+
+        return {ids[error['index']['_id']]: str(error['index'].get('error')) for error in errors}
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichUser]:
+        search: Search = TwichUserDAO.search().sort('-parsed_at', '-id')
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        for hit in scan_point_in_time(
+            self.db.connection,
+            TwichUserDAO._index._name,
+            search,
+            page_size,
+        ):
+            yield self.to_domain(TwichUserDAO.from_es(hit))
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[TwichUser], Optional[str]]:
+        search: Search = TwichUserDAO.search().sort('-parsed_at', '-id').extra(size=limit + 1)
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            search = search.extra(
+                search_after=[int(parsed_at.replace(tzinfo=timezone.utc).timestamp() * 1000), id],
+            )
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        user_persistences: list[TwichUserDAO] = list(search.execute())
+        next_cursor: Optional[str] = None
+
+        if len(user_persistences) > limit:
+            user_persistences = user_persistences[:limit]
+            next_cursor = encode_cursor(
+                user_persistences[-1].parsed_at,
+                user_persistences[-1].id,
+            )
+
+        users: list[TwichUser] = [
+            self.to_domain(user_persistence) for user_persistence in user_persistences
         ]
 
+        return users, next_cursor
+
     async def delete(self, user: TwichUser) -> None:
-        TwichUserDAO.search().query('match', login=user.login).delete()
+        TwichUserDAO.search().filter('term', login__keyword=user.login).delete()
 
         return
 
+    async def delete_by_id(self, id: int) -> TwichUser:
+        user: TwichUser = await self.get_by_id(id)
+        await self.delete(user)
+
+        return user
+
+    async def delete_user_by_login(self, login: str) -> TwichUser:
+        user: TwichUser = await self.get_user_by_login(login)
+        await self.delete(user)
+
+        return user
+
     async def get_by_id(self, id: int) -> TwichUser:
-        users: Collection[TwichUserDAO] = (
-            TwichUserDAO.search()
-            .query(
-                'match',
-                id=id,
-            )
-            .execute()
-        )
+        user_persistence: Optional[TwichUserDAO] = TwichUserDAO.get(id=id, ignore=404)
 
-        if len(users) == 0:
+        if not user_persistence:
             raise ObjectNotFoundException('User is not found.')
 
-        return mapper.to(TwichUser).map(next(iter(users)))
+        return self.to_domain(user_persistence)
+
+    async def get_many(self, ids: list[int]) -> list[TwichUser]:
+        if not ids:
+            return []
+
+        user_persistences: list[TwichUserDAO] = TwichUserDAO.mget(ids, missing='skip')
+
+        return [self.to_domain(user_persistence) for user_persistence in user_persistences]
 
     async def get_user_by_login(self, login: str) -> TwichUser:
         users: Collection[TwichUserDAO] = (
             TwichUserDAO.search()
-            .query(
-                'match',
-                login=login,
+            .filter(
+                'term',
+                login__keyword=login,
             )
             .execute()
         )
@@ -76,4 +166,7 @@ class TwichUserElasticRepository(ITwichUserRepository):
         if len(users) == 0:
             raise ObjectNotFoundException('User is not found.')
 
-        return mapper.to(TwichUser).map(next(iter(users)))
+        return self.to_domain(next(iter(users)))
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        return {}
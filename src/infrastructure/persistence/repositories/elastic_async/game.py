@@ -0,0 +1,180 @@
+"""
+game.py: File, containing twich game async elastic repository implementation.
+"""
+
+
+from datetime import timezone
+from typing import (
+    AsyncIterator,
+    Callable,
+    Optional,
+)
+
+from elasticsearch.helpers import async_bulk
+from elasticsearch_dsl import Search
+
+from application.exceptions import ObjectNotFoundException
+from application.interfaces.repository import ITwichGameRepository
+from domain.models import TwichGame
+from infrastructure.persistence.connections.elastic.async_database import (
+    ElasticSearchAsyncDatabase,
+)
+from infrastructure.persistence.models.elastic.game import TwichGameDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.pit import async_scan_point_in_time
+from shared.utils import compile_mapper
+
+
+class TwichGameAsyncElasticRepository(ITwichGameRepository):
+    def __init__(self, db: ElasticSearchAsyncDatabase) -> None:
+        self.db: ElasticSearchAsyncDatabase = db
+        self.index: str = TwichGameDAO._index._name
+        self.to_domain: Callable[[TwichGameDAO], TwichGame] = compile_mapper(TwichGame)
+
+    def _to_dao(self, game: TwichGame) -> TwichGameDAO:
+        game_persistence: TwichGameDAO = TwichGameDAO(
+            id=game.id,
+            name=game.name,
+            igdb_id=game.igdb_id,
+            box_art_url=game.box_art_url,
+            parsed_at=game.parsed_at,
+        )
+        game_persistence.meta.id = game_persistence.id
+
+        return game_persistence
+
+    async def _execute(self, search: Search) -> list[TwichGameDAO]:
+        response: dict = await self.db.connection.search(index=self.index, body=search.to_dict())
+
+        return [TwichGameDAO.from_es(hit) for hit in response['hits']['hits']]
+
+    async def add_or_update(self, game: TwichGame) -> None:
+        game_persistence: TwichGameDAO = self._to_dao(game)
+        await self.db.connection.index(
+            index=self.index,
+            id=game_persistence.meta.id,
+            body=game_persistence.to_dict(),
+        )
+
+        return
+
+    async def add_or_update_many(self, games: list[TwichGame]) -> dict[int, str]:
+        if not games:
+            return {}
+
+        ids: dict[str, int] = {str(game.id): game.id for game in games}
+
+        _, errors = await async_bulk(
+            self.db.connection,
+            [self._to_dao(game).to_dict(include_meta=True) for game in games],
+            raise_on_error=False,
+        )
+
+        return {ids[error['index']['_id']]: str(error['index'].get('error')) for error in errors}
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichGame]:
+        search: Search = TwichGameDAO.search().sort('-parsed_at', '-id')
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        async for hit in async_scan_point_in_time(
+            self.db.connection,
+            self.index,
+            search,
+            page_size,
+        ):
+            yield self.to_domain(TwichGameDAO.from_es(hit))
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[TwichGame], Optional[str]]:
+        search: Search = TwichGameDAO.search().sort('-parsed_at', '-id').extra(size=limit + 1)
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            search = search.extra(
+                search_after=[int(parsed_at.replace(tzinfo=timezone.utc).timestamp() * 1000), id],
+            )
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        game_persistences: list[TwichGameDAO] = await self._execute(search)
+        next_cursor: Optional[str] = None
+
+        if len(game_persistences) > limit:
+            game_persistences = game_persistences[:limit]
+            next_cursor = encode_cursor(
+                game_persistences[-1].parsed_at,
+                game_persistences[-1].id,
+            )
+
+        games: list[TwichGame] = [
+            self.to_domain(game_persistence) for game_persistence in game_persistences
+        ]
+
+        return games, next_cursor
+
+    async def delete(self, game: TwichGame) -> None:
+        await self.db.connection.delete_by_query(
+            index=self.index,
+            body=TwichGameDAO.search().filter('term', name__keyword=game.name).to_dict(),
+        )
+
+        return
+
+    async def delete_by_id(self, id: int) -> TwichGame:
+        game: TwichGame = await self.get_by_id(id)
+        await self.delete(game)
+
+        return game
+
+    async def delete_game_by_name(self, name: str) -> TwichGame:
+        game: TwichGame = await self.get_game_by_name(name)
+        await self.delete(game)
+
+        return game
+
+    async def get_by_id(self, id: int) -> TwichGame:
+        response: dict = await self.db.connection.get(index=self.index, id=id, ignore=404)
+
+        if not response.get('found'):
+            raise ObjectNotFoundException('Game is not found.')
+
+        return self.to_domain(TwichGameDAO.from_es(response))
+
+    async def get_many(self, ids: list[int]) -> list[TwichGame]:
+        if not ids:
+            return []
+
+        response: dict = await self.db.connection.mget(index=self.index, body={'ids': ids})
+
+        return [
+            self.to_domain(TwichGameDAO.from_es(document))
+            for document in response['docs']
+            if document.get('found')
+        ]
+
+    async def get_game_by_name(self, name: str) -> TwichGame:
+        games: list[TwichGameDAO] = await self._execute(
+            TwichGameDAO.search().filter('term', name__keyword=name),
+        )
+
+        if not games:
+            raise ObjectNotFoundException('Game is not found.')
+
+        return self.to_domain(games[0])
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        return {}
@@ -0,0 +1,200 @@
+"""
+stream.py: File, containing twich stream async elastic repository implementation.
+"""
+
+
+from datetime import timezone
+from typing import (
+    AsyncIterator,
+    Callable,
+    Optional,
+)
+
+from elasticsearch.helpers import async_bulk
+from elasticsearch_dsl import Search
+
+from application.exceptions import ObjectNotFoundException
+from application.interfaces.repository import ITwichStreamRepository
+from domain.models import TwichStream
+from infrastructure.persistence.connections.elastic.async_database import (
+    ElasticSearchAsyncDatabase,
+)
+from infrastructure.persistence.models.elastic.stream import TwichStreamDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.pit import async_scan_point_in_time
+from shared.utils import compile_mapper
+
+
+class TwichStreamAsyncElasticRepository(ITwichStreamRepository):
+    def __init__(self, db: ElasticSearchAsyncDatabase) -> None:
+        self.db: ElasticSearchAsyncDatabase = db
+        self.index: str = TwichStreamDAO._index._name
+        self.to_domain: Callable[[TwichStreamDAO], TwichStream] = compile_mapper(
+            TwichStream,
+            converters=(('tags', list),),
+        )
+        self.to_dao: Callable[[TwichStream], TwichStreamDAO] = compile_mapper(
+            TwichStreamDAO,
+            fields_of=TwichStream,
+        )
+
+    def _to_dao(self, stream: TwichStream) -> TwichStreamDAO:
+        stream_persistence: TwichStreamDAO = self.to_dao(stream)
+        stream_persistence.meta.id = stream_persistence.id
+
+        return stream_persistence
+
+    async def _execute(self, search: Search) -> list[TwichStreamDAO]:
+        response: dict = await self.db.connection.search(index=self.index, body=search.to_dict())
+
+        return [TwichStreamDAO.from_es(hit) for hit in response['hits']['hits']]
+
+    async def add_or_update(self, stream: TwichStream) -> None:
+        stream_persistence: TwichStreamDAO = self._to_dao(stream)
+        await self.db.connection.index(
+            index=self.index,
+            id=stream_persistence.meta.id,
+            body=stream_persistence.to_dict(),
+        )
+
+        return
+
+    async def add_or_update_many(self, streams: list[TwichStream]) -> dict[int, str]:
+        if not streams:
+            return {}
+
+        ids: dict[str, int] = {str(stream.id): stream.id for stream in streams}
+
+        _, errors = await async_bulk(
+            self.db.connection,
+            [self._to_dao(stream).to_dict(include_meta=True) for stream in streams],
+            raise_on_error=False,
+        )
+
+        return {ids[error['index']['_id']]: str(error['index'].get('error')) for error in errors}
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichStream]:
+        search: Search = TwichStreamDAO.search().sort('-parsed_at', '-id')
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        async for hit in async_scan_point_in_time(
+            self.db.connection,
+            self.index,
+            search,
+            page_size,
+        ):
+            yield self.to_domain(TwichStreamDAO.from_es(hit))
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+    ) -> tuple[list[TwichStream], Optional[str]]:
+        search: Search = TwichStreamDAO.search().sort('-parsed_at', '-id').extra(size=limit + 1)
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            search = search.extra(
+                search_after=[int(parsed_at.replace(tzinfo=timezone.utc).timestamp() * 1000), id],
+            )
+
+        for tag in tags or []:
+            search = search.filter('term', tags=tag)
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        stream_persistences: list[TwichStreamDAO] = await self._execute(search)
+        next_cursor: Optional[str] = None
+
+        if len(stream_persistences) > limit:
+            stream_persistences = stream_persistences[:limit]
+            next_cursor = encode_cursor(
+                stream_persistences[-1].parsed_at,
+                stream_persistences[-1].id,
+            )
+
+        streams: list[TwichStream] = [
+            self.to_domain(stream_persistence) for stream_persistence in stream_persistences
+        ]
+
+        return streams, next_cursor
+
+    async def delete(self, stream: TwichStream) -> None:
+        await self.db.connection.delete_by_query(
+            index=self.index,
+            body=TwichStreamDAO.search()
+            .filter('term', user_login__keyword=stream.user_login)
+            .to_dict(),
+        )
+
+        return
+
+    async def delete_by_id(self, id: int) -> TwichStream:
+        stream: TwichStream = await self.get_by_id(id)
+        await self.db.connection.delete(index=self.index, id=id, ignore=404)
+
+        return stream
+
+    async def delete_stream_by_user_login(self, user_login: str) -> TwichStream:
+        stream: TwichStream = await self.get_stream_by_user_login(user_login)
+        await self.delete(stream)
+
+        return stream
+
+    async def get_by_id(self, id: int) -> TwichStream:
+        response: dict = await self.db.connection.get(index=self.index, id=id, ignore=404)
+
+        if not response.get('found'):
+            raise ObjectNotFoundException('Stream is not found.')
+
+        return self.to_domain(TwichStreamDAO.from_es(response))
+
+    async def get_many(self, ids: list[int]) -> list[TwichStream]:
+        if not ids:
+            return []
+
+        response: dict = await self.db.connection.mget(index=self.index, body={'ids': ids})
+
+        return [
+            self.to_domain(TwichStreamDAO.from_es(document))
+            for document in response['docs']
+            if document.get('found')
+        ]
+
+    async def get_stream_by_user_login(self, user_login: str) -> TwichStream:
+        streams: list[TwichStreamDAO] = await self._execute(
+            TwichStreamDAO.search()
+            .filter('term', user_login__keyword=user_login)
+            .sort('-parsed_at')
+            .extra(size=1),
+        )
+
+        if not streams:
+            raise ObjectNotFoundException('Stream is not found.')
+
+        return self.to_domain(streams[0])
+
+    async def get_tag_counts(self, size: int) -> dict[str, int]:
+        search: Search = TwichStreamDAO.search().extra(size=0)
+        search.aggs.bucket('tags', 'terms', field='tags', size=size)
+        response: dict = await self.db.connection.search(index=self.index, body=search.to_dict())
+
+        return {
+            bucket['key']: bucket['doc_count']
+            for bucket in response['aggregations']['tags']['buckets']
+        }
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        return {}
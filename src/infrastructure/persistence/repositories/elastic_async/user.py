@@ -0,0 +1,185 @@
+"""
+user.py: File, containing twich user async elastic repository implementation.
+"""
+
+
+from datetime import timezone
+from typing import (
+    AsyncIterator,
+    Callable,
+    Optional,
+)
+
+from elasticsearch.helpers import async_bulk
+from elasticsearch_dsl import Search
+
+from application.exceptions import ObjectNotFoundException
+from application.interfaces.repository import ITwichUserRepository
+from domain.models import TwichUser
+from infrastructure.persistence.connections.elastic.async_database import (
+    ElasticSearchAsyncDatabase,
+)
+from infrastructure.persistence.models.elastic.user import TwichUserDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.pit import async_scan_point_in_time
+from shared.utils import compile_mapper
+
+
+class TwichUserAsyncElasticRepository(ITwichUserRepository):
+    def __init__(self, db: ElasticSearchAsyncDatabase) -> None:
+        self.db: ElasticSearchAsyncDatabase = db
+        self.index: str = TwichUserDAO._index._name
+        self.to_domain: Callable[[TwichUserDAO], TwichUser] = compile_mapper(TwichUser)
+
+    def _to_dao(self, user: TwichUser) -> TwichUserDAO:
+        user_persistence: TwichUserDAO = TwichUserDAO(
+            id=user.id,
+            login=user.login,
+            description=user.description,
+            display_name=user.display_name,
+            type=user.type,
+            broadcaster_type=user.broadcaster_type,
+            profile_image_url=user.profile_image_url,
+            offline_image_url=user.offline_image_url,
+            created_at=user.created_at,
+            parsed_at=user.parsed_at,
+        )
+        user_persistence.meta.id = user_persistence.id
+
+        return user_persistence
+
+    async def _execute(self, search: Search) -> list[TwichUserDAO]:
+        response: dict = await self.db.connection.search(index=self.index, body=search.to_dict())
+
+        return [TwichUserDAO.from_es(hit) for hit in response['hits']['hits']]
+
+    async def add_or_update(self, user: TwichUser) -> None:
+        user_persistence: TwichUserDAO = self._to_dao(user)
+        await self.db.connection.index(
+            index=self.index,
+            id=user_persistence.meta.id,
+            body=user_persistence.to_dict(),
+        )
+
+        return
+
+    async def add_or_update_many(self, users: list[TwichUser]) -> dict[int, str]:
+        if not users:
+            return {}
+
+        ids: dict[str, int] = {str(user.id): user.id for user in users}
+
+        _, errors = await async_bulk(
+            self.db.connection,
+            [self._to_dao(user).to_dict(include_meta=True) for user in users],
+            raise_on_error=False,
+        )
+
+        return {ids[error['index']['_id']]: str(error['index'].get('error')) for error in errors}
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichUser]:
+        search: Search = TwichUserDAO.search().sort('-parsed_at', '-id')
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        async for hit in async_scan_point_in_time(
+            self.db.connection,
+            self.index,
+            search,
+            page_size,
+        ):
+            yield self.to_domain(TwichUserDAO.from_es(hit))
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[TwichUser], Optional[str]]:
+        search: Search = TwichUserDAO.search().sort('-parsed_at', '-id').extra(size=limit + 1)
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            search = search.extra(
+                search_after=[int(parsed_at.replace(tzinfo=timezone.utc).timestamp() * 1000), id],
+            )
+
+        if fields:
+            search = search.source(['id', 'parsed_at', *fields])
+
+        user_persistences: list[TwichUserDAO] = await self._execute(search)
+        next_cursor: Optional[str] = None
+
+        if len(user_persistences) > limit:
+            user_persistences = user_persistences[:limit]
+            next_cursor = encode_cursor(
+                user_persistences[-1].parsed_at,
+                user_persistences[-1].id,
+            )
+
+        users: list[TwichUser] = [
+            self.to_domain(user_persistence) for user_persistence in user_persistences
+        ]
+
+        return users, next_cursor
+
+    async def delete(self, user: TwichUser) -> None:
+        await self.db.connection.delete_by_query(
+            index=self.index,
+            body=TwichUserDAO.search().filter('term', login__keyword=user.login).to_dict(),
+        )
+
+        return
+
+    async def delete_by_id(self, id: int) -> TwichUser:
+        user: TwichUser = await self.get_by_id(id)
+        await self.delete(user)
+
+        return user
+
+    async def delete_user_by_login(self, login: str) -> TwichUser:
+        user: TwichUser = await self.get_user_by_login(login)
+        await self.delete(user)
+
+        return user
+
+    async def get_by_id(self, id: int) -> TwichUser:
+        response: dict = await self.db.connection.get(index=self.index, id=id, ignore=404)
+
+        if not response.get('found'):
+            raise ObjectNotFoundException('User is not found.')
+
+        return self.to_domain(TwichUserDAO.from_es(response))
+
+    async def get_many(self, ids: list[int]) -> list[TwichUser]:
+        if not ids:
+            return []
+
+        response: dict = await self.db.connection.mget(index=self.index, body={'ids': ids})
+
+        return [
+            self.to_domain(TwichUserDAO.from_es(document))
+            for document in response['docs']
+            if document.get('found')
+        ]
+
+    async def get_user_by_login(self, login: str) -> TwichUser:
+        users: list[TwichUserDAO] = await self._execute(
+            TwichUserDAO.search().filter('term', login__keyword=login),
+        )
+
+        if not users:
+            raise ObjectNotFoundException('User is not found.')
+
+        return self.to_domain(users[0])
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        return {}
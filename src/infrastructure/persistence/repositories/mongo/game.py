@@ -3,56 +3,221 @@ game.py: File, containing twich game mongo repository implementation.
 """
 
 
-from typing import Optional
-
-from automapper import mapper
+from typing import (
+    AsyncIterator,
+    Callable,
+    Optional,
+    Union,
+)
+
+from mongoengine import (
+    Q,
+    QuerySet,
+)
+from pymongo import (
+    UpdateOne,
+    WriteConcern,
+)
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
 
 from application.exceptions import ObjectNotFoundException
 from application.interfaces.repository import ITwichGameRepository
 from domain.models import TwichGame
 from infrastructure.persistence.connections.mongo.database import MongoDatabase
 from infrastructure.persistence.models.mongo.game import TwichGameDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.update import build_update
+from shared.utils import compile_mapper
 
 
 class TwichGameMongoRepository(ITwichGameRepository):
-    def __init__(self, db: MongoDatabase) -> None:
+    def __init__(
+        self,
+        db: MongoDatabase,
+        write_concern: Optional[Union[int, str]] = None,
+    ) -> None:
         self.db: MongoDatabase = db
+        self.collection: Collection = TwichGameDAO._get_collection().with_options(
+            write_concern=WriteConcern(w=write_concern),
+        )
+        self.to_domain: Callable[[dict], TwichGame] = compile_mapper(
+            TwichGame,
+            from_dict=True,
+            aliases=(('id', '_id'),),
+        )
+
+    def _to_update(self, game: TwichGame, stored_document: Optional[dict]) -> Optional[dict]:
+        return build_update(
+            {
+                'name': game.name,
+                'igdb_id': game.igdb_id,
+                'box_art_url': game.box_art_url,
+                'parsed_at': game.parsed_at,
+                'content_hash': game.content_hash,
+            },
+            {},
+            stored_document,
+        )
+
+    def _get_stored_documents(self, ids: list[int]) -> dict[int, dict]:
+        return {
+            game_document['_id']: game_document
+            for game_document in self.collection.find({'_id': {'$in': ids}})
+        }
 
     async def add_or_update(self, game: TwichGame) -> None:
-        game_persistence = TwichGameDAO(
-            id=game.id,
-            name=game.name,
-            igdb_id=game.igdb_id,
-            box_art_url=game.box_art_url,
-            parsed_at=game.parsed_at,
+        update: Optional[dict] = self._to_update(
+            game,
+            self.collection.find_one({'_id': int(game.id)}),
         )
-        game_persistence.save()
+
+        if update:
+            self.collection.update_one({'_id': int(game.id)}, update, upsert=True)
 
         return
 
-    async def all(self) -> list[TwichGame]:
-        return [
-            mapper.to(TwichGame).map(game_persistence) for game_persistence in TwichGameDAO.objects
-        ]
+    async def add_or_update_many(self, games: list[TwichGame]) -> dict[int, str]:
+        if not games:
+            return {}
+
+        failures: dict[int, str] = {}
+        requests: list[UpdateOne] = []
+        request_ids: list[int] = []
+        stored_documents: dict[int, dict] = self._get_stored_documents(
+            [game.id for game in games],
+        )
+
+        for game in games:
+            try:
+                update: Optional[dict] = self._to_update(
+                    game,
+                    stored_documents.get(int(game.id)),
+                )
+            except (TypeError, ValueError) as exc:
+                failures[game.id] = str(exc)
+                continue
+
+            if not update:
+                continue
+
+            requests.append(UpdateOne({'_id': int(game.id)}, update, upsert=True))
+            request_ids.append(game.id)
+
+        if not requests:
+            return failures
+
+        try:
+            self.collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details['writeErrors']:
+                failures[request_ids[error['index']]] = error['errmsg']
+
+        return failures
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichGame]:
+        queryset: QuerySet = TwichGameDAO.objects.order_by('-parsed_at', '-id').batch_size(
+            page_size
+        )
+
+        if fields:
+            queryset = queryset.only('id', 'parsed_at', *fields)
+
+        for game_document in queryset.as_pymongo():
+            yield self.to_domain(game_document)
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[TwichGame], Optional[str]]:
+        queryset: QuerySet = TwichGameDAO.objects
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(parsed_at__lt=parsed_at) | Q(parsed_at=parsed_at, id__lt=id),
+            )
+
+        if fields:
+            queryset = queryset.only('id', 'parsed_at', *fields)
+
+        game_documents: list[dict] = list(
+            queryset.order_by('-parsed_at', '-id').limit(limit + 1).as_pymongo(),
+        )
+        next_cursor: Optional[str] = None
+
+        if len(game_documents) > limit:
+            game_documents = game_documents[:limit]
+            next_cursor = encode_cursor(
+                game_documents[-1]['parsed_at'],
+                game_documents[-1]['_id'],
+            )
+
+        games: list[TwichGame] = [self.to_domain(game_document) for game_document in game_documents]
+
+        return games, next_cursor
 
     async def delete(self, game: TwichGame) -> None:
-        for game_persistence in TwichGameDAO.objects(name=game.name):
-            game_persistence.delete()
+        TwichGameDAO.objects(name=game.name).delete()
 
         return
 
-    async def get_by_id(self, id: int) -> TwichGame:
-        game_persistence: Optional[TwichGameDAO] = TwichGameDAO.objects(id=id).first()
+    async def delete_by_id(self, id: int) -> TwichGame:
+        game_persistence: Optional[TwichGameDAO] = TwichGameDAO.objects(
+            id=id,
+        ).modify(remove=True)
 
         if not game_persistence:
             raise ObjectNotFoundException('Game is not found.')
 
-        return mapper.to(TwichGame).map(game_persistence)
+        return self.to_domain(game_persistence.to_mongo())
 
-    async def get_game_by_name(self, name: str) -> TwichGame:
-        game_persistence: Optional[TwichGameDAO] = TwichGameDAO.objects(name=name).first()
+    async def delete_game_by_name(self, name: str) -> TwichGame:
+        game_persistence: Optional[TwichGameDAO] = TwichGameDAO.objects(
+            name=name,
+        ).modify(remove=True)
 
         if not game_persistence:
             raise ObjectNotFoundException('Game is not found.')
 
-        return mapper.to(TwichGame).map(game_persistence)
+        return self.to_domain(game_persistence.to_mongo())
+
+    async def get_by_id(self, id: int) -> TwichGame:
+        game_document: Optional[dict] = TwichGameDAO.objects(id=id).as_pymongo().first()
+
+        if not game_document:
+            raise ObjectNotFoundException('Game is not found.')
+
+        return self.to_domain(game_document)
+
+    async def get_many(self, ids: list[int]) -> list[TwichGame]:
+        game_documents: dict[int, dict] = {
+            game_document['_id']: game_document
+            for game_document in TwichGameDAO.objects(id__in=ids).as_pymongo()
+        }
+
+        return [self.to_domain(game_documents[int(id)]) for id in ids if int(id) in game_documents]
+
+    async def get_game_by_name(self, name: str) -> TwichGame:
+        game_document: Optional[dict] = TwichGameDAO.objects(name=name).as_pymongo().first()
+
+        if not game_document:
+            raise ObjectNotFoundException('Game is not found.')
+
+        return self.to_domain(game_document)
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        content_hashes: dict[int, str] = dict(
+            TwichGameDAO.objects(id__in=ids).scalar('id', 'content_hash'),
+        )
+
+        return {id: content_hashes[int(id)] for id in ids if int(id) in content_hashes}
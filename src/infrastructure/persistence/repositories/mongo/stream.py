@@ -3,101 +3,332 @@ stream.py: File, containing twich stream mongo repository implementation.
 """
 
 
-from typing import Optional
+from datetime import datetime
+from typing import (
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Optional,
+    Union,
+)
 
-from automapper import mapper
+from mongoengine import (
+    Q,
+    QuerySet,
+)
+from pymongo import (
+    UpdateOne,
+    WriteConcern,
+)
+from pymongo.collection import Collection
+from pymongo.errors import (
+    BulkWriteError,
+    CollectionInvalid,
+)
 
 from application.exceptions import ObjectNotFoundException
-from application.interfaces.repository import ITwichStreamRepository
-from domain.models import TwichStream
+from application.interfaces.repository import (
+    ITwichStreamHistoryRepository,
+    ITwichStreamRepository,
+)
+from domain.models import (
+    TwichStream,
+    TwichStreamSnapshot,
+)
 from infrastructure.persistence.connections.mongo.database import MongoDatabase
-from infrastructure.persistence.models.mongo.stream import TwichStreamDAO
+from infrastructure.persistence.models.mongo.stream import (
+    TwichStreamDAO,
+    TwichStreamSnapshotDAO,
+)
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.update import build_update
+from shared.utils import compile_mapper
 
 
 class TwichStreamMongoRepository(ITwichStreamRepository):
-    def __init__(self, db: MongoDatabase) -> None:
+    def __init__(
+        self,
+        db: MongoDatabase,
+        write_concern: Optional[Union[int, str]] = None,
+    ) -> None:
         self.db: MongoDatabase = db
+        self.collection: Collection = TwichStreamDAO._get_collection().with_options(
+            write_concern=WriteConcern(w=write_concern),
+        )
+        self.to_domain: Callable[[dict], TwichStream] = compile_mapper(
+            TwichStream,
+            from_dict=True,
+            aliases=(('id', '_id'),),
+        )
+
+    def _to_update(self, stream: TwichStream, stored_document: Optional[dict]) -> Optional[dict]:
+        return build_update(
+            {
+                'user_name': stream.user_name,
+                'user_login': stream.user_login,
+                'game_id': int(stream.game_id),
+                'game_name': stream.game_name,
+                'language': stream.language,
+                'title': stream.title,
+                'tags': stream.tags,
+                'viewer_count': stream.viewer_count,
+                'type': stream.type,
+                'parsed_at': stream.parsed_at,
+                'content_hash': stream.content_hash,
+            },
+            {
+                'user_id': int(stream.user_id),
+                'started_at': stream.started_at,
+            },
+            stored_document,
+        )
+
+    def _get_stored_documents(self, ids: list[int]) -> dict[int, dict]:
+        return {
+            stream_document['_id']: stream_document
+            for stream_document in self.collection.find({'_id': {'$in': ids}})
+        }
 
     async def add_or_update(self, stream: TwichStream) -> None:
-        stream_persistence = TwichStreamDAO(
-            id=stream.id,
-            user_id=stream.user_id,
-            user_name=stream.user_name,
-            user_login=stream.user_login,
-            game_id=stream.game_id,
-            game_name=stream.game_name,
-            language=stream.language,
-            title=stream.title,
-            tags=stream.tags,
-            started_at=stream.started_at,
-            viewer_count=stream.viewer_count,
-            type=stream.type,
-            parsed_at=stream.parsed_at,
+        update: Optional[dict] = self._to_update(
+            stream,
+            self.collection.find_one({'_id': int(stream.id)}),
         )
-        stream_persistence.save()
+
+        if update:
+            self.collection.update_one({'_id': int(stream.id)}, update, upsert=True)
 
         return
 
-    async def all(self) -> list[TwichStream]:
-        return [
-            mapper.to(TwichStream).map(stream_persistence)
-            for stream_persistence in TwichStreamDAO.objects
+    async def add_or_update_many(self, streams: list[TwichStream]) -> dict[int, str]:
+        if not streams:
+            return {}
+
+        failures: dict[int, str] = {}
+        requests: list[UpdateOne] = []
+        request_ids: list[int] = []
+        stored_documents: dict[int, dict] = self._get_stored_documents(
+            [stream.id for stream in streams],
+        )
+
+        for stream in streams:
+            try:
+                update: Optional[dict] = self._to_update(
+                    stream,
+                    stored_documents.get(int(stream.id)),
+                )
+            except (TypeError, ValueError) as exc:
+                failures[stream.id] = str(exc)
+                continue
+
+            if not update:
+                continue
+
+            requests.append(UpdateOne({'_id': int(stream.id)}, update, upsert=True))
+            request_ids.append(stream.id)
+
+        if not requests:
+            return failures
+
+        try:
+            self.collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details['writeErrors']:
+                failures[request_ids[error['index']]] = error['errmsg']
+
+        return failures
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichStream]:
+        queryset: QuerySet = TwichStreamDAO.objects.order_by('-parsed_at', '-id').batch_size(
+            page_size
+        )
+
+        if fields:
+            queryset = queryset.only('id', 'parsed_at', *fields)
+
+        for stream_document in queryset.as_pymongo():
+            yield self.to_domain(stream_document)
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+    ) -> tuple[list[TwichStream], Optional[str]]:
+        queryset: QuerySet = TwichStreamDAO.objects
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(parsed_at__lt=parsed_at) | Q(parsed_at=parsed_at, id__lt=id),
+            )
+
+        if tags:
+            queryset = queryset.filter(tags__all=tags)
+
+        if fields:
+            queryset = queryset.only('id', 'parsed_at', *fields)
+
+        stream_documents: list[dict] = list(
+            queryset.order_by('-parsed_at', '-id').limit(limit + 1).as_pymongo(),
+        )
+        next_cursor: Optional[str] = None
+
+        if len(stream_documents) > limit:
+            stream_documents = stream_documents[:limit]
+            next_cursor = encode_cursor(
+                stream_documents[-1]['parsed_at'],
+                stream_documents[-1]['_id'],
+            )
+
+        streams: list[TwichStream] = [
+            self.to_domain(stream_document) for stream_document in stream_documents
         ]
 
+        return streams, next_cursor
+
     async def delete(self, stream: TwichStream) -> None:
-        for stream_persistence in TwichStreamDAO.objects(user_login=stream.user_login):
-            stream_persistence.delete()
+        TwichStreamDAO.objects(user_login=stream.user_login).delete()
 
         return
 
-    async def get_by_id(self, id: int) -> TwichStream:
-        stream: Optional[TwichStreamDAO] = TwichStreamDAO.objects(
+    async def delete_by_id(self, id: int) -> TwichStream:
+        stream_persistence: Optional[TwichStreamDAO] = TwichStreamDAO.objects(
             id=id,
-        ).first()
+        ).modify(remove=True)
 
-        if not stream:
+        if not stream_persistence:
             raise ObjectNotFoundException('Stream is not found.')
 
-        stream_entity = TwichStream(
-            id=stream.id,
-            user_id=stream.user_id,
-            user_name=stream.user_name,
-            user_login=stream.user_login,
-            game_id=stream.game_id,
-            game_name=stream.game_name,
-            language=stream.language,
-            title=stream.title,
-            tags=stream.tags,
-            started_at=stream.started_at,
-            viewer_count=stream.viewer_count,
-            type=stream.type,
-            parsed_at=stream.parsed_at,
-        )
+        return self.to_domain(stream_persistence.to_mongo())
 
-        return stream_entity
+    async def delete_stream_by_user_login(self, user_login: str) -> TwichStream:
+        stream: TwichStream = await self.get_stream_by_user_login(user_login)
+        await self.delete(stream)
+
+        return stream
+
+    async def get_by_id(self, id: int) -> TwichStream:
+        stream_document: Optional[dict] = TwichStreamDAO.objects(id=id).as_pymongo().first()
+
+        if not stream_document:
+            raise ObjectNotFoundException('Stream is not found.')
+
+        return self.to_domain(stream_document)
+
+    async def get_many(self, ids: list[int]) -> list[TwichStream]:
+        stream_documents: dict[int, dict] = {
+            stream_document['_id']: stream_document
+            for stream_document in TwichStreamDAO.objects(id__in=ids).as_pymongo()
+        }
+
+        return [
+            self.to_domain(stream_documents[int(id)]) for id in ids if int(id) in stream_documents
+        ]
 
     async def get_stream_by_user_login(self, user_login: str) -> TwichStream:
-        stream: Optional[TwichStreamDAO] = TwichStreamDAO.objects(
-            user_login=user_login,
-        ).first()
+        stream_document: Optional[dict] = (
+            TwichStreamDAO.objects(user_login=user_login)
+            .order_by('-parsed_at')
+            .as_pymongo()
+            .first()
+        )
 
-        if not stream:
+        if not stream_document:
             raise ObjectNotFoundException('Stream is not found.')
 
-        stream_entity = TwichStream(
-            id=stream.id,
-            user_id=stream.user_id,
-            user_name=stream.user_name,
-            user_login=stream.user_login,
-            game_id=stream.game_id,
-            game_name=stream.game_name,
-            language=stream.language,
-            title=stream.title,
-            tags=stream.tags,
-            started_at=stream.started_at,
-            viewer_count=stream.viewer_count,
-            type=stream.type,
-            parsed_at=stream.parsed_at,
+        return self.to_domain(stream_document)
+
+    async def get_tag_counts(self, size: int) -> dict[str, int]:
+        return {
+            tag_count['_id']: tag_count['count']
+            for tag_count in TwichStreamDAO.objects.aggregate(
+                [
+                    {'$unwind': '$tags'},
+                    {'$group': {'_id': '$tags', 'count': {'$sum': 1}}},
+                    {'$sort': {'count': -1}},
+                    {'$limit': size},
+                ]
+            )
+        }
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        content_hashes: dict[int, str] = dict(
+            TwichStreamDAO.objects(id__in=ids).scalar('id', 'content_hash'),
+        )
+
+        return {id: content_hashes[int(id)] for id in ids if int(id) in content_hashes}
+
+
+class TwichStreamHistoryMongoRepository(ITwichStreamHistoryRepository):
+    collection_created: ClassVar[bool] = False
+
+    def __init__(self, db: MongoDatabase) -> None:
+        self.db: MongoDatabase = db
+        self.to_domain: Callable[[dict], TwichStreamSnapshot] = compile_mapper(
+            TwichStreamSnapshot,
+            from_dict=True,
+        )
+
+    def _create_collection(self) -> None:
+        if TwichStreamHistoryMongoRepository.collection_created:
+            return
+
+        try:
+            TwichStreamSnapshotDAO._get_db().create_collection(
+                TwichStreamSnapshotDAO._get_collection_name(),
+                timeseries=TwichStreamSnapshotDAO._meta['timeseries'],
+            )
+        except CollectionInvalid:
+            pass
+
+        TwichStreamSnapshotDAO.ensure_indexes()
+        TwichStreamHistoryMongoRepository.collection_created = True
+
+    def _to_document(self, snapshot: TwichStreamSnapshot) -> dict:
+        return {
+            'stream_id': int(snapshot.stream_id),
+            'user_login': snapshot.user_login,
+            'game_id': int(snapshot.game_id),
+            'viewer_count': snapshot.viewer_count,
+            'parsed_at': snapshot.parsed_at,
+        }
+
+    async def add_many(self, snapshots: list[TwichStreamSnapshot]) -> None:
+        if not snapshots:
+            return
+
+        self._create_collection()
+        TwichStreamSnapshotDAO._get_collection().insert_many(
+            [self._to_document(snapshot) for snapshot in snapshots],
+            ordered=False,
         )
 
-        return stream_entity
+        return
+
+    async def get_history(
+        self,
+        stream_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list[TwichStreamSnapshot]:
+        queryset: QuerySet = TwichStreamSnapshotDAO.objects(stream_id=stream_id)
+
+        if start:
+            queryset = queryset.filter(parsed_at__gte=start)
+
+        if end:
+            queryset = queryset.filter(parsed_at__lte=end)
+
+        return [
+            self.to_domain(snapshot_document)
+            for snapshot_document in queryset.order_by('parsed_at').as_pymongo()
+        ]
@@ -3,61 +3,227 @@ user.py: File, containing twich user mongo repository implementation.
 """
 
 
-from typing import Optional
-
-from automapper import mapper
+from typing import (
+    AsyncIterator,
+    Callable,
+    Optional,
+    Union,
+)
+
+from mongoengine import (
+    Q,
+    QuerySet,
+)
+from pymongo import (
+    UpdateOne,
+    WriteConcern,
+)
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
 
 from application.exceptions import ObjectNotFoundException
 from application.interfaces.repository import ITwichUserRepository
 from domain.models import TwichUser
 from infrastructure.persistence.connections.mongo.database import MongoDatabase
 from infrastructure.persistence.models.mongo.user import TwichUserDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.update import build_update
+from shared.utils import compile_mapper
 
 
 class TwichUserMongoRepository(ITwichUserRepository):
-    def __init__(self, db: MongoDatabase) -> None:
+    def __init__(
+        self,
+        db: MongoDatabase,
+        write_concern: Optional[Union[int, str]] = None,
+    ) -> None:
         self.db: MongoDatabase = db
+        self.collection: Collection = TwichUserDAO._get_collection().with_options(
+            write_concern=WriteConcern(w=write_concern),
+        )
+        self.to_domain: Callable[[dict], TwichUser] = compile_mapper(
+            TwichUser,
+            from_dict=True,
+            aliases=(('id', '_id'),),
+        )
+
+    def _to_update(self, user: TwichUser, stored_document: Optional[dict]) -> Optional[dict]:
+        return build_update(
+            {
+                'login': user.login,
+                'description': user.description,
+                'display_name': user.display_name,
+                'type': user.type,
+                'broadcaster_type': user.broadcaster_type,
+                'profile_image_url': user.profile_image_url,
+                'offline_image_url': user.offline_image_url,
+                'parsed_at': user.parsed_at,
+                'content_hash': user.content_hash,
+            },
+            {
+                'created_at': user.created_at,
+            },
+            stored_document,
+        )
+
+    def _get_stored_documents(self, ids: list[int]) -> dict[int, dict]:
+        return {
+            user_document['_id']: user_document
+            for user_document in self.collection.find({'_id': {'$in': ids}})
+        }
 
     async def add_or_update(self, user: TwichUser) -> None:
-        user_persistence = TwichUserDAO(
-            id=user.id,
-            login=user.login,
-            description=user.description,
-            display_name=user.display_name,
-            type=user.type,
-            broadcaster_type=user.broadcaster_type,
-            profile_image_url=user.profile_image_url,
-            offline_image_url=user.offline_image_url,
-            created_at=user.created_at,
-            parsed_at=user.parsed_at,
-        )
-        user_persistence.save()
+        update: Optional[dict] = self._to_update(
+            user,
+            self.collection.find_one({'_id': int(user.id)}),
+        )
+
+        if update:
+            self.collection.update_one({'_id': int(user.id)}, update, upsert=True)
 
         return
 
-    async def all(self) -> list[TwichUser]:
-        return [
-            mapper.to(TwichUser).map(user_persistence) for user_persistence in TwichUserDAO.objects
-        ]
+    async def add_or_update_many(self, users: list[TwichUser]) -> dict[int, str]:
+        if not users:
+            return {}
+
+        failures: dict[int, str] = {}
+        requests: list[UpdateOne] = []
+        request_ids: list[int] = []
+        stored_documents: dict[int, dict] = self._get_stored_documents(
+            [user.id for user in users],
+        )
+
+        for user in users:
+            try:
+                update: Optional[dict] = self._to_update(
+                    user,
+                    stored_documents.get(int(user.id)),
+                )
+            except (TypeError, ValueError) as exc:
+                failures[user.id] = str(exc)
+                continue
+
+            if not update:
+                continue
+
+            requests.append(UpdateOne({'_id': int(user.id)}, update, upsert=True))
+            request_ids.append(user.id)
+
+        if not requests:
+            return failures
+
+        try:
+            self.collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details['writeErrors']:
+                failures[request_ids[error['index']]] = error['errmsg']
+
+        return failures
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichUser]:
+        queryset: QuerySet = TwichUserDAO.objects.order_by('-parsed_at', '-id').batch_size(
+            page_size
+        )
+
+        if fields:
+            queryset = queryset.only('id', 'parsed_at', *fields)
+
+        for user_document in queryset.as_pymongo():
+            yield self.to_domain(user_document)
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[TwichUser], Optional[str]]:
+        queryset: QuerySet = TwichUserDAO.objects
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(parsed_at__lt=parsed_at) | Q(parsed_at=parsed_at, id__lt=id),
+            )
+
+        if fields:
+            queryset = queryset.only('id', 'parsed_at', *fields)
+
+        user_documents: list[dict] = list(
+            queryset.order_by('-parsed_at', '-id').limit(limit + 1).as_pymongo(),
+        )
+        next_cursor: Optional[str] = None
+
+        if len(user_documents) > limit:
+            user_documents = user_documents[:limit]
+            next_cursor = encode_cursor(
+                user_documents[-1]['parsed_at'],
+                user_documents[-1]['_id'],
+            )
+
+        users: list[TwichUser] = [self.to_domain(user_document) for user_document in user_documents]
+
+        return users, next_cursor
 
     async def delete(self, user: TwichUser) -> None:
-        for user_persistence in TwichUserDAO.objects(login=user.login):
-            user_persistence.delete()
+        TwichUserDAO.objects(login=user.login).delete()
 
         return
 
-    async def get_by_id(self, id: int) -> TwichUser:
-        user_persistence: Optional[TwichUserDAO] = TwichUserDAO.objects(id=id).first()
+    async def delete_by_id(self, id: int) -> TwichUser:
+        user_persistence: Optional[TwichUserDAO] = TwichUserDAO.objects(
+            id=id,
+        ).modify(remove=True)
 
         if not user_persistence:
             raise ObjectNotFoundException('User is not found.')
 
-        return mapper.to(TwichUser).map(user_persistence)
+        return self.to_domain(user_persistence.to_mongo())
 
-    async def get_user_by_login(self, login: str) -> TwichUser:
-        user_persistence: Optional[TwichUserDAO] = TwichUserDAO.objects(login=login).first()
+    async def delete_user_by_login(self, login: str) -> TwichUser:
+        user_persistence: Optional[TwichUserDAO] = TwichUserDAO.objects(
+            login=login,
+        ).modify(remove=True)
 
         if not user_persistence:
             raise ObjectNotFoundException('User is not found.')
 
-        return mapper.to(TwichUser).map(user_persistence)
+        return self.to_domain(user_persistence.to_mongo())
+
+    async def get_by_id(self, id: int) -> TwichUser:
+        user_document: Optional[dict] = TwichUserDAO.objects(id=id).as_pymongo().first()
+
+        if not user_document:
+            raise ObjectNotFoundException('User is not found.')
+
+        return self.to_domain(user_document)
+
+    async def get_many(self, ids: list[int]) -> list[TwichUser]:
+        user_documents: dict[int, dict] = {
+            user_document['_id']: user_document
+            for user_document in TwichUserDAO.objects(id__in=ids).as_pymongo()
+        }
+
+        return [self.to_domain(user_documents[int(id)]) for id in ids if int(id) in user_documents]
+
+    async def get_user_by_login(self, login: str) -> TwichUser:
+        user_document: Optional[dict] = TwichUserDAO.objects(login=login).as_pymongo().first()
+
+        if not user_document:
+            raise ObjectNotFoundException('User is not found.')
+
+        return self.to_domain(user_document)
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        content_hashes: dict[int, str] = dict(
+            TwichUserDAO.objects(id__in=ids).scalar('id', 'content_hash'),
+        )
+
+        return {id: content_hashes[int(id)] for id in ids if int(id) in content_hashes}
@@ -0,0 +1,237 @@
+"""
+game.py: File, containing twich game motor repository implementation.
+"""
+
+
+from typing import (
+    AsyncIterator,
+    Callable,
+    Optional,
+    Union,
+)
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import (
+    DESCENDING,
+    UpdateOne,
+    WriteConcern,
+)
+from pymongo.errors import BulkWriteError
+
+from application.exceptions import ObjectNotFoundException
+from application.interfaces.repository import ITwichGameRepository
+from domain.models import TwichGame
+from infrastructure.persistence.connections.mongo.motor import MongoMotorDatabase
+from infrastructure.persistence.models.mongo.game import TwichGameDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.update import build_update
+from shared.utils import compile_mapper
+
+
+class TwichGameMotorRepository(ITwichGameRepository):
+    def __init__(
+        self,
+        db: MongoMotorDatabase,
+        write_concern: Optional[Union[int, str]] = None,
+    ) -> None:
+        self.db: MongoMotorDatabase = db
+        self.collection: AsyncIOMotorCollection = db.database[
+            TwichGameDAO._get_collection_name()
+        ].with_options(write_concern=WriteConcern(w=write_concern))
+        self.to_domain: Callable[[dict], TwichGame] = compile_mapper(
+            TwichGame,
+            from_dict=True,
+            aliases=(('id', '_id'),),
+        )
+
+    def _to_update(self, game: TwichGame, stored_document: Optional[dict]) -> Optional[dict]:
+        return build_update(
+            {
+                'name': game.name,
+                'igdb_id': game.igdb_id,
+                'box_art_url': game.box_art_url,
+                'parsed_at': game.parsed_at,
+                'content_hash': game.content_hash,
+            },
+            {},
+            stored_document,
+        )
+
+    async def _get_stored_documents(self, ids: list[int]) -> dict[int, dict]:
+        return {
+            game_document['_id']: game_document
+            async for game_document in self.collection.find({'_id': {'$in': ids}})
+        }
+
+    async def add_or_update(self, game: TwichGame) -> None:
+        update: Optional[dict] = self._to_update(
+            game,
+            await self.collection.find_one({'_id': int(game.id)}),
+        )
+
+        if update:
+            await self.collection.update_one({'_id': int(game.id)}, update, upsert=True)
+
+        return
+
+    async def add_or_update_many(self, games: list[TwichGame]) -> dict[int, str]:
+        if not games:
+            return {}
+
+        failures: dict[int, str] = {}
+        requests: list[UpdateOne] = []
+        request_ids: list[int] = []
+        stored_documents: dict[int, dict] = await self._get_stored_documents(
+            [game.id for game in games],
+        )
+
+        for game in games:
+            try:
+                update: Optional[dict] = self._to_update(
+                    game,
+                    stored_documents.get(int(game.id)),
+                )
+            except (TypeError, ValueError) as exc:
+                failures[game.id] = str(exc)
+                continue
+
+            if not update:
+                continue
+
+            requests.append(UpdateOne({'_id': int(game.id)}, update, upsert=True))
+            request_ids.append(game.id)
+
+        if not requests:
+            return failures
+
+        try:
+            await self.collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details['writeErrors']:
+                failures[request_ids[error['index']]] = error['errmsg']
+
+        return failures
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichGame]:
+        projection: Optional[dict] = None
+
+        if fields:
+            projection = {field: 1 for field in ('parsed_at', *fields)}
+
+        async for game_document in (
+            self.collection.find({}, projection)
+            .sort([('parsed_at', DESCENDING), ('_id', DESCENDING)])
+            .batch_size(page_size)
+        ):
+            yield self.to_domain(game_document)
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[TwichGame], Optional[str]]:
+        query: dict = {}
+        projection: Optional[dict] = None
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            query = {
+                '$or': [
+                    {'parsed_at': {'$lt': parsed_at}},
+                    {'parsed_at': parsed_at, '_id': {'$lt': id}},
+                ],
+            }
+
+        if fields:
+            projection = {field: 1 for field in ('parsed_at', *fields)}
+
+        game_documents: list[dict] = (
+            await self.collection.find(query, projection)
+            .sort([('parsed_at', DESCENDING), ('_id', DESCENDING)])
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+        next_cursor: Optional[str] = None
+
+        if len(game_documents) > limit:
+            game_documents = game_documents[:limit]
+            next_cursor = encode_cursor(
+                game_documents[-1]['parsed_at'],
+                game_documents[-1]['_id'],
+            )
+
+        games: list[TwichGame] = [self.to_domain(game_document) for game_document in game_documents]
+
+        return games, next_cursor
+
+    async def delete(self, game: TwichGame) -> None:
+        await self.collection.delete_many({'name': game.name})
+
+        return
+
+    async def delete_by_id(self, id: int) -> TwichGame:
+        game_document: Optional[dict] = await self.collection.find_one_and_delete(
+            {'_id': int(id)},
+        )
+
+        if not game_document:
+            raise ObjectNotFoundException('Game is not found.')
+
+        return self.to_domain(game_document)
+
+    async def delete_game_by_name(self, name: str) -> TwichGame:
+        game_document: Optional[dict] = await self.collection.find_one_and_delete(
+            {'name': name},
+        )
+
+        if not game_document:
+            raise ObjectNotFoundException('Game is not found.')
+
+        return self.to_domain(game_document)
+
+    async def get_by_id(self, id: int) -> TwichGame:
+        game_document: Optional[dict] = await self.collection.find_one({'_id': int(id)})
+
+        if not game_document:
+            raise ObjectNotFoundException('Game is not found.')
+
+        return self.to_domain(game_document)
+
+    async def get_many(self, ids: list[int]) -> list[TwichGame]:
+        game_documents: dict[int, dict] = {
+            game_document['_id']: game_document
+            async for game_document in self.collection.find(
+                {'_id': {'$in': [int(id) for id in ids]}},
+            )
+        }
+
+        return [self.to_domain(game_documents[int(id)]) for id in ids if int(id) in game_documents]
+
+    async def get_game_by_name(self, name: str) -> TwichGame:
+        game_document: Optional[dict] = await self.collection.find_one(
+            {'name': name},
+        )
+
+        if not game_document:
+            raise ObjectNotFoundException('Game is not found.')
+
+        return self.to_domain(game_document)
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        content_hashes: dict[int, str] = {
+            game_document['_id']: game_document.get('content_hash')
+            async for game_document in self.collection.find(
+                {'_id': {'$in': [int(id) for id in ids]}},
+                {'content_hash': 1},
+            )
+        }
+
+        return {id: content_hashes[int(id)] for id in ids if int(id) in content_hashes}
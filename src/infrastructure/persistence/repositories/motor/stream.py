@@ -0,0 +1,352 @@
+"""
+stream.py: File, containing twich stream motor repository implementation.
+"""
+
+
+from datetime import datetime
+from typing import (
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Optional,
+    Union,
+)
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+    UpdateOne,
+    WriteConcern,
+)
+from pymongo.errors import (
+    BulkWriteError,
+    CollectionInvalid,
+)
+
+from application.exceptions import ObjectNotFoundException
+from application.interfaces.repository import (
+    ITwichStreamHistoryRepository,
+    ITwichStreamRepository,
+)
+from domain.models import (
+    TwichStream,
+    TwichStreamSnapshot,
+)
+from infrastructure.persistence.connections.mongo.motor import MongoMotorDatabase
+from infrastructure.persistence.models.mongo.stream import (
+    TwichStreamDAO,
+    TwichStreamSnapshotDAO,
+)
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.update import build_update
+from shared.utils import compile_mapper
+
+
+class TwichStreamMotorRepository(ITwichStreamRepository):
+    def __init__(
+        self,
+        db: MongoMotorDatabase,
+        write_concern: Optional[Union[int, str]] = None,
+    ) -> None:
+        self.db: MongoMotorDatabase = db
+        self.collection: AsyncIOMotorCollection = db.database[
+            TwichStreamDAO._get_collection_name()
+        ].with_options(write_concern=WriteConcern(w=write_concern))
+        self.to_domain: Callable[[dict], TwichStream] = compile_mapper(
+            TwichStream,
+            from_dict=True,
+            aliases=(('id', '_id'),),
+        )
+
+    def _to_update(self, stream: TwichStream, stored_document: Optional[dict]) -> Optional[dict]:
+        return build_update(
+            {
+                'user_name': stream.user_name,
+                'user_login': stream.user_login,
+                'game_id': int(stream.game_id),
+                'game_name': stream.game_name,
+                'language': stream.language,
+                'title': stream.title,
+                'tags': stream.tags,
+                'viewer_count': stream.viewer_count,
+                'type': stream.type,
+                'parsed_at': stream.parsed_at,
+                'content_hash': stream.content_hash,
+            },
+            {
+                'user_id': int(stream.user_id),
+                'started_at': stream.started_at,
+            },
+            stored_document,
+        )
+
+    async def _get_stored_documents(self, ids: list[int]) -> dict[int, dict]:
+        return {
+            stream_document['_id']: stream_document
+            async for stream_document in self.collection.find({'_id': {'$in': ids}})
+        }
+
+    async def add_or_update(self, stream: TwichStream) -> None:
+        update: Optional[dict] = self._to_update(
+            stream,
+            await self.collection.find_one({'_id': int(stream.id)}),
+        )
+
+        if update:
+            await self.collection.update_one({'_id': int(stream.id)}, update, upsert=True)
+
+        return
+
+    async def add_or_update_many(self, streams: list[TwichStream]) -> dict[int, str]:
+        if not streams:
+            return {}
+
+        failures: dict[int, str] = {}
+        requests: list[UpdateOne] = []
+        request_ids: list[int] = []
+        stored_documents: dict[int, dict] = await self._get_stored_documents(
+            [stream.id for stream in streams],
+        )
+
+        for stream in streams:
+            try:
+                update: Optional[dict] = self._to_update(
+                    stream,
+                    stored_documents.get(int(stream.id)),
+                )
+            except (TypeError, ValueError) as exc:
+                failures[stream.id] = str(exc)
+                continue
+
+            if not update:
+                continue
+
+            requests.append(UpdateOne({'_id': int(stream.id)}, update, upsert=True))
+            request_ids.append(stream.id)
+
+        if not requests:
+            return failures
+
+        try:
+            await self.collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details['writeErrors']:
+                failures[request_ids[error['index']]] = error['errmsg']
+
+        return failures
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichStream]:
+        projection: Optional[dict] = None
+
+        if fields:
+            projection = {field: 1 for field in ('parsed_at', *fields)}
+
+        async for stream_document in (
+            self.collection.find({}, projection)
+            .sort([('parsed_at', DESCENDING), ('_id', DESCENDING)])
+            .batch_size(page_size)
+        ):
+            yield self.to_domain(stream_document)
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        tags: Optional[list[str]] = None,
+    ) -> tuple[list[TwichStream], Optional[str]]:
+        query: dict = {}
+        projection: Optional[dict] = None
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            query = {
+                '$or': [
+                    {'parsed_at': {'$lt': parsed_at}},
+                    {'parsed_at': parsed_at, '_id': {'$lt': id}},
+                ],
+            }
+
+        if tags:
+            query['tags'] = {'$all': tags}
+
+        if fields:
+            projection = {field: 1 for field in ('parsed_at', *fields)}
+
+        stream_documents: list[dict] = (
+            await self.collection.find(query, projection)
+            .sort([('parsed_at', DESCENDING), ('_id', DESCENDING)])
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+        next_cursor: Optional[str] = None
+
+        if len(stream_documents) > limit:
+            stream_documents = stream_documents[:limit]
+            next_cursor = encode_cursor(
+                stream_documents[-1]['parsed_at'],
+                stream_documents[-1]['_id'],
+            )
+
+        streams: list[TwichStream] = [
+            self.to_domain(stream_document) for stream_document in stream_documents
+        ]
+
+        return streams, next_cursor
+
+    async def delete(self, stream: TwichStream) -> None:
+        await self.collection.delete_many({'user_login': stream.user_login})
+
+        return
+
+    async def delete_by_id(self, id: int) -> TwichStream:
+        stream_document: Optional[dict] = await self.collection.find_one_and_delete(
+            {'_id': int(id)},
+        )
+
+        if not stream_document:
+            raise ObjectNotFoundException('Stream is not found.')
+
+        return self.to_domain(stream_document)
+
+    async def delete_stream_by_user_login(self, user_login: str) -> TwichStream:
+        stream: TwichStream = await self.get_stream_by_user_login(user_login)
+        await self.delete(stream)
+
+        return stream
+
+    async def get_by_id(self, id: int) -> TwichStream:
+        stream_document: Optional[dict] = await self.collection.find_one({'_id': int(id)})
+
+        if not stream_document:
+            raise ObjectNotFoundException('Stream is not found.')
+
+        return self.to_domain(stream_document)
+
+    async def get_many(self, ids: list[int]) -> list[TwichStream]:
+        stream_documents: dict[int, dict] = {
+            stream_document['_id']: stream_document
+            async for stream_document in self.collection.find(
+                {'_id': {'$in': [int(id) for id in ids]}},
+            )
+        }
+
+        return [
+            self.to_domain(stream_documents[int(id)]) for id in ids if int(id) in stream_documents
+        ]
+
+    async def get_stream_by_user_login(self, user_login: str) -> TwichStream:
+        stream_document: Optional[dict] = await self.collection.find_one(
+            {'user_login': user_login},
+            sort=[('parsed_at', DESCENDING)],
+        )
+
+        if not stream_document:
+            raise ObjectNotFoundException('Stream is not found.')
+
+        return self.to_domain(stream_document)
+
+    async def get_tag_counts(self, size: int) -> dict[str, int]:
+        return {
+            tag_count['_id']: tag_count['count']
+            async for tag_count in self.collection.aggregate(
+                [
+                    {'$unwind': '$tags'},
+                    {'$group': {'_id': '$tags', 'count': {'$sum': 1}}},
+                    {'$sort': {'count': -1}},
+                    {'$limit': size},
+                ]
+            )
+        }
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        content_hashes: dict[int, str] = {
+            stream_document['_id']: stream_document.get('content_hash')
+            async for stream_document in self.collection.find(
+                {'_id': {'$in': [int(id) for id in ids]}},
+                {'content_hash': 1},
+            )
+        }
+
+        return {id: content_hashes[int(id)] for id in ids if int(id) in content_hashes}
+
+
+class TwichStreamHistoryMotorRepository(ITwichStreamHistoryRepository):
+    collection_created: ClassVar[bool] = False
+
+    def __init__(self, db: MongoMotorDatabase) -> None:
+        self.db: MongoMotorDatabase = db
+        self.collection: AsyncIOMotorCollection = db.database[
+            TwichStreamSnapshotDAO._get_collection_name()
+        ]
+        self.to_domain: Callable[[dict], TwichStreamSnapshot] = compile_mapper(
+            TwichStreamSnapshot,
+            from_dict=True,
+        )
+
+    async def _create_collection(self) -> None:
+        if TwichStreamHistoryMotorRepository.collection_created:
+            return
+
+        try:
+            await self.db.database.create_collection(
+                TwichStreamSnapshotDAO._get_collection_name(),
+                timeseries=TwichStreamSnapshotDAO._meta['timeseries'],
+            )
+        except CollectionInvalid:
+            pass
+
+        await self.collection.create_index([('stream_id', ASCENDING), ('parsed_at', ASCENDING)])
+        TwichStreamHistoryMotorRepository.collection_created = True
+
+    def _to_document(self, snapshot: TwichStreamSnapshot) -> dict:
+        return {
+            'stream_id': int(snapshot.stream_id),
+            'user_login': snapshot.user_login,
+            'game_id': int(snapshot.game_id),
+            'viewer_count': snapshot.viewer_count,
+            'parsed_at': snapshot.parsed_at,
+        }
+
+    async def add_many(self, snapshots: list[TwichStreamSnapshot]) -> None:
+        if not snapshots:
+            return
+
+        await self._create_collection()
+        await self.collection.insert_many(
+            [self._to_document(snapshot) for snapshot in snapshots],
+            ordered=False,
+        )
+
+        return
+
+    async def get_history(
+        self,
+        stream_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list[TwichStreamSnapshot]:
+        query: dict = {'stream_id': int(stream_id)}
+        parsed_at: dict = {}
+
+        if start:
+            parsed_at['$gte'] = start
+
+        if end:
+            parsed_at['$lte'] = end
+
+        if parsed_at:
+            query['parsed_at'] = parsed_at
+
+        return [
+            self.to_domain(snapshot_document)
+            async for snapshot_document in self.collection.find(query).sort('parsed_at', ASCENDING)
+        ]
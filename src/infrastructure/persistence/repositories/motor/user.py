@@ -0,0 +1,243 @@
+"""
+user.py: File, containing twich user motor repository implementation.
+"""
+
+
+from typing import (
+    AsyncIterator,
+    Callable,
+    Optional,
+    Union,
+)
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import (
+    DESCENDING,
+    UpdateOne,
+    WriteConcern,
+)
+from pymongo.errors import BulkWriteError
+
+from application.exceptions import ObjectNotFoundException
+from application.interfaces.repository import ITwichUserRepository
+from domain.models import TwichUser
+from infrastructure.persistence.connections.mongo.motor import MongoMotorDatabase
+from infrastructure.persistence.models.mongo.user import TwichUserDAO
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from infrastructure.persistence.repositories.update import build_update
+from shared.utils import compile_mapper
+
+
+class TwichUserMotorRepository(ITwichUserRepository):
+    def __init__(
+        self,
+        db: MongoMotorDatabase,
+        write_concern: Optional[Union[int, str]] = None,
+    ) -> None:
+        self.db: MongoMotorDatabase = db
+        self.collection: AsyncIOMotorCollection = db.database[
+            TwichUserDAO._get_collection_name()
+        ].with_options(write_concern=WriteConcern(w=write_concern))
+        self.to_domain: Callable[[dict], TwichUser] = compile_mapper(
+            TwichUser,
+            from_dict=True,
+            aliases=(('id', '_id'),),
+        )
+
+    def _to_update(self, user: TwichUser, stored_document: Optional[dict]) -> Optional[dict]:
+        return build_update(
+            {
+                'login': user.login,
+                'description': user.description,
+                'display_name': user.display_name,
+                'type': user.type,
+                'broadcaster_type': user.broadcaster_type,
+                'profile_image_url': user.profile_image_url,
+                'offline_image_url': user.offline_image_url,
+                'parsed_at': user.parsed_at,
+                'content_hash': user.content_hash,
+            },
+            {
+                'created_at': user.created_at,
+            },
+            stored_document,
+        )
+
+    async def _get_stored_documents(self, ids: list[int]) -> dict[int, dict]:
+        return {
+            user_document['_id']: user_document
+            async for user_document in self.collection.find({'_id': {'$in': ids}})
+        }
+
+    async def add_or_update(self, user: TwichUser) -> None:
+        update: Optional[dict] = self._to_update(
+            user,
+            await self.collection.find_one({'_id': int(user.id)}),
+        )
+
+        if update:
+            await self.collection.update_one({'_id': int(user.id)}, update, upsert=True)
+
+        return
+
+    async def add_or_update_many(self, users: list[TwichUser]) -> dict[int, str]:
+        if not users:
+            return {}
+
+        failures: dict[int, str] = {}
+        requests: list[UpdateOne] = []
+        request_ids: list[int] = []
+        stored_documents: dict[int, dict] = await self._get_stored_documents(
+            [user.id for user in users],
+        )
+
+        for user in users:
+            try:
+                update: Optional[dict] = self._to_update(
+                    user,
+                    stored_documents.get(int(user.id)),
+                )
+            except (TypeError, ValueError) as exc:
+                failures[user.id] = str(exc)
+                continue
+
+            if not update:
+                continue
+
+            requests.append(UpdateOne({'_id': int(user.id)}, update, upsert=True))
+            request_ids.append(user.id)
+
+        if not requests:
+            return failures
+
+        try:
+            await self.collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details['writeErrors']:
+                failures[request_ids[error['index']]] = error['errmsg']
+
+        return failures
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichUser]:
+        projection: Optional[dict] = None
+
+        if fields:
+            projection = {field: 1 for field in ('parsed_at', *fields)}
+
+        async for user_document in (
+            self.collection.find({}, projection)
+            .sort([('parsed_at', DESCENDING), ('_id', DESCENDING)])
+            .batch_size(page_size)
+        ):
+            yield self.to_domain(user_document)
+
+    async def paginate(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[TwichUser], Optional[str]]:
+        query: dict = {}
+        projection: Optional[dict] = None
+
+        if cursor:
+            parsed_at, id = decode_cursor(cursor)
+            query = {
+                '$or': [
+                    {'parsed_at': {'$lt': parsed_at}},
+                    {'parsed_at': parsed_at, '_id': {'$lt': id}},
+                ],
+            }
+
+        if fields:
+            projection = {field: 1 for field in ('parsed_at', *fields)}
+
+        user_documents: list[dict] = (
+            await self.collection.find(query, projection)
+            .sort([('parsed_at', DESCENDING), ('_id', DESCENDING)])
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+        next_cursor: Optional[str] = None
+
+        if len(user_documents) > limit:
+            user_documents = user_documents[:limit]
+            next_cursor = encode_cursor(
+                user_documents[-1]['parsed_at'],
+                user_documents[-1]['_id'],
+            )
+
+        users: list[TwichUser] = [self.to_domain(user_document) for user_document in user_documents]
+
+        return users, next_cursor
+
+    async def delete(self, user: TwichUser) -> None:
+        await self.collection.delete_many({'login': user.login})
+
+        return
+
+    async def delete_by_id(self, id: int) -> TwichUser:
+        user_document: Optional[dict] = await self.collection.find_one_and_delete(
+            {'_id': int(id)},
+        )
+
+        if not user_document:
+            raise ObjectNotFoundException('User is not found.')
+
+        return self.to_domain(user_document)
+
+    async def delete_user_by_login(self, login: str) -> TwichUser:
+        user_document: Optional[dict] = await self.collection.find_one_and_delete(
+            {'login': login},
+        )
+
+        if not user_document:
+            raise ObjectNotFoundException('User is not found.')
+
+        return self.to_domain(user_document)
+
+    async def get_by_id(self, id: int) -> TwichUser:
+        user_document: Optional[dict] = await self.collection.find_one({'_id': int(id)})
+
+        if not user_document:
+            raise ObjectNotFoundException('User is not found.')
+
+        return self.to_domain(user_document)
+
+    async def get_many(self, ids: list[int]) -> list[TwichUser]:
+        user_documents: dict[int, dict] = {
+            user_document['_id']: user_document
+            async for user_document in self.collection.find(
+                {'_id': {'$in': [int(id) for id in ids]}},
+            )
+        }
+
+        return [self.to_domain(user_documents[int(id)]) for id in ids if int(id) in user_documents]
+
+    async def get_user_by_login(self, login: str) -> TwichUser:
+        user_document: Optional[dict] = await self.collection.find_one(
+            {'login': login},
+        )
+
+        if not user_document:
+            raise ObjectNotFoundException('User is not found.')
+
+        return self.to_domain(user_document)
+
+    async def get_content_hashes(self, ids: list[int]) -> dict[int, str]:
+        content_hashes: dict[int, str] = {
+            user_document['_id']: user_document.get('content_hash')
+            async for user_document in self.collection.find(
+                {'_id': {'$in': [int(id) for id in ids]}},
+                {'content_hash': 1},
+            )
+        }
+
+        return {id: content_hashes[int(id)] for id in ids if int(id) in content_hashes}
@@ -0,0 +1,118 @@
+"""
+pit.py: File, containing point in time scans for elastic search.
+"""
+
+
+from typing import (
+    AsyncIterator,
+    Iterator,
+    Optional,
+)
+
+from elasticsearch import (
+    AsyncElasticsearch,
+    Elasticsearch,
+)
+from elasticsearch_dsl import Search
+
+
+def _page(
+    search: Search,
+    pit_id: str,
+    keep_alive: str,
+    page_size: int,
+    after: Optional[list],
+) -> dict:
+    search = search.extra(size=page_size, pit={'id': pit_id, 'keep_alive': keep_alive})
+
+    if after:
+        search = search.extra(search_after=after)
+
+    return search.to_dict()
+
+
+def scan_point_in_time(
+    connection: Elasticsearch,
+    index: str,
+    search: Search,
+    page_size: int,
+    keep_alive: str = '1m',
+) -> Iterator[dict]:
+    """
+    scan_point_in_time: Iterate over all hits of the sorted search with point in time and
+    search after, holding only one page in memory.
+
+    Args:
+        connection (Elasticsearch): Elastic search connection.
+        index (str): Name of the index or alias.
+        search (Search): Sorted search, whose sort values are used as search after keys.
+        page_size (int): Number of hits per request.
+        keep_alive (str): How long point in time is kept between requests.
+
+    Yields:
+        Iterator[dict]: Raw search hits.
+    """
+
+    pit_id: str = connection.open_point_in_time(index=index, keep_alive=keep_alive)['id']
+    after: Optional[list] = None
+
+    try:
+        while True:
+            response: dict = connection.search(
+                body=_page(search, pit_id, keep_alive, page_size, after),
+            )
+            hits: list[dict] = response['hits']['hits']
+
+            yield from hits
+
+            if len(hits) < page_size:
+                return
+
+            pit_id = response.get('pit_id', pit_id)
+            after = hits[-1]['sort']
+    finally:
+        connection.close_point_in_time(body={'id': pit_id})
+
+
+async def async_scan_point_in_time(
+    connection: AsyncElasticsearch,
+    index: str,
+    search: Search,
+    page_size: int,
+    keep_alive: str = '1m',
+) -> AsyncIterator[dict]:
+    """
+    async_scan_point_in_time: Iterate over all hits of the sorted search with point in time and
+    search after, holding only one page in memory.
+
+    Args:
+        connection (AsyncElasticsearch): Async elastic search connection.
+        index (str): Name of the index or alias.
+        search (Search): Sorted search, whose sort values are used as search after keys.
+        page_size (int): Number of hits per request.
+        keep_alive (str): How long point in time is kept between requests.
+
+    Yields:
+        AsyncIterator[dict]: Raw search hits.
+    """
+
+    pit_id: str = (await connection.open_point_in_time(index=index, keep_alive=keep_alive))['id']
+    after: Optional[list] = None
+
+    try:
+        while True:
+            response: dict = await connection.search(
+                body=_page(search, pit_id, keep_alive, page_size, after),
+            )
+            hits: list[dict] = response['hits']['hits']
+
+            for hit in hits:
+                yield hit
+
+            if len(hits) < page_size:
+                return
+
+            pit_id = response.get('pit_id', pit_id)
+            after = hits[-1]['sort']
+    finally:
+        await connection.close_point_in_time(body={'id': pit_id})
@@ -0,0 +1,49 @@
+"""
+update.py: File, containing partial upsert building for mongo repositories.
+"""
+
+
+from typing import Optional
+
+
+def build_update(
+    fields: dict,
+    insert_fields: dict,
+    stored_document: Optional[dict],
+) -> Optional[dict]:
+    """
+    build_update: Build upsert update, that sets only fields differing from stored document.
+    Unchanged fields go to $setOnInsert, so document, deleted after it was read, is still
+    recreated in full.
+
+    Args:
+        fields (dict): Fields, kept in sync with domain model.
+        insert_fields (dict): Fields, written only when document is created.
+        stored_document (Optional[dict]): Stored document or None, if it does not exist.
+
+    Returns:
+        Optional[dict]: Update document or None, if nothing has changed.
+    """
+
+    changed_fields: dict = (
+        fields
+        if stored_document is None
+        else {
+            field: value
+            for field, value in fields.items()
+            if field not in stored_document or stored_document[field] != value
+        }
+    )
+
+    if not changed_fields:
+        return None
+
+    update: dict = {'$set': changed_fields}
+    unchanged_fields: dict = {
+        field: value for field, value in fields.items() if field not in changed_fields
+    }
+
+    if unchanged_fields or insert_fields:
+        update['$setOnInsert'] = {**unchanged_fields, **insert_fields}
+
+    return update
@@ -18,10 +18,12 @@ from shared.utils import Singleton
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
+    await application.container.init_resources()
     application.container.game_container.game_kafka_dispatcher()
     application.container.stream_container.stream_kafka_dispatcher()
     application.container.user_container.user_kafka_dispatcher()
     yield
+    await application.container.shutdown_resources()
 
 
 @Singleton
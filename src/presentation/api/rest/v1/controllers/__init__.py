@@ -11,6 +11,7 @@ from presentation.api.rest.v1.controllers.game import (
     TwichGameCommandController,
     TwichGameQueryController,
 )
+from presentation.api.rest.v1.controllers.metrics import TwichMetricsController
 from presentation.api.rest.v1.controllers.stream import (
     TwichStreamCommandController,
     TwichStreamQueryController,
@@ -26,6 +27,7 @@ __all__: list[str] = [
     'ControllerExceptionHandlingDecorator',
     'TwichGameCommandController',
     'TwichGameQueryController',
+    'TwichMetricsController',
     'TwichStreamCommandController',
     'TwichStreamQueryController',
     'TwichUserCommandController',
@@ -4,20 +4,22 @@ game.py: File, containing twich game controllers.
 
 
 from dataclasses import asdict
-from typing import Annotated
+from typing import (
+    Annotated,
+    Optional,
+)
 
 from fastapi import (
     Path,
     Request,
     status,
 )
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 
 from application.commands import (
     DeleteTwichGame,
     DeleteTwichGameByName,
     ParseTwichGame,
+    ParseTwichGames,
 )
 from application.dto import (
     ResultDTO,
@@ -34,7 +36,10 @@ from application.queries import (
     GetTwichGameByName,
 )
 from presentation.api.rest.v1.requests import JSONAPIPostSchema
-from presentation.api.rest.v1.responses import JSONAPISuccessResponseSchema
+from presentation.api.rest.v1.responses import (
+    JSONAPIResponse,
+    JSONAPISuccessResponseSchema,
+)
 from presentation.api.rest.v1.schemas import JSONAPIObjectSchema
 
 
@@ -46,7 +51,7 @@ class TwichGameCommandController:
         self,
         request: Request,
         body: JSONAPIPostSchema,
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         name: str = body.attributes['name']
 
         command: ParseTwichGame = ParseTwichGame(name=name)
@@ -80,16 +85,60 @@ class TwichGameCommandController:
             'Location': resource_url,
         }
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             headers=headers,
             status_code=status.HTTP_201_CREATED,
         )
 
+    async def parse_games(
+        self,
+        request: Request,
+        body: JSONAPIPostSchema,
+    ) -> JSONAPIResponse:
+        names: list[str] = body.attributes['names']
+
+        command: ParseTwichGames = ParseTwichGames(names=names)
+        result: ResultDTO = await self.command_bus.dispatch(command)
+
+        response_objects: list[JSONAPIObjectSchema] = []
+
+        for game_id in result.data['ids']:
+            resource_url: str = f'{request.url_for("get_game", id=game_id)}'
+
+            links: dict = {
+                'self': resource_url,
+            }
+
+            response_object: JSONAPIObjectSchema = JSONAPIObjectSchema(
+                id=game_id,
+                type='game',
+                attributes={},
+                links=links,
+            )
+
+            response_objects.append(response_object)
+
+        response_meta: dict = {
+            'status': result.status,
+            'description': result.description,
+            'failures': result.data['failures'],
+        }
+
+        response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
+            data=response_objects,
+            meta=response_meta,
+        )
+
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
+        )
+
     async def delete_game(
         self,
         id: Annotated[int, Path(gt=0)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         command: DeleteTwichGame = DeleteTwichGame(id=id)
         result: ResultDTO = await self.command_bus.dispatch(command)
 
@@ -103,15 +152,15 @@ class TwichGameCommandController:
             meta=response_meta,
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
 
     async def delete_game_by_name(
         self,
         name: Annotated[str, Path(min_length=1, max_length=128)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         command: DeleteTwichGameByName = DeleteTwichGameByName(name=name)
         result: ResultDTO = await self.command_bus.dispatch(command)
 
@@ -125,8 +174,8 @@ class TwichGameCommandController:
             meta=response_meta,
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
 
@@ -139,7 +188,7 @@ class TwichGameQueryController:
         self,
         request: Request,
         id: Annotated[int, Path(gt=0)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         query: GetTwichGame = GetTwichGame(id=id)
         game: TwichGameDTO = await self.query_bus.dispatch(query)
 
@@ -163,8 +212,8 @@ class TwichGameQueryController:
             data=[response_object],
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
 
@@ -172,7 +221,7 @@ class TwichGameQueryController:
         self,
         request: Request,
         name: Annotated[str, Path(min_length=1, max_length=128)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         query: GetTwichGameByName = GetTwichGameByName(name=name)
         game: TwichGameDTO = await self.query_bus.dispatch(query)
 
@@ -196,16 +245,19 @@ class TwichGameQueryController:
             data=[response_object],
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
 
     async def get_all_games(
         self,
         request: Request,
-    ) -> JSONResponse:
-        query: GetAllTwichGames = GetAllTwichGames()
+        limit: int,
+        cursor: Optional[str],
+        fields: Optional[list[str]],
+    ) -> JSONAPIResponse:
+        query: GetAllTwichGames = GetAllTwichGames(limit=limit, cursor=cursor, fields=fields)
         games: TwichGamesDTO = await self.query_bus.dispatch(query)
 
         response_objects: list[JSONAPIObjectSchema] = []
@@ -214,6 +266,11 @@ class TwichGameQueryController:
             game_attribtutes: dict = asdict(game)
             game_id: int = game_attribtutes.pop('id')
 
+            if fields:
+                game_attribtutes = {
+                    key: value for key, value in game_attribtutes.items() if key in fields
+                }
+
             resource_url: str = f'{request.url_for("get_game", id=game_id)}'
 
             links: dict = {
@@ -229,11 +286,16 @@ class TwichGameQueryController:
 
             response_objects.append(response_object)
 
+        response_meta: dict = {
+            'cursor': games.cursor,
+        }
+
         response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
             data=response_objects,
+            meta=response_meta,
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
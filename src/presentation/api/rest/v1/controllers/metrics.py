@@ -0,0 +1,31 @@
+"""
+metrics.py: File, containing twich api client metrics controller.
+"""
+
+
+from fastapi import (
+    Request,
+    status,
+)
+
+from presentation.api.rest.v1.responses import (
+    JSONAPIResponse,
+    JSONAPISuccessResponseSchema,
+)
+from shared.interfaces import IMetrics
+
+
+class TwichMetricsController:
+    def __init__(self, sources: dict[str, IMetrics]) -> None:
+        self.sources: dict[str, IMetrics] = sources
+
+    async def get_metrics(self, request: Request) -> JSONAPIResponse:
+        response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
+            data=[],
+            meta={name: source.metrics for name, source in self.sources.items()},
+        )
+
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_200_OK,
+        )
@@ -4,38 +4,54 @@ stream.py: File, containing twich stream controllers.
 
 
 from dataclasses import asdict
-from typing import Annotated
+from datetime import datetime
+from typing import (
+    Annotated,
+    AsyncIterator,
+    Optional,
+)
 
 from fastapi import (
     Path,
     Request,
     status,
 )
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 
 from application.commands import (
+    CrawlTwichStreams,
     DeleteTwichStream,
     DeleteTwichStreamByUserLogin,
     ParseTwichStream,
+    ParseTwichStreams,
 )
 from application.dto import (
     ResultDTO,
     TwichStreamDTO,
+    TwichStreamHistoryDTO,
     TwichStreamsDTO,
+    TwichStreamsExportDTO,
+    TwichStreamTagsDTO,
 )
 from application.interfaces.bus import (
     ICommandBus,
     IQueryBus,
 )
 from application.queries import (
+    ExportTwichStreams,
     GetAllTwichStreams,
     GetTwichStream,
     GetTwichStreamByUserLogin,
+    GetTwichStreamHistory,
+    GetTwichStreamTags,
 )
 from presentation.api.rest.v1.requests import JSONAPIPostSchema
-from presentation.api.rest.v1.responses import JSONAPISuccessResponseSchema
+from presentation.api.rest.v1.responses import (
+    JSONAPIResponse,
+    JSONAPISuccessResponseSchema,
+)
 from presentation.api.rest.v1.schemas import JSONAPIObjectSchema
+from shared.utils import json_dumps
 
 
 class TwichStreamCommandController:
@@ -46,7 +62,7 @@ class TwichStreamCommandController:
         self,
         request: Request,
         body: JSONAPIPostSchema,
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         user_login: str = body.attributes['user_login']
 
         command: ParseTwichStream = ParseTwichStream(user_login=user_login)
@@ -80,16 +96,104 @@ class TwichStreamCommandController:
             'Location': resource_url,
         }
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             headers=headers,
             status_code=status.HTTP_201_CREATED,
         )
 
+    async def parse_streams(
+        self,
+        request: Request,
+        body: JSONAPIPostSchema,
+    ) -> JSONAPIResponse:
+        user_logins: list[str] = body.attributes['user_logins']
+
+        command: ParseTwichStreams = ParseTwichStreams(user_logins=user_logins)
+        result: ResultDTO = await self.command_bus.dispatch(command)
+
+        response_objects: list[JSONAPIObjectSchema] = []
+
+        for stream_id in result.data['ids']:
+            resource_url: str = f'{request.url_for("get_stream", id=stream_id)}'
+
+            links: dict = {
+                'self': resource_url,
+            }
+
+            response_object: JSONAPIObjectSchema = JSONAPIObjectSchema(
+                id=stream_id,
+                type='stream',
+                attributes={},
+                links=links,
+            )
+
+            response_objects.append(response_object)
+
+        response_meta: dict = {
+            'status': result.status,
+            'description': result.description,
+            'failures': result.data['failures'],
+        }
+
+        response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
+            data=response_objects,
+            meta=response_meta,
+        )
+
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    async def crawl_streams(
+        self,
+        request: Request,
+        body: JSONAPIPostSchema,
+    ) -> JSONAPIResponse:
+        game_id: str = body.attributes['game_id']
+
+        command: CrawlTwichStreams = CrawlTwichStreams(game_id=game_id)
+        result: ResultDTO = await self.command_bus.dispatch(command)
+
+        response_objects: list[JSONAPIObjectSchema] = []
+
+        for stream_id in result.data['ids']:
+            resource_url: str = f'{request.url_for("get_stream", id=stream_id)}'
+
+            links: dict = {
+                'self': resource_url,
+            }
+
+            response_object: JSONAPIObjectSchema = JSONAPIObjectSchema(
+                id=stream_id,
+                type='stream',
+                attributes={},
+                links=links,
+            )
+
+            response_objects.append(response_object)
+
+        response_meta: dict = {
+            'status': result.status,
+            'description': result.description,
+            'failures': result.data['failures'],
+        }
+
+        response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
+            data=response_objects,
+            meta=response_meta,
+        )
+
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
+        )
+
     async def delete_stream(
         self,
         id: Annotated[int, Path(gt=0)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         command: DeleteTwichStream = DeleteTwichStream(id=id)
         result: ResultDTO = await self.command_bus.dispatch(command)
 
@@ -103,15 +207,15 @@ class TwichStreamCommandController:
             meta=response_meta,
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
-            status_code=status.HTTP_200_OK,
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
         )
 
     async def delete_stream_by_user_login(
         self,
         user_login: Annotated[str, Path(min_length=1, max_length=128)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         command: DeleteTwichStreamByUserLogin = DeleteTwichStreamByUserLogin(user_login=user_login)
         result: ResultDTO = await self.command_bus.dispatch(command)
 
@@ -125,9 +229,9 @@ class TwichStreamCommandController:
             meta=response_meta,
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
-            status_code=status.HTTP_200_OK,
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
         )
 
 
@@ -139,7 +243,7 @@ class TwichStreamQueryController:
         self,
         request: Request,
         id: Annotated[int, Path(gt=0)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         query: GetTwichStream = GetTwichStream(id=id)
         stream: TwichStreamDTO = await self.query_bus.dispatch(query)
 
@@ -163,16 +267,16 @@ class TwichStreamQueryController:
             data=[response_object],
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
-            status_code=status.HTTP_200_OK,
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
         )
 
     async def get_stream_by_user_login(
         self,
         request: Request,
         user_login: Annotated[str, Path(min_length=1, max_length=128)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         query: GetTwichStreamByUserLogin = GetTwichStreamByUserLogin(user_login=user_login)
         stream: TwichStreamDTO = await self.query_bus.dispatch(query)
 
@@ -196,16 +300,25 @@ class TwichStreamQueryController:
             data=[response_object],
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
-            status_code=status.HTTP_200_OK,
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
         )
 
     async def get_all_streams(
         self,
         request: Request,
-    ) -> JSONResponse:
-        query: GetAllTwichStreams = GetAllTwichStreams()
+        limit: int,
+        cursor: Optional[str],
+        fields: Optional[list[str]],
+        tags: Optional[list[str]],
+    ) -> JSONAPIResponse:
+        query: GetAllTwichStreams = GetAllTwichStreams(
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+            tags=tags,
+        )
         streams: TwichStreamsDTO = await self.query_bus.dispatch(query)
 
         response_objects: list[JSONAPIObjectSchema] = []
@@ -214,6 +327,11 @@ class TwichStreamQueryController:
             stream_attribtutes: dict = asdict(stream)
             stream_id: int = stream_attribtutes.pop('id')
 
+            if fields:
+                stream_attribtutes = {
+                    key: value for key, value in stream_attribtutes.items() if key in fields
+                }
+
             resource_url: str = f'{request.url_for("get_stream", id=stream_id)}'
 
             links: dict = {
@@ -229,11 +347,103 @@ class TwichStreamQueryController:
 
             response_objects.append(response_object)
 
+        response_meta: dict = {
+            'cursor': streams.cursor,
+        }
+
         response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
             data=response_objects,
+            meta=response_meta,
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    async def export_streams(
+        self,
+        fields: Optional[list[str]],
+    ) -> StreamingResponse:
+        query: ExportTwichStreams = ExportTwichStreams(fields=fields)
+        streams: TwichStreamsExportDTO = await self.query_bus.dispatch(query)
+
+        async def lines() -> AsyncIterator[bytes]:
+            async for stream in streams.data:
+                stream_attribtutes: dict = asdict(stream)
+
+                if fields:
+                    stream_attribtutes = {
+                        key: value
+                        for key, value in stream_attribtutes.items()
+                        if key == 'id' or key in fields
+                    }
+
+                yield json_dumps(stream_attribtutes) + b'\n'
+
+        return StreamingResponse(
+            content=lines(),
             status_code=status.HTTP_200_OK,
+            media_type='application/x-ndjson',
+        )
+
+    async def get_stream_tags(
+        self,
+        size: int,
+    ) -> JSONAPIResponse:
+        query: GetTwichStreamTags = GetTwichStreamTags(size=size)
+        tags: TwichStreamTagsDTO = await self.query_bus.dispatch(query)
+
+        response_meta: dict = {
+            'tags': [{'tag': tag, 'count': count} for tag, count in tags.data.items()],
+        }
+
+        response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
+            data=[],
+            meta=response_meta,
+        )
+
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    async def get_stream_history(
+        self,
+        request: Request,
+        id: Annotated[int, Path(gt=0)],
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> JSONAPIResponse:
+        query: GetTwichStreamHistory = GetTwichStreamHistory(id=id, start=start, end=end)
+        history: TwichStreamHistoryDTO = await self.query_bus.dispatch(query)
+
+        snapshots: list[dict] = []
+
+        for snapshot in history.data:
+            snapshot_attributes: dict = asdict(snapshot)
+            snapshot_attributes.pop('stream_id')
+            snapshots.append(snapshot_attributes)
+
+        resource_url: str = f'{request.url_for("get_stream", id=id)}'
+
+        links: dict = {
+            'self': f'{request.url_for("get_stream_history", id=id)}',
+            'stream': resource_url,
+        }
+
+        response_object: JSONAPIObjectSchema = JSONAPIObjectSchema(
+            id=id,
+            type='stream_history',
+            attributes={'snapshots': snapshots},
+            links=links,
+        )
+
+        response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
+            data=[response_object],
+        )
+
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
         )
@@ -4,20 +4,22 @@ user.py: File, containing twich user controllers.
 
 
 from dataclasses import asdict
-from typing import Annotated
+from typing import (
+    Annotated,
+    Optional,
+)
 
 from fastapi import (
     Path,
     Request,
     status,
 )
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 
 from application.commands import (
     DeleteTwichUser,
     DeleteTwichUserByLogin,
     ParseTwichUser,
+    ParseTwichUsers,
 )
 from application.dto import (
     ResultDTO,
@@ -34,7 +36,10 @@ from application.queries import (
     GetTwichUserByLogin,
 )
 from presentation.api.rest.v1.requests import JSONAPIPostSchema
-from presentation.api.rest.v1.responses import JSONAPISuccessResponseSchema
+from presentation.api.rest.v1.responses import (
+    JSONAPIResponse,
+    JSONAPISuccessResponseSchema,
+)
 from presentation.api.rest.v1.schemas import JSONAPIObjectSchema
 
 
@@ -46,7 +51,7 @@ class TwichUserCommandController:
         self,
         request: Request,
         body: JSONAPIPostSchema,
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         login: str = body.attributes['login']
 
         command: ParseTwichUser = ParseTwichUser(login=login)
@@ -80,16 +85,60 @@ class TwichUserCommandController:
             'Location': resource_url,
         }
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             headers=headers,
             status_code=status.HTTP_201_CREATED,
         )
 
+    async def parse_users(
+        self,
+        request: Request,
+        body: JSONAPIPostSchema,
+    ) -> JSONAPIResponse:
+        logins: list[str] = body.attributes['logins']
+
+        command: ParseTwichUsers = ParseTwichUsers(logins=logins)
+        result: ResultDTO = await self.command_bus.dispatch(command)
+
+        response_objects: list[JSONAPIObjectSchema] = []
+
+        for user_id in result.data['ids']:
+            resource_url: str = f'{request.url_for("get_user", id=user_id)}'
+
+            links: dict = {
+                'self': resource_url,
+            }
+
+            response_object: JSONAPIObjectSchema = JSONAPIObjectSchema(
+                id=user_id,
+                type='user',
+                attributes={},
+                links=links,
+            )
+
+            response_objects.append(response_object)
+
+        response_meta: dict = {
+            'status': result.status,
+            'description': result.description,
+            'failures': result.data['failures'],
+        }
+
+        response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
+            data=response_objects,
+            meta=response_meta,
+        )
+
+        return JSONAPIResponse(
+            content=response,
+            status_code=status.HTTP_201_CREATED,
+        )
+
     async def delete_user(
         self,
         id: Annotated[int, Path(gt=0)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         command: DeleteTwichUser = DeleteTwichUser(id=id)
         result: ResultDTO = await self.command_bus.dispatch(command)
 
@@ -103,15 +152,15 @@ class TwichUserCommandController:
             meta=response_meta,
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
 
     async def delete_user_by_login(
         self,
         login: Annotated[str, Path(min_length=1, max_length=128)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         command: DeleteTwichUserByLogin = DeleteTwichUserByLogin(login=login)
         result: ResultDTO = await self.command_bus.dispatch(command)
 
@@ -125,8 +174,8 @@ class TwichUserCommandController:
             meta=response_meta,
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
 
@@ -139,7 +188,7 @@ class TwichUserQueryController:
         self,
         request: Request,
         id: Annotated[int, Path(gt=0)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         query: GetTwichUser = GetTwichUser(id=id)
         user: TwichUserDTO = await self.query_bus.dispatch(query)
 
@@ -163,8 +212,8 @@ class TwichUserQueryController:
             data=[response_object],
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
 
@@ -172,7 +221,7 @@ class TwichUserQueryController:
         self,
         request: Request,
         login: Annotated[str, Path(min_length=1, max_length=128)],
-    ) -> JSONResponse:
+    ) -> JSONAPIResponse:
         query: GetTwichUserByLogin = GetTwichUserByLogin(login=login)
         user: TwichUserDTO = await self.query_bus.dispatch(query)
 
@@ -196,16 +245,19 @@ class TwichUserQueryController:
             data=[response_object],
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
 
     async def get_all_users(
         self,
         request: Request,
-    ) -> JSONResponse:
-        query: GetAllTwichUsers = GetAllTwichUsers()
+        limit: int,
+        cursor: Optional[str],
+        fields: Optional[list[str]],
+    ) -> JSONAPIResponse:
+        query: GetAllTwichUsers = GetAllTwichUsers(limit=limit, cursor=cursor, fields=fields)
         users: TwichUsersDTO = await self.query_bus.dispatch(query)
 
         response_objects: list[JSONAPIObjectSchema] = []
@@ -214,6 +266,11 @@ class TwichUserQueryController:
             user_attribtutes: dict = asdict(user)
             user_id: int = user_attribtutes.pop('id')
 
+            if fields:
+                user_attribtutes = {
+                    key: value for key, value in user_attribtutes.items() if key in fields
+                }
+
             resource_url: str = f'{request.url_for("get_user", id=user_id)}'
 
             links: dict = {
@@ -229,11 +286,16 @@ class TwichUserQueryController:
 
             response_objects.append(response_object)
 
+        response_meta: dict = {
+            'cursor': users.cursor,
+        }
+
         response: JSONAPISuccessResponseSchema = JSONAPISuccessResponseSchema(
             data=response_objects,
+            meta=response_meta,
         )
 
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return JSONAPIResponse(
+            content=response,
             status_code=status.HTTP_200_OK,
         )
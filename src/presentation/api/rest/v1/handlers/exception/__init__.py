@@ -3,6 +3,9 @@ __init__.py: File, containing other exception handler modules to simplify import
 """
 
 
+from presentation.api.rest.v1.handlers.exception.invalid_cursor import (
+    InvalidCursorExceptionHandler,
+)
 from presentation.api.rest.v1.handlers.exception.object_not_found import (
     ObjectNotFoundExceptionHandler,
 )
@@ -22,6 +25,7 @@ from presentation.api.rest.v1.handlers.exception.twich_token_not_obtained import
 
 
 __all__: list[str] = [
+    'InvalidCursorExceptionHandler',
     'ObjectNotFoundExceptionHandler',
     'ParserExceptionHandler',
     'TwichGetObjectBadRequestExceptionHandler',
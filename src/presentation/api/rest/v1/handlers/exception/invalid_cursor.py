@@ -0,0 +1,34 @@
+"""
+invalid_cursor.py: File, containing invalid cursor exception handler.
+"""
+
+
+from uuid import uuid4
+
+from fastapi import status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from application.exceptions import InvalidCursorException
+from application.interfaces.handler import IExceptionHandler
+from presentation.api.rest.v1.responses import JSONAPIFailureResponseSchema
+from presentation.api.rest.v1.schemas import JSONAPIErrorSchema
+
+
+class InvalidCursorExceptionHandler(IExceptionHandler[InvalidCursorException]):
+    async def handle(self, exception: InvalidCursorException) -> JSONResponse:
+        response_error: JSONAPIErrorSchema = JSONAPIErrorSchema(
+            id=uuid4().int,
+            status='Bad Request',
+            code='400',
+            detail=str(exception),
+        )
+
+        response: JSONAPIFailureResponseSchema = JSONAPIFailureResponseSchema(
+            errors=[response_error],
+        )
+
+        return JSONResponse(
+            content=jsonable_encoder(response),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
@@ -13,6 +13,10 @@ class TwichGameMetadata:
     parse_game_description: ClassVar[str] = 'Parse game of the twich platform.'
     parse_game_response_description: ClassVar[str] = 'Game has been parsed.'
 
+    parse_games_summary: ClassVar[str] = 'Parse several games of the twich platform.'
+    parse_games_description: ClassVar[str] = 'Parse up to 100 games per twich request.'
+    parse_games_response_description: ClassVar[str] = 'Games have been parsed.'
+
     delete_game_summary: ClassVar[str] = 'Delete twich game by id.'
     delete_game_description: ClassVar[str] = 'Delete twich game by id.'
     delete_game_response_description: ClassVar[str] = 'Game has been deleted.'
@@ -41,6 +45,14 @@ class TwichGameMetadata:
             'response_description': cls.parse_game_response_description,
         }
 
+    @ReadOnlyClassProperty
+    def parse_games(cls) -> dict:
+        return {
+            'summary': cls.parse_games_summary,
+            'description': cls.parse_games_description,
+            'response_description': cls.parse_games_response_description,
+        }
+
     @ReadOnlyClassProperty
     def delete_game(cls) -> dict:
         return {
@@ -0,0 +1,22 @@
+"""
+metrics.py: File, containing twich api client metrics metadata.
+"""
+
+
+from typing import ClassVar
+
+from shared.utils import ReadOnlyClassProperty
+
+
+class TwichMetricsMetadata:
+    get_metrics_summary: ClassVar[str] = 'Return twich api client metrics.'
+    get_metrics_description: ClassVar[str] = 'Return rate limit, latency and hedging state.'
+    get_metrics_response_description: ClassVar[str] = 'Metrics have been returned.'
+
+    @ReadOnlyClassProperty
+    def get_metrics(cls) -> dict:
+        return {
+            'summary': cls.get_metrics_summary,
+            'description': cls.get_metrics_description,
+            'response_description': cls.get_metrics_response_description,
+        }
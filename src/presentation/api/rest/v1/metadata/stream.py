@@ -13,6 +13,14 @@ class TwichStreamMetadata:
     parse_stream_description: ClassVar[str] = 'Parse stream of the twich platform.'
     parse_stream_response_description: ClassVar[str] = 'Stream has been parsed.'
 
+    parse_streams_summary: ClassVar[str] = 'Parse several streams of the twich platform.'
+    parse_streams_description: ClassVar[str] = 'Parse up to 100 streams per twich request.'
+    parse_streams_response_description: ClassVar[str] = 'Streams have been parsed.'
+
+    crawl_streams_summary: ClassVar[str] = 'Crawl all live streams of the twich game.'
+    crawl_streams_description: ClassVar[str] = 'Page through all live streams of the twich game.'
+    crawl_streams_response_description: ClassVar[str] = 'Streams have been crawled.'
+
     delete_stream_summary: ClassVar[str] = 'Delete twich stream by id.'
     delete_stream_description: ClassVar[str] = 'Delete twich stream by id.'
     delete_stream_response_description: ClassVar[str] = 'Stream has been deleted.'
@@ -29,10 +37,24 @@ class TwichStreamMetadata:
     get_stream_by_user_login_description: ClassVar[str] = 'Return twich stream by user login.'
     get_stream_by_user_login_response_description: ClassVar[str] = 'Stream has been returned.'
 
+    get_stream_history_summary: ClassVar[str] = 'Return viewer history of twich stream.'
+    get_stream_history_description: ClassVar[str] = 'Return viewer snapshots within time range.'
+    get_stream_history_response_description: ClassVar[str] = 'History has been returned.'
+
     get_all_streams_summary: ClassVar[str] = 'Return all twich streams.'
     get_all_streams_description: ClassVar[str] = 'Return all twich streams.'
     get_all_streams_response_description: ClassVar[str] = 'All streams have been returned.'
 
+    export_streams_summary: ClassVar[str] = 'Export all twich streams.'
+    export_streams_description: ClassVar[
+        str
+    ] = 'Stream all twich streams as newline delimited json.'
+    export_streams_response_description: ClassVar[str] = 'Streams have been exported.'
+
+    get_stream_tags_summary: ClassVar[str] = 'Return most popular twich stream tags.'
+    get_stream_tags_description: ClassVar[str] = 'Return tags with stream counts.'
+    get_stream_tags_response_description: ClassVar[str] = 'Tags have been returned.'
+
     @ReadOnlyClassProperty
     def parse_stream(cls) -> dict:
         return {
@@ -41,6 +63,22 @@ class TwichStreamMetadata:
             'response_description': cls.parse_stream_response_description,
         }
 
+    @ReadOnlyClassProperty
+    def parse_streams(cls) -> dict:
+        return {
+            'summary': cls.parse_streams_summary,
+            'description': cls.parse_streams_description,
+            'response_description': cls.parse_streams_response_description,
+        }
+
+    @ReadOnlyClassProperty
+    def crawl_streams(cls) -> dict:
+        return {
+            'summary': cls.crawl_streams_summary,
+            'description': cls.crawl_streams_description,
+            'response_description': cls.crawl_streams_response_description,
+        }
+
     @ReadOnlyClassProperty
     def delete_stream(cls) -> dict:
         return {
@@ -73,6 +111,14 @@ class TwichStreamMetadata:
             'response_description': cls.get_stream_by_user_login_response_description,
         }
 
+    @ReadOnlyClassProperty
+    def get_stream_history(cls) -> dict:
+        return {
+            'summary': cls.get_stream_history_summary,
+            'description': cls.get_stream_history_description,
+            'response_description': cls.get_stream_history_response_description,
+        }
+
     @ReadOnlyClassProperty
     def get_all_streams(cls) -> dict:
         return {
@@ -80,3 +126,19 @@ class TwichStreamMetadata:
             'description': cls.get_all_streams_description,
             'response_description': cls.get_all_streams_response_description,
         }
+
+    @ReadOnlyClassProperty
+    def export_streams(cls) -> dict:
+        return {
+            'summary': cls.export_streams_summary,
+            'description': cls.export_streams_description,
+            'response_description': cls.export_streams_response_description,
+        }
+
+    @ReadOnlyClassProperty
+    def get_stream_tags(cls) -> dict:
+        return {
+            'summary': cls.get_stream_tags_summary,
+            'description': cls.get_stream_tags_description,
+            'response_description': cls.get_stream_tags_response_description,
+        }
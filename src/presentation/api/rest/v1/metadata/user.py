@@ -13,6 +13,10 @@ class TwichUserMetadata:
     parse_user_description: ClassVar[str] = 'Parse user of the twich platform.'
     parse_user_response_description: ClassVar[str] = 'Uame has been parsed.'
 
+    parse_users_summary: ClassVar[str] = 'Parse several users of the twich platform.'
+    parse_users_description: ClassVar[str] = 'Parse up to 100 users per twich request.'
+    parse_users_response_description: ClassVar[str] = 'Users have been parsed.'
+
     delete_user_summary: ClassVar[str] = 'Delete twich user by id.'
     delete_user_description: ClassVar[str] = 'Delete twich user by id.'
     delete_user_response_description: ClassVar[str] = 'User has been deleted.'
@@ -41,6 +45,14 @@ class TwichUserMetadata:
             'response_description': cls.parse_user_response_description,
         }
 
+    @ReadOnlyClassProperty
+    def parse_users(cls) -> dict:
+        return {
+            'summary': cls.parse_users_summary,
+            'description': cls.parse_users_description,
+            'response_description': cls.parse_users_response_description,
+        }
+
     @ReadOnlyClassProperty
     def delete_user(cls) -> dict:
         return {
@@ -0,0 +1,37 @@
+"""
+json.py: File, containing json response class.
+"""
+
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from shared.utils import json_dumps
+
+
+class JSONAPIResponse(JSONResponse):
+    """
+    JSONAPIResponse: Class, representing json response, rendered with fast json serializer.
+    Response schemas are dumped directly, without intermediate jsonable_encoder pass.
+
+    Bases:
+        1) JSONResponse: Starlette json response.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        render: Render content to json bytes.
+
+        Args:
+            content (Any): Response schema or json-compatible object.
+
+        Returns:
+            bytes: Rendered content.
+        """
+
+        if isinstance(content, BaseModel):
+            content = content.model_dump()
+
+        return json_dumps(content)
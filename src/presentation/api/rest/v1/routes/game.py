@@ -3,7 +3,10 @@ game.py: File, containing twich game routes.
 """
 
 
-from typing import Annotated
+from typing import (
+    Annotated,
+    Optional,
+)
 
 from dependency_injector.wiring import (
     Provide,
@@ -13,6 +16,7 @@ from fastapi import (
     APIRouter,
     Depends,
     Path,
+    Query,
     Request,
 )
 from fastapi.responses import JSONResponse
@@ -47,6 +51,21 @@ async def parse_game(
     return await controller.parse_game(request=request, body=body)
 
 
+@router.post(
+    path='/games',
+    **TwichGameMetadata.parse_games,
+)
+@inject
+async def parse_games(
+    request: Request,
+    body: JSONAPIPostSchema,
+    controller: TwichGameCommandController = Depends(
+        Provide[RootContainer.game_container.rest_v1_game_command_controller]
+    ),
+) -> JSONResponse:
+    return await controller.parse_games(request=request, body=body)
+
+
 @router.delete(
     path='/game/{id:int}',
     **TwichGameMetadata.delete_game,
@@ -112,8 +131,16 @@ async def get_game_by_name(
 @inject
 async def get_all_games(
     request: Request,
+    limit: Annotated[int, Query(gt=0, le=1000)] = 100,
+    cursor: Annotated[Optional[str], Query()] = None,
+    fields: Annotated[Optional[list[str]], Query()] = None,
     controller: TwichGameQueryController = Depends(
         Provide[RootContainer.game_container.rest_v1_game_query_controller]
     ),
 ) -> JSONResponse:
-    return await controller.get_all_games(request=request)
+    return await controller.get_all_games(
+        request=request,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+    )
@@ -0,0 +1,37 @@
+"""
+metrics.py: File, containing twich api client metrics routes.
+"""
+
+
+from dependency_injector.wiring import (
+    Provide,
+    inject,
+)
+from fastapi import (
+    APIRouter,
+    Depends,
+    Request,
+)
+from fastapi.responses import JSONResponse
+
+from container import RootContainer
+from presentation.api.rest.v1.controllers import TwichMetricsController
+from presentation.api.rest.v1.metadata import TwichMetricsMetadata
+
+
+router: APIRouter = APIRouter(
+    prefix='/twich',
+    tags=['metrics'],
+)
+
+
+@router.get(
+    path='/metrics',
+    **TwichMetricsMetadata.get_metrics,
+)
+@inject
+async def get_metrics(
+    request: Request,
+    controller: TwichMetricsController = Depends(Provide[RootContainer.rest_v1_metrics_controller]),
+) -> JSONResponse:
+    return await controller.get_metrics(request=request)
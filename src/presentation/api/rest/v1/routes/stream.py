@@ -3,7 +3,11 @@ stream.py: File, containing twich stream routes.
 """
 
 
-from typing import Annotated
+from datetime import datetime
+from typing import (
+    Annotated,
+    Optional,
+)
 
 from dependency_injector.wiring import (
     Provide,
@@ -13,9 +17,13 @@ from fastapi import (
     APIRouter,
     Depends,
     Path,
+    Query,
     Request,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import (
+    JSONResponse,
+    StreamingResponse,
+)
 
 from container import RootContainer
 from presentation.api.rest.v1.controllers import (
@@ -47,6 +55,36 @@ async def parse_stream(
     return await controller.parse_stream(request=request, body=body)
 
 
+@router.post(
+    path='/streams',
+    **TwichStreamMetadata.parse_streams,
+)
+@inject
+async def parse_streams(
+    request: Request,
+    body: JSONAPIPostSchema,
+    controller: TwichStreamCommandController = Depends(
+        Provide[RootContainer.stream_container.rest_v1_stream_command_controller]
+    ),
+) -> JSONResponse:
+    return await controller.parse_streams(request=request, body=body)
+
+
+@router.post(
+    path='/streams/crawl',
+    **TwichStreamMetadata.crawl_streams,
+)
+@inject
+async def crawl_streams(
+    request: Request,
+    body: JSONAPIPostSchema,
+    controller: TwichStreamCommandController = Depends(
+        Provide[RootContainer.stream_container.rest_v1_stream_command_controller]
+    ),
+) -> JSONResponse:
+    return await controller.crawl_streams(request=request, body=body)
+
+
 @router.delete(
     path='/stream/{id:int}',
     **TwichStreamMetadata.delete_stream,
@@ -105,6 +143,23 @@ async def get_stream_by_user_login(
     return await controller.get_stream_by_user_login(request=request, user_login=user_login)
 
 
+@router.get(
+    path='/stream/{id:int}/history',
+    **TwichStreamMetadata.get_stream_history,
+)
+@inject
+async def get_stream_history(
+    request: Request,
+    id: Annotated[int, Path(gt=0)],
+    start: Annotated[Optional[datetime], Query()] = None,
+    end: Annotated[Optional[datetime], Query()] = None,
+    controller: TwichStreamQueryController = Depends(
+        Provide[RootContainer.stream_container.rest_v1_stream_query_controller]
+    ),
+) -> JSONResponse:
+    return await controller.get_stream_history(request=request, id=id, start=start, end=end)
+
+
 @router.get(
     path='/streams',
     **TwichStreamMetadata.get_all_streams,
@@ -112,8 +167,46 @@ async def get_stream_by_user_login(
 @inject
 async def get_all_streams(
     request: Request,
+    limit: Annotated[int, Query(gt=0, le=1000)] = 100,
+    cursor: Annotated[Optional[str], Query()] = None,
+    fields: Annotated[Optional[list[str]], Query()] = None,
+    tags: Annotated[Optional[list[str]], Query()] = None,
+    controller: TwichStreamQueryController = Depends(
+        Provide[RootContainer.stream_container.rest_v1_stream_query_controller]
+    ),
+) -> JSONResponse:
+    return await controller.get_all_streams(
+        request=request,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+        tags=tags,
+    )
+
+
+@router.get(
+    path='/streams/tags',
+    **TwichStreamMetadata.get_stream_tags,
+)
+@inject
+async def get_stream_tags(
+    size: Annotated[int, Query(gt=0, le=1000)] = 10,
     controller: TwichStreamQueryController = Depends(
         Provide[RootContainer.stream_container.rest_v1_stream_query_controller]
     ),
 ) -> JSONResponse:
-    return await controller.get_all_streams(request=request)
+    return await controller.get_stream_tags(size=size)
+
+
+@router.get(
+    path='/streams/export',
+    **TwichStreamMetadata.export_streams,
+)
+@inject
+async def export_streams(
+    fields: Annotated[Optional[list[str]], Query()] = None,
+    controller: TwichStreamQueryController = Depends(
+        Provide[RootContainer.stream_container.rest_v1_stream_query_controller]
+    ),
+) -> StreamingResponse:
+    return await controller.export_streams(fields=fields)
@@ -3,7 +3,10 @@ user.py: File, containing twich user routes.
 """
 
 
-from typing import Annotated
+from typing import (
+    Annotated,
+    Optional,
+)
 
 from dependency_injector.wiring import (
     Provide,
@@ -13,6 +16,7 @@ from fastapi import (
     APIRouter,
     Depends,
     Path,
+    Query,
     Request,
 )
 from fastapi.responses import JSONResponse
@@ -47,6 +51,21 @@ async def parse_user(
     return await controller.parse_user(request=request, body=body)
 
 
+@router.post(
+    path='/users',
+    **TwichUserMetadata.parse_users,
+)
+@inject
+async def parse_users(
+    request: Request,
+    body: JSONAPIPostSchema,
+    controller: TwichUserCommandController = Depends(
+        Provide[RootContainer.user_container.rest_v1_user_command_controller]
+    ),
+) -> JSONResponse:
+    return await controller.parse_users(request=request, body=body)
+
+
 @router.delete(
     path='/user/{id:int}',
     **TwichUserMetadata.delete_user,
@@ -112,8 +131,16 @@ async def get_user_by_login(
 @inject
 async def get_all_users(
     request: Request,
+    limit: Annotated[int, Query(gt=0, le=1000)] = 100,
+    cursor: Annotated[Optional[str], Query()] = None,
+    fields: Annotated[Optional[list[str]], Query()] = None,
     controller: TwichUserQueryController = Depends(
         Provide[RootContainer.user_container.rest_v1_user_query_controller]
     ),
 ) -> JSONResponse:
-    return await controller.get_all_users(request=request)
+    return await controller.get_all_users(
+        request=request,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+    )
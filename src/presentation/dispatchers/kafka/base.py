@@ -0,0 +1,185 @@
+"""
+base.py: File, containing base kafka dispatcher.
+"""
+
+
+import asyncio
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from pickle import loads
+from threading import Thread
+from time import monotonic
+from typing import (
+    Generic,
+    Protocol,
+    TypeVar,
+)
+
+from kafka import KafkaConsumer
+
+from application.exceptions import ObjectNotFoundException
+from application.interfaces.repository import IRepository
+from domain.events import DomainEvent
+from domain.models import DM
+from shared.interfaces.logger import ILogger
+
+
+class ObjectEvent(Protocol):
+    @property
+    def id(self) -> int:
+        ...
+
+
+CE = TypeVar('CE', bound=ObjectEvent)
+DE = TypeVar('DE', bound=ObjectEvent)
+
+
+class TwichKafkaDispatcher(ABC, Generic[DM, CE, DE]):
+    """
+    TwichKafkaDispatcher: Class, that represents base kafka dispatcher, projecting domain events
+    into repository in bulk.
+    """
+
+    created_event: type[CE]
+    deleted_event: type[DE]
+
+    def __init__(
+        self,
+        bootstrap_servers: str,
+        api_version: tuple,
+        topic: str,
+        repository: IRepository[DM],
+        logger: ILogger,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """
+        __init__: Initialize kafka dispatcher.
+
+        Args:
+            bootstrap_servers (str): Kafka host and port.
+            api_version (tuple): Consumer api version.
+            topic (str): Name of the topic.
+            repository (IRepository[DM]): Projection repository.
+            logger (ILogger): Logger.
+            batch_size (int): Maximum number of distinct objects in one flush.
+            flush_interval (float): Maximum time in seconds between flushes.
+        """
+
+        self.consumer: KafkaConsumer = KafkaConsumer(
+            bootstrap_servers=bootstrap_servers,
+            api_version=api_version,
+            enable_auto_commit=False,
+            value_deserializer=lambda v: loads(v),
+        )
+        self.consumer.subscribe([topic])
+        self.repository: IRepository[DM] = repository
+        self.logger: ILogger = logger
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.upserts: dict[int, DM] = {}
+        self.deletes: set[int] = set()
+        Thread(
+            target=asyncio.run,
+            args=(self.run(),),
+            daemon=True,
+        ).start()
+
+    @abstractmethod
+    def to_domain(self, event: CE) -> DM:
+        """
+        to_domain: Convert created event into domain model.
+
+        Args:
+            event (CE): Created event.
+
+        Returns:
+            DM: Domain model.
+        """
+
+        raise NotImplementedError
+
+    def collect(self, event: DomainEvent) -> None:
+        """
+        collect: Add event to current window. Later events for the same id replace earlier ones.
+
+        Args:
+            event (DomainEvent): Domain event.
+        """
+
+        if isinstance(event, self.created_event):
+            self.deletes.discard(event.id)
+            self.upserts[event.id] = self.to_domain(event)
+        elif isinstance(event, self.deleted_event):
+            self.upserts.pop(event.id, None)
+            self.deletes.add(event.id)
+
+    async def flush(self) -> None:
+        """
+        flush: Write current window into repository.
+        """
+
+        if self.upserts:
+            failures: dict[int, str] = await self.repository.add_or_update_many(
+                list(self.upserts.values()),
+            )
+
+            for id, error in failures.items():
+                self.logger.warning(f'Projection of {id} has failed: {error}')
+
+        for id in self.deletes:
+            try:
+                await self.repository.delete_by_id(id)
+            except ObjectNotFoundException:
+                pass
+
+        self.upserts = {}
+        self.deletes = set()
+
+    async def run(self) -> None:
+        """
+        run: Run kafka consumer, flushing events when window is full or flush interval expires.
+        Offsets are committed only after a successful flush, so events of a failed window are
+        redelivered after restart or rebalance. Failed flush is logged and retried after flush
+        interval. While the window stays full, partitions are paused but still polled, so the
+        consumer is not dropped from the group after max poll interval.
+        """
+
+        deadline: float = monotonic() + self.flush_interval
+        uncommitted: bool = False
+
+        while True:
+            timeout: float = max(0.0, deadline - monotonic())
+            window: int = len(self.upserts) + len(self.deletes)
+
+            if window < self.batch_size:
+                if self.consumer.paused():
+                    self.consumer.resume(*self.consumer.paused())
+            else:
+                self.consumer.pause(*self.consumer.assignment())
+
+            records: dict = self.consumer.poll(
+                timeout_ms=int(timeout * 1000),
+                max_records=max(self.batch_size - window, 1),
+            )
+
+            for partition_records in records.values():
+                for record in partition_records:
+                    uncommitted = True
+                    self.collect(record.value)
+
+            if len(self.upserts) + len(self.deletes) >= self.batch_size or monotonic() >= deadline:
+                try:
+                    await self.flush()
+
+                    if uncommitted:
+                        self.consumer.commit()
+                        uncommitted = False
+                except Exception as exception:
+                    self.logger.error(
+                        f'Projection flush has failed, it will be retried: {exception}'
+                    )
+
+                deadline = monotonic() + self.flush_interval
@@ -3,7 +3,10 @@ settings.py: File, containing settings for a project.
 """
 
 
-from typing import ClassVar
+from typing import (
+    ClassVar,
+    Union,
+)
 
 from pydantic_settings import (
     BaseSettings,
@@ -23,6 +26,8 @@ class Settings(BaseSettings):
     DB_MONGO_HOST: str
     DB_MONGO_PORT: int
     DB_MONGO_AUTH_SOURCE: str
+    DB_MONGO_DRIVER: str = 'mongoengine'
+    DB_MONGO_WRITE_CONCERN: dict[str, Union[int, str]] = {}
 
     REDIS_PROTOCOL: str
     REDIS_USERNAME: str
@@ -39,6 +44,9 @@ class Settings(BaseSettings):
     ELASTIC_PROTOCOL: str
     ELASTIC_HOST: str
     ELASTIC_PORT: int
+    ELASTIC_DRIVER: str = 'elasticsearch_dsl'
+    ELASTIC_REQUEST_TIMEOUT: float = 10.0
+    ELASTIC_CONNECTIONS_LIMIT: int = 25
 
     TWICH_TOKEN_URL: str
     TWICH_CLIENT_ID: str
@@ -46,12 +54,29 @@ class Settings(BaseSettings):
     TWICH_API_TOKEN_TYPE: str
     TWICH_API_GRANT_TYPE: str
     TWICH_API_CONTENT_TYPE: str
+    TWICH_API_TOKEN_REFRESH_MARGIN: int = 300
     TWICH_GET_GAME_BASE_URL: str
     TWICH_GET_USER_BASE_URL: str
     TWICH_GET_STREAM_BASE_URL: str
+    TWICH_RATE_LIMIT: int = 800
+    TWICH_REQUEST_TIMEOUT: float = 10.0
+    TWICH_REQUEST_RETRIES: int = 3
+    TWICH_REQUEST_BACKOFF_BASE: float = 0.2
+    TWICH_REQUEST_BACKOFF_MAX: float = 5.0
+    TWICH_CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    TWICH_CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = 30.0
+    TWICH_HEDGING_ENABLED: bool = False
+    TWICH_HEDGING_PERCENTILE: float = 0.95
+    TWICH_HEDGING_BUDGET: float = 0.05
+    TWICH_HTTP_CONNECTIONS_LIMIT: int = 100
+    TWICH_HTTP_CONNECTIONS_LIMIT_PER_HOST: int = 30
+    TWICH_HTTP_DNS_CACHE_TTL: int = 300
+    TWICH_HTTP_KEEPALIVE_TIMEOUT: float = 30.0
     KAFKA_GAME_TOPIC: str
     KAFKA_STREAM_TOPIC: str
     KAFKA_USER_TOPIC: str
+    KAFKA_PROJECTION_BATCH_SIZE: int = 500
+    KAFKA_PROJECTION_FLUSH_INTERVAL: float = 1.0
 
     model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(case_sensitive=True)
 
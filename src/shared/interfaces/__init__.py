@@ -4,9 +4,11 @@ __init__.py: File, containing other interface modules to simplify import.
 
 
 from shared.interfaces.logger import ILogger
+from shared.interfaces.metrics import IMetrics
 
 
 __all__: list[str] = [
     'IExceptionHandler',
     'ILogger',
+    'IMetrics',
 ]
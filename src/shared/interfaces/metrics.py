@@ -0,0 +1,16 @@
+"""
+metrics.py: File, containing metrics interface.
+"""
+
+
+from abc import (
+    ABC as Interface,
+    abstractmethod,
+)
+
+
+class IMetrics(Interface):
+    @property
+    @abstractmethod
+    def metrics(self) -> dict[str, float]:
+        raise NotImplementedError
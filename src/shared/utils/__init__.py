@@ -7,9 +7,17 @@ from shared.utils.decorators import (
     ReadOnlyClassProperty,
     Singleton,
 )
+from shared.utils.mappers import compile_mapper
+from shared.utils.serialization import (
+    json_dumps,
+    json_loads,
+)
 
 
 __all__: list[str] = [
     'ReadOnlyClassProperty',
     'Singleton',
+    'compile_mapper',
+    'json_dumps',
+    'json_loads',
 ]
@@ -0,0 +1,62 @@
+"""
+mappers.py: File, containing generated mappers between dataclasses and persistence objects.
+"""
+
+
+from dataclasses import fields
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+
+@lru_cache(maxsize=None)
+def compile_mapper(
+    target: type,
+    from_dict: bool = False,
+    aliases: tuple[tuple[str, str], ...] = (),
+    converters: tuple[tuple[str, Callable[[Any], Any]], ...] = (),
+    fields_of: Optional[type] = None,
+) -> Callable[[Any], Any]:
+    """
+    compile_mapper: Generate and cache function, that maps source object to target dataclass.
+    Field list of the target is resolved once, so mapping is a plain constructor call.
+
+    Args:
+        target (type): Target dataclass.
+        from_dict (bool): Read raw dict (pymongo document) instead of object attributes.
+            Missing keys are mapped to None.
+        aliases (tuple[tuple[str, str], ...]): Pairs of (target field, source name).
+        converters (tuple[tuple[str, Callable[[Any], Any]], ...]): Pairs of (target field,
+            function applied to source value).
+        fields_of (Optional[type]): Dataclass, which init fields are mapped. Defaults to target,
+            set it to map into non-dataclass targets, like elastic documents.
+
+    Returns:
+        Callable[[Any], Any]: Mapper function.
+    """
+
+    names: dict[str, str] = dict(aliases)
+    functions: dict[str, Callable[[Any], Any]] = dict(converters)
+    namespace: dict[str, Any] = {'target': target}
+    arguments: list[str] = []
+
+    for field in fields(fields_of or target):
+        if not field.init:
+            continue
+
+        name: str = names.get(field.name, field.name)
+        value: str = f'source.get({name!r})' if from_dict else f'source.{name}'
+
+        if field.name in functions:
+            namespace[f'convert_{field.name}'] = functions[field.name]
+            value = f'convert_{field.name}({value})'
+
+        arguments.append(f'{field.name}={value}')
+
+    source: str = f'def map(source):\n    return target({", ".join(arguments)})\n'
+    exec(compile(source, f'<mapper {target.__qualname__}>', 'exec'), namespace)
+
+    return namespace['map']
@@ -0,0 +1,76 @@
+"""
+serialization.py: File, containing json serialization with optional orjson support.
+"""
+
+
+import json
+from datetime import (
+    date,
+    datetime,
+    time,
+)
+from typing import Any
+from uuid import UUID
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+
+    if isinstance(obj, UUID):
+        return str(obj)
+
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(
+        obj,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(',', ':'),
+    ).encode('utf-8')
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    json_dumps: Serialize object to json bytes, using orjson if it is installed.
+
+    Args:
+        obj (Any): Object to serialize.
+
+    Returns:
+        bytes: Serialized object.
+    """
+
+    if orjson is None:
+        return _stdlib_dumps(obj)
+
+    try:
+        return orjson.dumps(obj, default=_default)
+    except orjson.JSONEncodeError:
+        return _stdlib_dumps(obj)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    json_loads: Deserialize json, using orjson if it is installed.
+
+    Args:
+        data (str | bytes): Json document.
+
+    Returns:
+        Any: Deserialized object.
+    """
+
+    if orjson is None:
+        return json.loads(data)
+
+    return orjson.loads(data)
@@ -0,0 +1,82 @@
+"""
+test_mapper_benchmark.py: File, containing benchmark of reflective and compiled mappers.
+"""
+
+
+from dataclasses import fields
+from datetime import datetime
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+)
+
+import pytest
+
+from domain.models import TwichStream
+from shared.utils import compile_mapper
+
+
+DOCUMENTS: int = 100_000
+
+
+def make_documents() -> list[dict]:
+    return [
+        {
+            '_id': id,
+            'user_id': id,
+            'user_name': f'user {id}',
+            'user_login': f'user_{id}',
+            'game_id': id % 50,
+            'game_name': f'game {id % 50}',
+            'language': 'en',
+            'title': f'stream number {id}',
+            'tags': ['English', 'PC'],
+            'started_at': datetime(2024, 5, 1, 12, 30),
+            'viewer_count': id * 7,
+            'type': 'live',
+            'parsed_at': datetime(2024, 5, 1, 13, 0),
+        }
+        for id in range(1, DOCUMENTS + 1)
+    ]
+
+
+def reflective_mapper(document: dict) -> TwichStream:
+    arguments: dict[str, Any] = {
+        field.name: document.get('_id' if field.name == 'id' else field.name)
+        for field in fields(TwichStream)
+        if field.init
+    }
+
+    return TwichStream(**arguments)
+
+
+def measure(mapper: Callable[[dict], TwichStream], documents: list[dict]) -> float:
+    started_at: float = perf_counter()
+
+    for document in documents:
+        mapper(document)
+
+    return perf_counter() - started_at
+
+
+@pytest.mark.benchmark
+def test_compiled_mapper_is_faster_than_reflective_mapper() -> None:
+    documents: list[dict] = make_documents()
+    compiled_mapper: Callable[[dict], TwichStream] = compile_mapper(
+        TwichStream,
+        from_dict=True,
+        aliases=(('id', '_id'),),
+    )
+
+    assert compiled_mapper(documents[0]) == reflective_mapper(documents[0])
+
+    before: float = measure(reflective_mapper, documents)
+    after: float = measure(compiled_mapper, documents)
+
+    print(
+        f'\n{DOCUMENTS} documents: '
+        f'reflective mapper {before:.3f} s, compiled mapper {after:.3f} s'
+    )
+
+    assert after < before
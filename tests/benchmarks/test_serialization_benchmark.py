@@ -0,0 +1,91 @@
+"""
+test_serialization_benchmark.py: File, containing benchmark of get_all_streams response rendering.
+"""
+
+
+import json
+from dataclasses import asdict
+from datetime import datetime
+from time import perf_counter
+from typing import Callable
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from application.dto import TwichStreamDTO
+from presentation.api.rest.v1.responses import (
+    JSONAPIResponse,
+    JSONAPISuccessResponseSchema,
+)
+from presentation.api.rest.v1.schemas import JSONAPIObjectSchema
+
+
+STREAMS: int = 1000
+ROUNDS: int = 20
+
+
+def make_response() -> JSONAPISuccessResponseSchema:
+    response_objects: list[JSONAPIObjectSchema] = []
+
+    for id in range(1, STREAMS + 1):
+        stream: TwichStreamDTO = TwichStreamDTO(
+            id=id,
+            user_id=id,
+            user_name=f'user {id}',
+            user_login=f'user_{id}',
+            game_id=id % 50,
+            game_name=f'game {id % 50}',
+            language='en',
+            title=f'stream number {id} — playing with friends',
+            tags=['English', 'Competitive', 'PC'],
+            started_at=datetime(2024, 5, 1, 12, 30),
+            viewer_count=id * 7,
+            type='live',
+            parsed_at=datetime(2024, 5, 1, 13, 0, 0, 123456),
+        )
+        attributes: dict = asdict(stream)
+
+        response_objects.append(
+            JSONAPIObjectSchema(
+                id=attributes.pop('id'),
+                type='stream',
+                attributes=attributes,
+                links={'self': f'http://localhost/api/v1/twich/stream/{id}'},
+            )
+        )
+
+    return JSONAPISuccessResponseSchema(data=response_objects, meta={'cursor': None})
+
+
+def measure(render: Callable[[], bytes]) -> float:
+    started_at: float = perf_counter()
+
+    for _ in range(ROUNDS):
+        render()
+
+    return perf_counter() - started_at
+
+
+@pytest.mark.benchmark
+def test_orjson_response_is_faster_than_jsonable_encoder() -> None:
+    response: JSONAPISuccessResponseSchema = make_response()
+
+    def render_with_jsonable_encoder() -> bytes:
+        return JSONResponse(content=jsonable_encoder(response)).body
+
+    def render_with_orjson() -> bytes:
+        return JSONAPIResponse(content=response).body
+
+    assert json.loads(render_with_jsonable_encoder()) == json.loads(render_with_orjson())
+
+    before: float = measure(render_with_jsonable_encoder)
+    after: float = measure(render_with_orjson)
+
+    print(
+        f'\n{STREAMS} streams, {ROUNDS} rounds: '
+        f'jsonable_encoder {before / ROUNDS * 1000:.1f} ms per response, '
+        f'orjson {after / ROUNDS * 1000:.1f} ms per response'
+    )
+
+    assert after < before
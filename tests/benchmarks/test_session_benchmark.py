@@ -0,0 +1,89 @@
+"""
+test_session_benchmark.py: File, containing benchmark of pooled and per-request aiohttp sessions.
+"""
+
+
+from asyncio import (
+    gather,
+    run,
+)
+from time import perf_counter
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+)
+
+import pytest
+from aiohttp import (
+    ClientSession,
+    web,
+)
+
+from infrastructure.parsers.aiohttp.dependencies import get_twich_client_session
+
+
+REQUESTS: int = 1000
+CONCURRENCY: int = 20
+
+
+async def handle(request: web.Request) -> web.Response:
+    return web.json_response({'data': [{'id': '1', 'name': 'game'}]})
+
+
+async def start_stub_server() -> tuple[web.AppRunner, str]:
+    app: web.Application = web.Application()
+    app.router.add_get('/helix/games', handle)
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+    site: web.TCPSite = web.TCPSite(runner, 'localhost', 0)
+    await site.start()
+    port: int = runner.addresses[0][1]
+
+    return runner, f'http://localhost:{port}/helix/games'
+
+
+async def measure(send: Callable[[], Awaitable[None]]) -> float:
+    started_at: float = perf_counter()
+
+    for _ in range(REQUESTS // CONCURRENCY):
+        await gather(*(send() for _ in range(CONCURRENCY)))
+
+    return perf_counter() - started_at
+
+
+async def benchmark() -> tuple[float, float]:
+    runner, url = await start_stub_server()
+    sessions: AsyncGenerator[ClientSession, None] = get_twich_client_session()
+    session: ClientSession = await anext(sessions)
+
+    async def send_with_new_session() -> None:
+        async with ClientSession() as new_session:
+            async with new_session.get(url) as response:
+                await response.json()
+
+    async def send_with_pooled_session() -> None:
+        async with session.get(url) as response:
+            await response.json()
+
+    try:
+        per_request: float = await measure(send_with_new_session)
+        pooled: float = await measure(send_with_pooled_session)
+    finally:
+        await sessions.aclose()
+        await runner.cleanup()
+
+    return per_request, pooled
+
+
+@pytest.mark.benchmark
+def test_pooled_session_is_faster_than_session_per_request() -> None:
+    per_request, pooled = run(benchmark())
+
+    print(
+        f'\n{REQUESTS} requests, {CONCURRENCY} concurrent: '
+        f'session per request {REQUESTS / per_request:.0f} req/s, '
+        f'pooled session {REQUESTS / pooled:.0f} req/s'
+    )
+
+    assert pooled < per_request
@@ -0,0 +1,47 @@
+"""
+conftest.py: File, containing common fixtures and test environment.
+"""
+
+
+import os
+
+
+TEST_ENVIRONMENT: dict[str, str] = {
+    'PROJECT_NAME': 'twich_parser_service',
+    'BACKEND_CORS_ORIGINS': '["*"]',
+    'API_NAME': 'api',
+    'DB_MONGO_NAME': 'twich',
+    'DB_MONGO_USERNAME': 'twich',
+    'DB_MONGO_PASSWORD': 'twich',
+    'DB_MONGO_HOST': 'localhost',
+    'DB_MONGO_PORT': '27017',
+    'DB_MONGO_AUTH_SOURCE': 'admin',
+    'REDIS_PROTOCOL': 'redis',
+    'REDIS_USERNAME': 'twich',
+    'REDIS_PASSWORD': 'twich',
+    'REDIS_HOST': 'localhost',
+    'REDIS_PORT': '6379',
+    'REDIS_DB_NUMBER': '0',
+    'KAFKA_BOOTSTRAP_SERVERS': 'localhost:9092',
+    'KAFKA_PRODUCER_API_VERSION': '[0, 11, 5]',
+    'KAFKA_CONSUMER_API_VERSION': '[0, 11, 5]',
+    'KAFKA_PARSING_TOPIC': 'parsing',
+    'ELASTIC_PROTOCOL': 'http',
+    'ELASTIC_HOST': 'localhost',
+    'ELASTIC_PORT': '9200',
+    'TWICH_TOKEN_URL': 'http://localhost/oauth2/token',
+    'TWICH_CLIENT_ID': 'client_id',
+    'TWICH_CLIENT_SECRET': 'client_secret',
+    'TWICH_API_TOKEN_TYPE': 'Bearer',
+    'TWICH_API_GRANT_TYPE': 'client_credentials',
+    'TWICH_API_CONTENT_TYPE': 'application/x-www-form-urlencoded',
+    'TWICH_GET_GAME_BASE_URL': 'http://localhost/helix/games',
+    'TWICH_GET_USER_BASE_URL': 'http://localhost/helix/users',
+    'TWICH_GET_STREAM_BASE_URL': 'http://localhost/helix/streams',
+    'KAFKA_GAME_TOPIC': 'game',
+    'KAFKA_STREAM_TOPIC': 'stream',
+    'KAFKA_USER_TOPIC': 'user',
+}
+
+for name, value in TEST_ENVIRONMENT.items():
+    os.environ.setdefault(name, value)
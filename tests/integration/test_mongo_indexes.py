@@ -0,0 +1,278 @@
+"""
+test_mongo_indexes.py: File, containing tests of query plans of mongo repositories.
+"""
+
+
+from asyncio import run
+from contextlib import suppress
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+)
+
+import pytest
+from bson import SON
+from mongoengine import disconnect
+from pymongo import (
+    MongoClient,
+    monitoring,
+)
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+
+from application.exceptions import ObjectNotFoundException
+from infrastructure.persistence.connections.mongo.database import MongoDatabase
+from infrastructure.persistence.connections.mongo.motor import MongoMotorDatabase
+from infrastructure.persistence.migrations.mongo import (
+    documents,
+    ensure_indexes,
+)
+from infrastructure.persistence.repositories.cursor import encode_cursor
+from infrastructure.persistence.repositories.mongo.game import TwichGameMongoRepository
+from infrastructure.persistence.repositories.mongo.stream import TwichStreamMongoRepository
+from infrastructure.persistence.repositories.mongo.user import TwichUserMongoRepository
+from infrastructure.persistence.repositories.motor.game import TwichGameMotorRepository
+from infrastructure.persistence.repositories.motor.stream import TwichStreamMotorRepository
+from infrastructure.persistence.repositories.motor.user import TwichUserMotorRepository
+from shared.config import settings
+
+
+DB_NAME: str = 'twich_index_test'
+DOCUMENTS: int = 200
+EXPLAINED_COMMANDS: set[str] = {'find', 'findAndModify', 'delete'}
+SESSION_FIELDS: set[str] = {'lsid', 'txnNumber', '$db', '$clusterTime', '$readPreference'}
+INDEX_STAGES: set[str] = {'IXSCAN', 'IDHACK', 'EXPRESS_IXSCAN'}
+CURSOR: str = encode_cursor(datetime(2024, 4, 30, 23, 30), 100)
+
+MONGO_REPOSITORIES: dict[str, type] = {
+    'game': TwichGameMongoRepository,
+    'stream': TwichStreamMongoRepository,
+    'user': TwichUserMongoRepository,
+}
+MOTOR_REPOSITORIES: dict[str, type] = {
+    'game': TwichGameMotorRepository,
+    'stream': TwichStreamMotorRepository,
+    'user': TwichUserMotorRepository,
+}
+
+Query = Callable[[Any], Awaitable[Any]]
+
+
+class CommandRecorder(monitoring.CommandListener):
+    """
+    CommandRecorder: Class, that records query commands, sent to the test database.
+
+    Args:
+        monitoring.CommandListener (_type_): Base superclass for CommandRecorder class.
+    """
+
+    def __init__(self) -> None:
+        self.commands: list[SON] = []
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.database_name == DB_NAME and event.command_name in EXPLAINED_COMMANDS:
+            self.commands.append(
+                SON(
+                    (key, value)
+                    for key, value in event.command.items()
+                    if key not in SESSION_FIELDS and key != 'writeConcern'
+                ),
+            )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        return
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        return
+
+
+recorder: CommandRecorder = CommandRecorder()
+
+
+def motor_database() -> MongoMotorDatabase:
+    return MongoMotorDatabase(
+        db_name=DB_NAME,
+        username=settings.DB_MONGO_USERNAME,
+        password=settings.DB_MONGO_PASSWORD,
+        host=settings.DB_MONGO_HOST,
+        port=settings.DB_MONGO_PORT,
+        authentication_source=settings.DB_MONGO_AUTH_SOURCE,
+    )
+
+
+@pytest.fixture(scope='module')
+def database() -> Iterator[Database]:
+    monitoring.register(recorder)
+    client: MongoClient = MongoClient(
+        host=settings.DB_MONGO_HOST,
+        port=settings.DB_MONGO_PORT,
+        username=settings.DB_MONGO_USERNAME,
+        password=settings.DB_MONGO_PASSWORD,
+        authSource=settings.DB_MONGO_AUTH_SOURCE,
+        serverSelectionTimeoutMS=1000,
+    )
+
+    try:
+        client.admin.command('ping')
+    except PyMongoError as exception:
+        pytest.skip(f'Mongo is not available: {exception}')
+
+    database: Database = client[DB_NAME]
+    parsed_at: datetime = datetime(2024, 5, 1)
+
+    run(ensure_indexes(motor_database()))
+
+    for document in documents:
+        database[document._get_collection_name()].insert_many(
+            {
+                '_id': id,
+                'name': f'game {id}',
+                'user_login': f'user_{id % 50}',
+                'login': f'user_{id}',
+                'parsed_at': parsed_at - timedelta(minutes=id % 50),
+            }
+            for id in range(1, DOCUMENTS + 1)
+        )
+
+    yield database
+
+    client.drop_database(DB_NAME)
+    client.close()
+
+
+@pytest.fixture(scope='module')
+def mongo_database(database: Database) -> Iterator[MongoDatabase]:
+    disconnect()
+
+    yield MongoDatabase(
+        db_name=DB_NAME,
+        username=settings.DB_MONGO_USERNAME,
+        password=settings.DB_MONGO_PASSWORD,
+        host=settings.DB_MONGO_HOST,
+        port=settings.DB_MONGO_PORT,
+        authentication_source=settings.DB_MONGO_AUTH_SOURCE,
+    )
+
+    disconnect()
+
+
+def repository(driver: str, db: MongoDatabase, entity: str) -> Any:
+    if driver == 'mongo':
+        return MONGO_REPOSITORIES[entity](db)
+
+    return MOTOR_REPOSITORIES[entity](motor_database())
+
+
+async def consume(repository: Any) -> list:
+    return [item async for item in repository.all(page_size=100)]
+
+
+def record(driver: str, db: MongoDatabase, entity: str, query: Query) -> list[SON]:
+    async def send() -> None:
+        with suppress(ObjectNotFoundException):
+            await query(repository(driver, db, entity))
+
+    recorder.commands.clear()
+    run(send())
+
+    return list(recorder.commands)
+
+
+def stages(plan: dict) -> set[str]:
+    found: set[str] = {plan['stage']} if 'stage' in plan else set()
+
+    for value in plan.values():
+        if isinstance(value, dict):
+            found |= stages(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    found |= stages(item)
+
+    return found
+
+
+def assert_index_scan(database: Database, command: SON) -> None:
+    explain: dict = database.command('explain', command, verbosity='queryPlanner')
+    winning_plan: set[str] = stages(explain['queryPlanner']['winningPlan'])
+
+    assert winning_plan & INDEX_STAGES, command
+    assert 'COLLSCAN' not in winning_plan, command
+    assert 'SORT' not in winning_plan, command
+
+
+COMMON_QUERIES: list[tuple[str, Query]] = [
+    ('paginate', lambda repository: repository.paginate(limit=100)),
+    ('paginate_after_cursor', lambda repository: repository.paginate(limit=100, cursor=CURSOR)),
+    ('all', consume),
+    ('get_by_id', lambda repository: repository.get_by_id(100)),
+    ('get_many', lambda repository: repository.get_many([1, 2, 3])),
+    ('get_content_hashes', lambda repository: repository.get_content_hashes([1, 2, 3])),
+    ('delete_by_id', lambda repository: repository.delete_by_id(101)),
+]
+
+LOOKUP_QUERIES: list[tuple[str, str, Query]] = [
+    ('game', 'get_game_by_name', lambda repository: repository.get_game_by_name('game 10')),
+    ('game', 'delete_game_by_name', lambda repository: repository.delete_game_by_name('game 11')),
+    (
+        'stream',
+        'get_stream_by_user_login',
+        lambda repository: repository.get_stream_by_user_login('user_10'),
+    ),
+    (
+        'stream',
+        'delete_stream_by_user_login',
+        lambda repository: repository.delete_stream_by_user_login('user_11'),
+    ),
+    ('user', 'get_user_by_login', lambda repository: repository.get_user_by_login('user_10')),
+    ('user', 'delete_user_by_login', lambda repository: repository.delete_user_by_login('user_11')),
+]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('driver', ['mongo', 'motor'])
+@pytest.mark.parametrize('entity', ['game', 'stream', 'user'])
+@pytest.mark.parametrize(
+    'query',
+    [pytest.param(query, id=name) for name, query in COMMON_QUERIES],
+)
+def test_repository_query_uses_index(
+    database: Database,
+    mongo_database: MongoDatabase,
+    driver: str,
+    entity: str,
+    query: Query,
+) -> None:
+    commands: list[SON] = record(driver, mongo_database, entity, query)
+
+    assert commands
+
+    for command in commands:
+        assert_index_scan(database, command)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('driver', ['mongo', 'motor'])
+@pytest.mark.parametrize(
+    'entity, query',
+    [pytest.param(entity, query, id=name) for entity, name, query in LOOKUP_QUERIES],
+)
+def test_repository_lookup_uses_index(
+    database: Database,
+    mongo_database: MongoDatabase,
+    driver: str,
+    entity: str,
+    query: Query,
+) -> None:
+    commands: list[SON] = record(driver, mongo_database, entity, query)
+
+    assert commands
+
+    for command in commands:
+        assert_index_scan(database, command)
@@ -0,0 +1,135 @@
+"""
+test_decorators.py: File, containing tests for command handler decorators.
+"""
+
+
+from asyncio import (
+    CancelledError,
+    Event,
+    Task,
+    create_task,
+    gather,
+    run,
+    sleep,
+)
+from typing import Optional
+
+import pytest
+
+from application.commands import (
+    Command,
+    ParseTwichStream,
+)
+from application.dto import ResultDTO
+from application.handlers.command import SingleFlightDecorator
+from application.interfaces.handler import ICommandHandler
+
+
+class GatedCommandHandler(ICommandHandler[ParseTwichStream]):
+    def __init__(self, exception: Optional[Exception] = None) -> None:
+        self.calls: int = 0
+        self.gate: Event = Event()
+        self.exception: Optional[Exception] = exception
+
+    async def handle(self, command: ParseTwichStream) -> ResultDTO:
+        self.calls += 1
+        await self.gate.wait()
+
+        if self.exception is not None:
+            raise self.exception
+
+        return ResultDTO(data={'user_login': command.user_login}, status='ok', description='')
+
+
+def test_concurrent_identical_commands_are_handled_once() -> None:
+    async def scenario() -> None:
+        handler: GatedCommandHandler = GatedCommandHandler()
+        in_flight_commands: dict[Command, Task] = {}
+        decorator: SingleFlightDecorator = SingleFlightDecorator(handler, in_flight_commands)
+        command: ParseTwichStream = ParseTwichStream(user_login='streamer')
+
+        callers: list[Task] = [create_task(decorator.handle(command)) for _ in range(10)]
+        await sleep(0)
+        handler.gate.set()
+        results: list[ResultDTO] = await gather(*callers)
+
+        assert handler.calls == 1
+        assert all(result is results[0] for result in results)
+        assert in_flight_commands == {}
+
+    run(scenario())
+
+
+def test_different_commands_are_handled_separately() -> None:
+    async def scenario() -> None:
+        handler: GatedCommandHandler = GatedCommandHandler()
+        decorator: SingleFlightDecorator = SingleFlightDecorator(handler, {})
+        handler.gate.set()
+
+        await gather(
+            decorator.handle(ParseTwichStream(user_login='first')),
+            decorator.handle(ParseTwichStream(user_login='second')),
+        )
+
+        assert handler.calls == 2
+
+    run(scenario())
+
+
+def test_cancelled_first_caller_does_not_cancel_other_callers() -> None:
+    async def scenario() -> None:
+        handler: GatedCommandHandler = GatedCommandHandler()
+        decorator: SingleFlightDecorator = SingleFlightDecorator(handler, {})
+        command: ParseTwichStream = ParseTwichStream(user_login='streamer')
+
+        leader: Task = create_task(decorator.handle(command))
+        await sleep(0)
+        follower: Task = create_task(decorator.handle(command))
+        await sleep(0)
+        leader.cancel()
+        await sleep(0)
+        handler.gate.set()
+
+        with pytest.raises(CancelledError):
+            await leader
+
+        result: ResultDTO = await follower
+
+        assert result.data == {'user_login': 'streamer'}
+        assert handler.calls == 1
+
+    run(scenario())
+
+
+def test_exception_is_raised_to_every_caller() -> None:
+    async def scenario() -> None:
+        handler: GatedCommandHandler = GatedCommandHandler(exception=ValueError('failed'))
+        in_flight_commands: dict[Command, Task] = {}
+        decorator: SingleFlightDecorator = SingleFlightDecorator(handler, in_flight_commands)
+        command: ParseTwichStream = ParseTwichStream(user_login='streamer')
+
+        callers: list[Task] = [create_task(decorator.handle(command)) for _ in range(3)]
+        await sleep(0)
+        handler.gate.set()
+        results: list = await gather(*callers, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert handler.calls == 1
+        assert in_flight_commands == {}
+
+    run(scenario())
+
+
+def test_command_is_handled_again_after_previous_flight_completes() -> None:
+    async def scenario() -> None:
+        handler: GatedCommandHandler = GatedCommandHandler()
+        decorator: SingleFlightDecorator = SingleFlightDecorator(handler, {})
+        command: ParseTwichStream = ParseTwichStream(user_login='streamer')
+        handler.gate.set()
+
+        await decorator.handle(command)
+        await decorator.handle(command)
+
+        assert handler.calls == 2
+
+    run(scenario())
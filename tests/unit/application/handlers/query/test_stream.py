@@ -0,0 +1,67 @@
+"""
+test_stream.py: File, containing tests for twich stream query handlers.
+"""
+
+
+from asyncio import run
+from datetime import datetime
+from typing import (
+    AsyncIterator,
+    Optional,
+)
+
+from application.dto import (
+    TwichStreamDTO,
+    TwichStreamsExportDTO,
+)
+from application.handlers.query import ExportTwichStreamsHandler
+from application.queries import ExportTwichStreams
+from domain.models import TwichStream
+
+
+class StreamRepository:
+    def __init__(self, count: int) -> None:
+        self.count: int = count
+        self.calls: list[tuple[int, Optional[list[str]]]] = []
+
+    async def all(
+        self,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+    ) -> AsyncIterator[TwichStream]:
+        self.calls.append((page_size, fields))
+
+        for id in range(1, self.count + 1):
+            yield TwichStream(
+                id=id,
+                user_id=id,
+                user_name='user',
+                user_login=f'user_{id}',
+                game_id=1,
+                game_name='game',
+                language='en',
+                title='title',
+                tags=['English'],
+                started_at=datetime(2024, 5, 1, 12, 30),
+                viewer_count=10,
+                type='live',
+                parsed_at=datetime(2024, 5, 1, 13, 0),
+            )
+
+
+def test_export_streams_all_streams_as_dto() -> None:
+    repository: StreamRepository = StreamRepository(count=3)
+    handler: ExportTwichStreamsHandler = ExportTwichStreamsHandler(repository)  # type: ignore
+
+    async def scenario() -> list[TwichStreamDTO]:
+        export: TwichStreamsExportDTO = await handler.handle(
+            ExportTwichStreams(page_size=2, fields=['title', 'unknown']),
+        )
+
+        return [stream async for stream in export.data]
+
+    streams: list[TwichStreamDTO] = run(scenario())
+
+    assert [stream.id for stream in streams] == [1, 2, 3]
+    assert all(isinstance(stream, TwichStreamDTO) for stream in streams)
+    assert repository.calls == [(2, ['title'])]
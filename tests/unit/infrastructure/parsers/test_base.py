@@ -0,0 +1,86 @@
+"""
+test_base.py: File, containing tests for base twich api parser.
+"""
+
+
+from asyncio import (
+    CancelledError,
+    Event,
+    create_task,
+    run,
+    sleep,
+)
+
+import pytest
+from aiohttp import (
+    ClientSession,
+    web,
+)
+
+from infrastructure.parsers.aiohttp.base import TwichParser
+from infrastructure.parsers.aiohttp.dependencies import (
+    TwichAPIToken,
+    TwichAPITokenManager,
+    TwichCircuitBreaker,
+    TwichLatencyHistogram,
+    TwichRequestHedger,
+    TwichRequestScheduler,
+)
+
+
+def test_cancelled_probe_releases_circuit_breaker() -> None:
+    circuit_breaker: TwichCircuitBreaker = TwichCircuitBreaker(
+        failure_threshold=1,
+        recovery_timeout=0,
+    )
+    circuit_breaker.record_failure()
+
+    async def scenario() -> None:
+        released: Event = Event()
+
+        async def handle_slowly(request: web.Request) -> web.Response:
+            await released.wait()
+
+            return web.json_response({'data': []})
+
+        app: web.Application = web.Application()
+        app.router.add_get('/helix/streams', handle_slowly)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        site: web.TCPSite = web.TCPSite(runner, 'localhost', 0)
+        await site.start()
+        url: str = f'http://localhost:{runner.addresses[0][1]}/helix/streams'
+
+        try:
+            async with ClientSession() as session:
+                parser: TwichParser = TwichParser(
+                    session=session,
+                    token=TwichAPITokenManager(session),
+                    scheduler=TwichRequestScheduler(limit=800),
+                    circuit_breaker=circuit_breaker,
+                    hedger=TwichRequestHedger(
+                        enabled=False,
+                        percentile=0.95,
+                        budget=0.05,
+                        histogram=TwichLatencyHistogram(),
+                    ),
+                )
+                probe = create_task(
+                    parser._send(url, [], TwichAPIToken(access_token='token', expires_at=0)),
+                )
+                await sleep(0.2)
+
+                assert not circuit_breaker.allow()
+
+                probe.cancel()
+
+                with pytest.raises(CancelledError):
+                    await probe
+        finally:
+            released.set()
+            await runner.cleanup()
+
+    run(scenario())
+
+    assert circuit_breaker.is_open
+    assert circuit_breaker.allow()
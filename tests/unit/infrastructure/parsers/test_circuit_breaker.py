@@ -0,0 +1,114 @@
+"""
+test_circuit_breaker.py: File, containing tests for twich circuit breaker.
+"""
+
+
+import pytest
+
+from infrastructure.parsers.aiohttp.dependencies import (
+    TwichCircuitBreaker,
+    circuit_breaker,
+)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now: float = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock: Clock = Clock()
+    monkeypatch.setattr(circuit_breaker, 'monotonic', clock)
+
+    return clock
+
+
+def open_breaker() -> TwichCircuitBreaker:
+    breaker: TwichCircuitBreaker = TwichCircuitBreaker(failure_threshold=3, recovery_timeout=10)
+
+    for _ in range(3):
+        breaker.record_failure()
+
+    return breaker
+
+
+def test_breaker_opens_after_consecutive_failures(clock: Clock) -> None:
+    breaker: TwichCircuitBreaker = TwichCircuitBreaker(failure_threshold=3, recovery_timeout=10)
+
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert not breaker.is_open
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.is_open
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count(clock: Clock) -> None:
+    breaker: TwichCircuitBreaker = TwichCircuitBreaker(failure_threshold=3, recovery_timeout=10)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert not breaker.is_open
+
+
+def test_single_probe_is_allowed_after_recovery_timeout(clock: Clock) -> None:
+    breaker: TwichCircuitBreaker = open_breaker()
+
+    clock.now += 9
+
+    assert not breaker.allow()
+
+    clock.now += 1
+
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes_breaker(clock: Clock) -> None:
+    breaker: TwichCircuitBreaker = open_breaker()
+    clock.now += 10
+    breaker.allow()
+
+    breaker.record_success()
+
+    assert not breaker.is_open
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+def test_failed_probe_restarts_recovery_timeout(clock: Clock) -> None:
+    breaker: TwichCircuitBreaker = open_breaker()
+    clock.now += 10
+    breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.is_open
+    assert not breaker.allow()
+
+    clock.now += 10
+
+    assert breaker.allow()
+
+
+def test_aborted_probe_is_released(clock: Clock) -> None:
+    breaker: TwichCircuitBreaker = open_breaker()
+    clock.now += 10
+
+    assert breaker.allow()
+
+    breaker.record_abort()
+
+    assert breaker.is_open
+    assert breaker.allow()
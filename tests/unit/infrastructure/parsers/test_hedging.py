@@ -0,0 +1,94 @@
+"""
+test_hedging.py: File, containing tests for twich latency histogram and request hedger.
+"""
+
+
+import pytest
+
+from infrastructure.parsers.aiohttp.dependencies import (
+    TwichLatencyHistogram,
+    TwichRequestHedger,
+    hedging,
+)
+
+
+def make_histogram(latencies: list[float]) -> TwichLatencyHistogram:
+    histogram: TwichLatencyHistogram = TwichLatencyHistogram()
+
+    for latency in latencies:
+        histogram.observe(latency)
+
+    return histogram
+
+
+def test_empty_histogram_has_no_percentile() -> None:
+    histogram: TwichLatencyHistogram = TwichLatencyHistogram()
+
+    assert histogram.percentile(0.95) is None
+    assert histogram.metrics['p95'] == 0.0
+
+
+def test_percentile_is_upper_bound_of_bucket() -> None:
+    histogram: TwichLatencyHistogram = make_histogram([0.01] * 90 + [0.3] * 9 + [3.0])
+
+    assert histogram.percentile(0.5) == 0.025
+    assert histogram.percentile(0.95) == 0.5
+    assert histogram.percentile(1.0) == 5.0
+    assert histogram.metrics['le_0.5'] == 9
+
+
+def test_hedger_waits_for_enough_samples() -> None:
+    histogram: TwichLatencyHistogram = make_histogram([0.2] * 19)
+    hedger: TwichRequestHedger = TwichRequestHedger(
+        enabled=True,
+        percentile=0.95,
+        budget=0.1,
+        histogram=histogram,
+    )
+
+    assert hedger.delay() is None
+
+    histogram.observe(0.2)
+
+    assert hedger.delay() == 0.25
+
+
+def test_disabled_hedger_never_hedges() -> None:
+    hedger: TwichRequestHedger = TwichRequestHedger(
+        enabled=False,
+        percentile=0.95,
+        budget=0.1,
+        histogram=make_histogram([0.2] * 100),
+    )
+
+    assert hedger.delay() is None
+
+
+def test_hedger_does_not_hedge_on_unbounded_percentile() -> None:
+    hedger: TwichRequestHedger = TwichRequestHedger(
+        enabled=True,
+        percentile=0.95,
+        budget=0.1,
+        histogram=make_histogram([20.0] * 100),
+    )
+
+    assert hedger.delay() is None
+
+
+def test_hedge_budget_is_refilled_every_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    now: list[float] = [1000.0]
+    monkeypatch.setattr(hedging, 'monotonic', lambda: now[0])
+    hedger: TwichRequestHedger = TwichRequestHedger(
+        enabled=True,
+        percentile=0.95,
+        budget=0.1,
+        histogram=TwichLatencyHistogram(),
+    )
+
+    assert [hedger.acquire(limit=30) for _ in range(4)] == [True, True, True, False]
+
+    now[0] += TwichRequestHedger.window
+
+    assert hedger.acquire(limit=30)
+    assert hedger.metrics['hedges'] == 4
+    assert hedger.metrics['window_hedges'] == 1
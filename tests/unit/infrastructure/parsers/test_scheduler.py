@@ -0,0 +1,85 @@
+"""
+test_scheduler.py: File, containing tests for twich request scheduler.
+"""
+
+
+from asyncio import (
+    gather,
+    run,
+)
+from time import (
+    monotonic,
+    time,
+)
+
+from infrastructure.parsers.aiohttp.dependencies import TwichRequestScheduler
+
+
+def test_update_takes_bucket_state_from_headers() -> None:
+    scheduler: TwichRequestScheduler = TwichRequestScheduler(limit=800)
+    reset_at: float = time() + 30
+
+    scheduler.update(
+        {
+            'Ratelimit-Limit': '120',
+            'Ratelimit-Remaining': '60',
+            'Ratelimit-Reset': str(reset_at),
+        }
+    )
+
+    assert scheduler.metrics['limit'] == 120
+    assert scheduler.metrics['remaining'] == 60
+    assert 29 < scheduler.metrics['reset_in'] <= 30
+
+
+def test_update_ignores_missing_or_invalid_headers() -> None:
+    scheduler: TwichRequestScheduler = TwichRequestScheduler(limit=800)
+
+    scheduler.update({'Ratelimit-Limit': 'unknown'})
+    scheduler.update({})
+
+    assert scheduler.metrics == {'limit': 800, 'remaining': 800, 'reset_in': 0.0, 'queued': 0}
+
+
+def test_acquire_spends_bucket_points() -> None:
+    scheduler: TwichRequestScheduler = TwichRequestScheduler(limit=800)
+    scheduler.reset_at = time() + 60
+
+    async def scenario() -> None:
+        await gather(*(scheduler.acquire() for _ in range(10)))
+
+    run(scenario())
+
+    assert scheduler.metrics['remaining'] == 790
+    assert scheduler.metrics['queued'] == 0
+
+
+def test_acquire_waits_for_reset_when_bucket_is_exhausted() -> None:
+    scheduler: TwichRequestScheduler = TwichRequestScheduler(limit=800)
+    scheduler.reset_at = time() + 0.2
+    scheduler.exhaust()
+    started_at: float = monotonic()
+
+    run(scheduler.acquire())
+
+    assert monotonic() - started_at >= 0.15
+    assert scheduler.metrics['remaining'] == 799
+
+
+def test_acquire_spreads_remaining_points_over_window() -> None:
+    scheduler: TwichRequestScheduler = TwichRequestScheduler(limit=800)
+    scheduler.update(
+        {
+            'Ratelimit-Limit': '800',
+            'Ratelimit-Remaining': '4',
+            'Ratelimit-Reset': str(time() + 0.4),
+        }
+    )
+    started_at: float = monotonic()
+
+    async def scenario() -> None:
+        await gather(*(scheduler.acquire() for _ in range(3)))
+
+    run(scenario())
+
+    assert monotonic() - started_at >= 0.15
@@ -0,0 +1,108 @@
+"""
+test_stream.py: File, containing tests for twich stream parser.
+"""
+
+
+from asyncio import run
+from time import monotonic
+
+import pytest
+from aiohttp import (
+    ClientSession,
+    web,
+)
+
+from domain.models import TwichStream
+from infrastructure.parsers.aiohttp.dependencies import (
+    TwichAPIToken,
+    TwichAPITokenManager,
+    TwichCircuitBreaker,
+    TwichLatencyHistogram,
+    TwichRequestHedger,
+    TwichRequestScheduler,
+)
+from infrastructure.parsers.aiohttp.stream import TwichStreamParser
+from shared.config import settings
+
+
+LIVE_STREAMS: int = 45
+DEFAULT_PAGE_SIZE: int = 20
+
+
+def stream_data(id: int) -> dict:
+    return {
+        'id': str(id),
+        'user_id': str(id),
+        'user_login': f'user_{id}',
+        'user_name': f'User {id}',
+        'game_id': '1',
+        'game_name': 'game',
+        'type': 'live',
+        'title': 'title',
+        'tags': ['English'],
+        'viewer_count': 10,
+        'started_at': '2024-05-01T12:30:00Z',
+        'language': 'en',
+    }
+
+
+async def handle_streams(request: web.Request) -> web.Response:
+    logins: list[str] = request.query.getall('user_login')
+    live: list[dict] = [stream_data(id) for id in range(1, LIVE_STREAMS + 1)]
+    live = [stream for stream in live if stream['user_login'] in logins]
+    first: int = int(request.query.get('first', DEFAULT_PAGE_SIZE))
+    offset: int = int(request.query.get('after', 0))
+    page: list[dict] = live[offset : offset + first]
+    pagination: dict = {}
+
+    if offset + first < len(live):
+        pagination['cursor'] = str(offset + first)
+
+    return web.json_response({'data': page, 'pagination': pagination})
+
+
+def make_parser(session: ClientSession) -> TwichStreamParser:
+    token: TwichAPITokenManager = TwichAPITokenManager(session)
+    token._token = TwichAPIToken(access_token='token', expires_at=monotonic() + 3600)
+
+    return TwichStreamParser(
+        session=session,
+        token=token,
+        scheduler=TwichRequestScheduler(limit=800),
+        circuit_breaker=TwichCircuitBreaker(failure_threshold=5, recovery_timeout=30),
+        hedger=TwichRequestHedger(
+            enabled=False,
+            percentile=0.95,
+            budget=0.05,
+            histogram=TwichLatencyHistogram(),
+        ),
+    )
+
+
+def test_parse_streams_returns_every_live_stream_of_chunk(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def scenario() -> list[TwichStream]:
+        app: web.Application = web.Application()
+        app.router.add_get('/helix/streams', handle_streams)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        site: web.TCPSite = web.TCPSite(runner, 'localhost', 0)
+        await site.start()
+        monkeypatch.setattr(
+            settings,
+            'TWICH_GET_STREAM_BASE_URL',
+            f'http://localhost:{runner.addresses[0][1]}/helix/streams',
+        )
+
+        try:
+            async with ClientSession() as session:
+                return await make_parser(session).parse_streams(
+                    [f'user_{id}' for id in range(1, 151)],
+                )
+        finally:
+            await runner.cleanup()
+
+    streams: list[TwichStream] = run(scenario())
+
+    assert sorted(int(stream.id) for stream in streams) == list(range(1, LIVE_STREAMS + 1))
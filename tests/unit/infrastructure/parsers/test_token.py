@@ -0,0 +1,147 @@
+"""
+test_token.py: File, containing tests for twich api token manager.
+"""
+
+
+from asyncio import (
+    gather,
+    run,
+    sleep,
+)
+from socket import socket
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+)
+
+import pytest
+from aiohttp import (
+    ClientSession,
+    web,
+)
+
+from application.exceptions import TwichTokenNotObtainedException
+from infrastructure.parsers.aiohttp.dependencies import (
+    TwichAPIToken,
+    TwichAPITokenManager,
+    get_twich_api_token,
+)
+from shared.config import settings
+from shared.interfaces import ILogger
+
+
+class RecordingLogger(ILogger):
+    def __init__(self) -> None:
+        self.warnings: list[str] = []
+
+    def _configure_logger(self) -> None:
+        return
+
+    def info(self, message: str) -> None:
+        return
+
+    def debug(self, message: str) -> None:
+        return
+
+    def warning(self, message: str) -> None:
+        self.warnings.append(message)
+
+    def error(self, message: str) -> None:
+        return
+
+    def critical(self, message: str) -> None:
+        return
+
+
+def closed_port_url() -> str:
+    with socket() as sock:
+        sock.bind(('localhost', 0))
+        port: int = sock.getsockname()[1]
+
+    return f'http://localhost:{port}/oauth2/token'
+
+
+async def with_token_server(
+    handler: Callable[[web.Request], Awaitable[web.Response]],
+    scenario: Callable[[ClientSession, str], Awaitable[None]],
+) -> None:
+    app: web.Application = web.Application()
+    app.router.add_post('/oauth2/token', handler)
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+    site: web.TCPSite = web.TCPSite(runner, 'localhost', 0)
+    await site.start()
+    url: str = f'http://localhost:{runner.addresses[0][1]}/oauth2/token'
+
+    try:
+        async with ClientSession() as session:
+            await scenario(session, url)
+    finally:
+        await runner.cleanup()
+
+
+def test_connection_error_is_mapped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'TWICH_TOKEN_URL', closed_port_url())
+
+    async def scenario() -> None:
+        async with ClientSession() as session:
+            with pytest.raises(TwichTokenNotObtainedException):
+                await TwichAPITokenManager(session).refresh()
+
+    run(scenario())
+
+
+def test_slow_token_endpoint_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'TWICH_REQUEST_TIMEOUT', 0.05)
+
+    async def handler(request: web.Request) -> web.Response:
+        await sleep(1)
+
+        return web.json_response({'access_token': 'token', 'expires_in': 3600})
+
+    async def scenario(session: ClientSession, url: str) -> None:
+        monkeypatch.setattr(settings, 'TWICH_TOKEN_URL', url)
+
+        with pytest.raises(TwichTokenNotObtainedException):
+            await TwichAPITokenManager(session).refresh()
+
+    run(with_token_server(handler, scenario))
+
+
+def test_concurrent_refreshes_obtain_token_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[web.Request] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        requests.append(request)
+
+        return web.json_response({'access_token': 'token', 'expires_in': 3600})
+
+    async def scenario(session: ClientSession, url: str) -> None:
+        monkeypatch.setattr(settings, 'TWICH_TOKEN_URL', url)
+        token_manager: TwichAPITokenManager = TwichAPITokenManager(session)
+
+        tokens: list[TwichAPIToken] = await gather(*(token_manager.get_token() for _ in range(5)))
+
+        assert len(requests) == 1
+        assert all(token is tokens[0] for token in tokens)
+
+    run(with_token_server(handler, scenario))
+
+
+def test_failed_prefetch_does_not_break_startup(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'TWICH_TOKEN_URL', closed_port_url())
+    logger: RecordingLogger = RecordingLogger()
+
+    async def scenario() -> None:
+        async with ClientSession() as session:
+            resource: AsyncGenerator[TwichAPITokenManager, None] = get_twich_api_token(
+                session,
+                logger,
+            )
+            token_manager: TwichAPITokenManager = await anext(resource)
+
+            assert isinstance(token_manager, TwichAPITokenManager)
+            assert len(logger.warnings) == 1
+
+    run(scenario())
@@ -0,0 +1,293 @@
+"""
+test_elastic.py: File, containing tests for versioned elastic search index migrations.
+"""
+
+
+from typing import (
+    Callable,
+    Optional,
+)
+
+import pytest
+from elasticsearch.exceptions import (
+    NotFoundError,
+    RequestError,
+)
+
+from infrastructure.persistence.migrations.elastic import migrate_index
+from infrastructure.persistence.models.elastic.stream import TwichStreamDAO
+
+
+ALIAS: str = 'twich_stream'
+NAME: str = f'twich_stream_v{TwichStreamDAO.mapping_version}'
+
+
+class FakeIndices:
+    def __init__(self, cluster: 'FakeElasticsearch') -> None:
+        self.cluster: FakeElasticsearch = cluster
+
+    def create(self, index: str, body: dict) -> None:
+        if index in self.cluster.indices_names:
+            raise RequestError(400, 'resource_already_exists_exception', {})
+
+        self.cluster.indices_names.add(index)
+
+    def exists(self, index: str) -> bool:
+        return index in self.cluster.indices_names
+
+    def exists_alias(self, name: str) -> bool:
+        return bool(self.cluster.aliases.get(name))
+
+    def get_alias(self, name: str) -> dict:
+        return {index: {'aliases': {name: {}}} for index in self.cluster.aliases[name]}
+
+    def put_settings(self, index: list[str], body: dict) -> None:
+        if body['index.blocks.write']:
+            self.cluster.blocked |= set(index)
+        else:
+            self.cluster.blocked -= set(index)
+
+    def refresh(self, index: str) -> None:
+        return
+
+    def update_aliases(self, body: dict) -> None:
+        self.cluster.alias_updates += 1
+        self.cluster.blocked_on_alias_update = set(self.cluster.blocked)
+
+        if self.cluster.before_alias_update:
+            self.cluster.before_alias_update()
+
+        for action in body['actions']:
+            if 'remove' in action and action['remove']['index'] not in self.cluster.aliases.get(
+                action['remove']['alias'],
+                set(),
+            ):
+                raise NotFoundError(404, 'aliases_not_found_exception', {})
+
+        for action in body['actions']:
+            if 'add' in action:
+                self.cluster.aliases.setdefault(action['add']['alias'], set()).add(
+                    action['add']['index'],
+                )
+            elif 'remove' in action:
+                self.cluster.aliases[action['remove']['alias']].discard(action['remove']['index'])
+            elif 'remove_index' in action:
+                self.cluster.indices_names.discard(action['remove_index']['index'])
+
+
+class FakeTasks:
+    def __init__(self, cluster: 'FakeElasticsearch') -> None:
+        self.cluster: FakeElasticsearch = cluster
+
+    def list(self, actions: str, detailed: bool) -> dict:
+        return {
+            'nodes': {
+                'node': {
+                    'tasks': {
+                        task_id: {'description': description}
+                        for task_id, description in self.cluster.running_tasks.items()
+                    }
+                }
+            }
+        }
+
+    def get(self, task_id: str) -> dict:
+        self.cluster.polls += 1
+
+        if self.cluster.polls < self.cluster.completed_after_polls:
+            return {'completed': False}
+
+        self.cluster.running_tasks.pop(task_id, None)
+
+        if self.cluster.after_task:
+            self.cluster.after_task()
+
+        return {'completed': True, 'response': {'failures': self.cluster.failures}}
+
+
+class FakeElasticsearch:
+    def __init__(self, indices: set[str], aliases: Optional[dict[str, set[str]]] = None) -> None:
+        self.indices_names: set[str] = indices
+        self.aliases: dict[str, set[str]] = aliases or {}
+        self.indices: FakeIndices = FakeIndices(self)
+        self.tasks: FakeTasks = FakeTasks(self)
+        self.reindexes: list[dict] = []
+        self.running_tasks: dict[str, str] = {}
+        self.failures: list[dict] = []
+        self.blocked: set[str] = set()
+        self.blocked_on_alias_update: set[str] = set()
+        self.completed_after_polls: int = 3
+        self.polls: int = 0
+        self.alias_updates: int = 0
+        self.before_alias_update: Optional[Callable[[], None]] = None
+        self.after_task: Optional[Callable[[], None]] = None
+
+    def reindex(self, body: dict, wait_for_completion: bool) -> dict:
+        assert not wait_for_completion
+        self.reindexes.append(body)
+
+        if body['source'].get('query'):
+            assert self.blocked >= set(body['source']['index'])
+        else:
+            assert not self.blocked
+
+        return {'task': f'node:{len(self.reindexes)}'}
+
+
+def migrate(cluster: FakeElasticsearch, timeout: float = 60.0) -> None:
+    migrate_index(cluster, TwichStreamDAO, poll_interval=0, timeout=timeout)  # type: ignore
+
+
+def test_fresh_cluster_gets_alias_without_reindex() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(indices=set())
+
+    migrate(cluster)
+
+    assert cluster.aliases == {ALIAS: {NAME}}
+    assert cluster.reindexes == []
+
+
+def test_previous_version_is_reindexed_and_alias_is_swapped() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(
+        indices={'twich_stream_v2'},
+        aliases={ALIAS: {'twich_stream_v2'}},
+    )
+
+    migrate(cluster)
+
+    assert cluster.aliases == {ALIAS: {NAME}}
+    assert cluster.reindexes[0]['source'] == {'index': ['twich_stream_v2']}
+    assert cluster.reindexes[0]['script']['source'] == TwichStreamDAO.reindex_script
+    assert cluster.polls == 4
+    assert cluster.alias_updates == 1
+
+
+def test_writes_during_reindex_are_caught_up_before_alias_swap() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(
+        indices={'twich_stream_v2'},
+        aliases={ALIAS: {'twich_stream_v2'}},
+    )
+
+    migrate(cluster)
+
+    assert len(cluster.reindexes) == 2
+    assert cluster.reindexes[1]['source']['index'] == ['twich_stream_v2']
+    assert 'gte' in cluster.reindexes[1]['source']['query']['range']['parsed_at']
+    assert cluster.reindexes[1]['script']['source'] == TwichStreamDAO.reindex_script
+    assert cluster.blocked_on_alias_update == {'twich_stream_v2'}
+
+
+def test_legacy_index_is_reindexed_and_replaced_by_alias() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(indices={ALIAS})
+
+    migrate(cluster)
+
+    assert cluster.indices_names == {NAME}
+    assert cluster.aliases == {ALIAS: {NAME}}
+    assert cluster.reindexes[0]['source'] == {'index': [ALIAS]}
+    assert cluster.blocked_on_alias_update == {ALIAS}
+
+
+def test_completed_migration_is_skipped() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(
+        indices={'twich_stream_v2', NAME},
+        aliases={ALIAS: {NAME}},
+    )
+
+    migrate(cluster)
+
+    assert cluster.reindexes == []
+    assert cluster.alias_updates == 0
+
+
+def test_interrupted_migration_is_resumed() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(
+        indices={'twich_stream_v2', NAME},
+        aliases={ALIAS: {'twich_stream_v2'}},
+    )
+
+    migrate(cluster)
+
+    assert cluster.aliases == {ALIAS: {NAME}}
+    assert len(cluster.reindexes) == 2
+
+
+def test_concurrent_worker_waits_for_running_reindex() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(
+        indices={'twich_stream_v2', NAME},
+        aliases={ALIAS: {'twich_stream_v2'}},
+    )
+    cluster.running_tasks['node:0'] = f'reindex from [twich_stream_v2] to [{NAME}][_doc]'
+
+    def swap_by_other_worker() -> None:
+        cluster.aliases[ALIAS] = {NAME}
+
+    cluster.after_task = swap_by_other_worker
+
+    migrate(cluster)
+
+    assert cluster.reindexes == []
+    assert cluster.aliases == {ALIAS: {NAME}}
+
+
+def test_lost_alias_swap_race_is_ignored() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(
+        indices={'twich_stream_v2'},
+        aliases={ALIAS: {'twich_stream_v2'}},
+    )
+
+    def swap_by_other_worker() -> None:
+        cluster.aliases[ALIAS] = {NAME}
+
+    cluster.before_alias_update = swap_by_other_worker
+
+    migrate(cluster)
+
+    assert cluster.aliases == {ALIAS: {NAME}}
+
+
+def test_failed_reindex_keeps_alias() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(
+        indices={'twich_stream_v2'},
+        aliases={ALIAS: {'twich_stream_v2'}},
+    )
+    cluster.failures = [{'cause': {'type': 'mapper_parsing_exception'}}]
+
+    with pytest.raises(RuntimeError):
+        migrate(cluster)
+
+    assert cluster.aliases == {ALIAS: {'twich_stream_v2'}}
+
+
+def test_failed_catch_up_reindex_clears_write_block() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(
+        indices={'twich_stream_v2'},
+        aliases={ALIAS: {'twich_stream_v2'}},
+    )
+
+    def fail_catch_up() -> None:
+        if len(cluster.reindexes) == 2:
+            cluster.failures = [{'cause': {'type': 'mapper_parsing_exception'}}]
+
+    cluster.after_task = fail_catch_up
+
+    with pytest.raises(RuntimeError):
+        migrate(cluster)
+
+    assert cluster.aliases == {ALIAS: {'twich_stream_v2'}}
+    assert cluster.blocked == set()
+
+
+def test_reindex_wait_is_bounded() -> None:
+    cluster: FakeElasticsearch = FakeElasticsearch(
+        indices={'twich_stream_v2'},
+        aliases={ALIAS: {'twich_stream_v2'}},
+    )
+    cluster.completed_after_polls = 1000
+
+    with pytest.raises(TimeoutError):
+        migrate(cluster, timeout=0)
+
+    assert cluster.polls == 1
+    assert cluster.aliases == {ALIAS: {'twich_stream_v2'}}
+    assert cluster.blocked == set()
@@ -0,0 +1,57 @@
+"""
+test_cursor.py: File, containing tests for keyset pagination cursor encoding.
+"""
+
+
+from base64 import urlsafe_b64encode
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+
+import pytest
+
+from application.exceptions import InvalidCursorException
+from infrastructure.persistence.repositories.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip() -> None:
+    parsed_at: datetime = datetime(2024, 5, 1, 13, 0, 0, 123456)
+
+    assert decode_cursor(encode_cursor(parsed_at, 42)) == (parsed_at, 42)
+
+
+def test_aware_parsed_at_is_normalized_to_naive_utc() -> None:
+    parsed_at: datetime = datetime(2024, 5, 1, 15, 0, tzinfo=timezone(timedelta(hours=2)))
+
+    assert decode_cursor(encode_cursor(parsed_at, 42)) == (datetime(2024, 5, 1, 13, 0), 42)
+
+
+def test_cursor_is_url_safe() -> None:
+    cursor: str = encode_cursor(datetime(2024, 5, 1, 13, 0), 2**62)
+
+    assert cursor.isascii()
+    assert not set(cursor) & {'+', '/', '?', '&'}
+
+
+@pytest.mark.parametrize(
+    'cursor',
+    [
+        '',
+        'not a cursor',
+        'курсор',
+        urlsafe_b64encode(b'not json').decode('ascii'),
+        urlsafe_b64encode(b'null').decode('ascii'),
+        urlsafe_b64encode(b'[1]').decode('ascii'),
+        urlsafe_b64encode(b'[1, 2]').decode('ascii'),
+        urlsafe_b64encode(b'["yesterday", 1]').decode('ascii'),
+        urlsafe_b64encode(b'["2024-05-01T13:00:00", "one"]').decode('ascii'),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor)
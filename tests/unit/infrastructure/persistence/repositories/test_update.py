@@ -0,0 +1,61 @@
+"""
+test_update.py: File, containing tests for partial upsert building.
+"""
+
+
+from datetime import datetime
+
+from infrastructure.persistence.repositories.update import build_update
+
+
+FIELDS: dict = {
+    'title': 'new title',
+    'viewer_count': 120,
+    'tags': ['English'],
+    'parsed_at': datetime(2024, 5, 1, 13, 0),
+}
+INSERT_FIELDS: dict = {'started_at': datetime(2024, 5, 1, 12, 0)}
+
+
+def test_new_document_sets_every_field() -> None:
+    assert build_update(FIELDS, INSERT_FIELDS, None) == {
+        '$set': FIELDS,
+        '$setOnInsert': INSERT_FIELDS,
+    }
+
+
+def test_stored_document_sets_only_changed_fields() -> None:
+    stored_document: dict = {
+        '_id': 1,
+        'title': 'new title',
+        'viewer_count': 100,
+        'tags': ['English'],
+        'parsed_at': datetime(2024, 5, 1, 12, 55),
+        'started_at': datetime(2024, 5, 1, 12, 0),
+    }
+
+    assert build_update(FIELDS, INSERT_FIELDS, stored_document) == {
+        '$set': {
+            'viewer_count': 120,
+            'parsed_at': datetime(2024, 5, 1, 13, 0),
+        },
+        '$setOnInsert': {
+            'title': 'new title',
+            'tags': ['English'],
+            'started_at': datetime(2024, 5, 1, 12, 0),
+        },
+    }
+
+
+def test_missing_stored_field_is_set() -> None:
+    stored_document: dict = {'_id': 1, **FIELDS}
+    del stored_document['tags']
+
+    assert build_update(FIELDS, {}, stored_document) == {
+        '$set': {'tags': ['English']},
+        '$setOnInsert': {key: value for key, value in FIELDS.items() if key != 'tags'},
+    }
+
+
+def test_unchanged_document_is_skipped() -> None:
+    assert build_update(FIELDS, INSERT_FIELDS, {'_id': 1, **FIELDS}) is None
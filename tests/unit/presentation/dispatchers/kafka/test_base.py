@@ -0,0 +1,231 @@
+"""
+test_base.py: File, containing tests for base kafka dispatcher window.
+"""
+
+
+from asyncio import run
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+
+from application.exceptions import ObjectNotFoundException
+from domain.events import (
+    DomainEvent,
+    TwichGameCreated,
+    TwichGameDeleted,
+)
+from domain.models import TwichGame
+from presentation.dispatchers.kafka.base import TwichKafkaDispatcher
+from presentation.dispatchers.kafka.game import TwichGameKafkaDispatcher
+from shared.interfaces import ILogger
+
+
+class StopConsumer(Exception):
+    pass
+
+
+class RecordingLogger(ILogger):
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def _configure_logger(self) -> None:
+        return
+
+    def info(self, message: str) -> None:
+        return
+
+    def debug(self, message: str) -> None:
+        return
+
+    def warning(self, message: str) -> None:
+        self.messages.append(message)
+
+    def error(self, message: str) -> None:
+        self.messages.append(message)
+
+    def critical(self, message: str) -> None:
+        return
+
+
+class GameRepository:
+    def __init__(self, failures: Optional[list[Exception]] = None) -> None:
+        self.failures: list[Exception] = failures or []
+        self.upserts: list[list[int]] = []
+        self.deletes: list[int] = []
+
+    async def add_or_update_many(self, games: list[TwichGame]) -> dict[int, str]:
+        if self.failures:
+            raise self.failures.pop(0)
+
+        self.upserts.append([game.id for game in games])
+
+        return {}
+
+    async def delete_by_id(self, id: int) -> TwichGame:
+        self.deletes.append(id)
+
+        raise ObjectNotFoundException('Game is not found.')
+
+
+class Consumer:
+    def __init__(self, batches: list[list[DomainEvent]]) -> None:
+        self.batches: list[list[DomainEvent]] = batches
+        self.max_records: list[int] = []
+        self.paused_partitions: set[str] = set()
+        self.paused_polls: int = 0
+        self.commits: int = 0
+
+    def assignment(self) -> set[str]:
+        return {'partition'}
+
+    def pause(self, *partitions: str) -> None:
+        self.paused_partitions |= set(partitions)
+
+    def resume(self, *partitions: str) -> None:
+        self.paused_partitions -= set(partitions)
+
+    def paused(self) -> set[str]:
+        return set(self.paused_partitions)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def poll(self, timeout_ms: int, max_records: int) -> dict:
+        if self.paused_partitions:
+            self.paused_polls += 1
+
+            return {}
+
+        if not self.batches:
+            raise StopConsumer
+
+        self.max_records.append(max_records)
+
+        return {'partition': [SimpleNamespace(value=event) for event in self.batches.pop(0)]}
+
+
+def make_dispatcher(
+    repository: GameRepository,
+    batches: Optional[list[list[DomainEvent]]] = None,
+    batch_size: int = 3,
+) -> TwichGameKafkaDispatcher:
+    dispatcher: TwichGameKafkaDispatcher = TwichGameKafkaDispatcher.__new__(
+        TwichGameKafkaDispatcher,
+    )
+    dispatcher.consumer = Consumer(batches or [])  # type: ignore
+    dispatcher.repository = repository  # type: ignore
+    dispatcher.logger = RecordingLogger()
+    dispatcher.batch_size = batch_size
+    dispatcher.flush_interval = 0
+    dispatcher.upserts = {}
+    dispatcher.deletes = set()
+
+    return dispatcher
+
+
+def created(id: int, name: str = 'game') -> TwichGameCreated:
+    return TwichGameCreated(
+        id=id,
+        name=name,
+        igdb_id='',
+        box_art_url='',
+        parsed_at=datetime(2024, 5, 1),
+    )
+
+
+def test_later_events_replace_earlier_ones() -> None:
+    dispatcher: TwichGameKafkaDispatcher = make_dispatcher(GameRepository())
+
+    dispatcher.collect(created(1, 'old'))
+    dispatcher.collect(created(1, 'new'))
+    dispatcher.collect(created(2))
+    dispatcher.collect(TwichGameDeleted(id=2))
+
+    assert dispatcher.upserts[1].name == 'new'
+    assert list(dispatcher.upserts) == [1]
+    assert dispatcher.deletes == {2}
+
+    dispatcher.collect(created(2))
+
+    assert dispatcher.deletes == set()
+
+
+def test_flush_writes_window_and_clears_it() -> None:
+    repository: GameRepository = GameRepository()
+    dispatcher: TwichGameKafkaDispatcher = make_dispatcher(repository)
+    dispatcher.collect(created(1))
+    dispatcher.collect(created(2))
+    dispatcher.collect(TwichGameDeleted(id=3))
+
+    run(dispatcher.flush())
+
+    assert repository.upserts == [[1, 2]]
+    assert repository.deletes == [3]
+    assert dispatcher.upserts == {}
+    assert dispatcher.deletes == set()
+
+
+def test_failed_flush_is_logged_and_retried() -> None:
+    repository: GameRepository = GameRepository(failures=[ConnectionError('elastic is down')])
+    dispatcher: TwichGameKafkaDispatcher = make_dispatcher(
+        repository,
+        batches=[[created(1)], [created(2)]],
+    )
+
+    with pytest.raises(StopConsumer):
+        run(dispatcher.run())
+
+    assert repository.upserts == [[1, 2]]
+    assert 'elastic is down' in dispatcher.logger.messages[0]  # type: ignore
+    assert dispatcher.consumer.commits == 1  # type: ignore
+
+
+def test_consumer_is_not_polled_beyond_window() -> None:
+    repository: GameRepository = GameRepository(failures=[ConnectionError('elastic is down')])
+    dispatcher: TwichGameKafkaDispatcher = make_dispatcher(
+        repository,
+        batches=[[created(1), created(2), created(3)], [created(4)]],
+    )
+
+    with pytest.raises(StopConsumer):
+        run(dispatcher.run())
+
+    assert dispatcher.consumer.max_records == [3, 3]  # type: ignore
+    assert dispatcher.consumer.paused_polls == 1  # type: ignore
+    assert dispatcher.consumer.commits == 2  # type: ignore
+    assert repository.upserts == [[1, 2, 3], [4]]
+
+
+def test_full_window_keeps_polling_while_flush_fails() -> None:
+    repository: GameRepository = GameRepository(
+        failures=[ConnectionError('elastic is down'), ConnectionError('elastic is down')],
+    )
+    dispatcher: TwichGameKafkaDispatcher = make_dispatcher(
+        repository,
+        batches=[[created(1), created(2), created(3)]],
+    )
+
+    with pytest.raises(StopConsumer):
+        run(dispatcher.run())
+
+    assert dispatcher.consumer.paused_polls == 2  # type: ignore
+    assert dispatcher.consumer.paused_partitions == set()  # type: ignore
+    assert dispatcher.consumer.commits == 1  # type: ignore
+    assert repository.upserts == [[1, 2, 3]]
+
+
+def test_dispatcher_requires_to_domain() -> None:
+    class Dispatcher(TwichKafkaDispatcher[TwichGame, TwichGameCreated, TwichGameDeleted]):
+        created_event: type[TwichGameCreated] = TwichGameCreated
+        deleted_event: type[TwichGameDeleted] = TwichGameDeleted
+
+    with pytest.raises(TypeError):
+        Dispatcher(  # type: ignore
+            bootstrap_servers='localhost:9092',
+            api_version=(2, 5, 0),
+            topic='game',
+            repository=GameRepository(),  # type: ignore
+            logger=RecordingLogger(),
+        )
@@ -0,0 +1,59 @@
+"""
+test_mappers.py: File, containing tests for generated mappers.
+"""
+
+
+from dataclasses import (
+    dataclass,
+    field,
+)
+from types import SimpleNamespace
+from typing import Optional
+
+from shared.utils import compile_mapper
+
+
+@dataclass
+class Target:
+    id: int
+    name: str
+    tags: list[str]
+    cached: Optional[str] = field(default=None, init=False)
+
+
+class Document:
+    def __init__(self, **kwargs: object) -> None:
+        self.kwargs: dict[str, object] = kwargs
+
+
+def test_maps_object_attributes() -> None:
+    source: SimpleNamespace = SimpleNamespace(id=1, name='game', tags=['a'], extra=True)
+
+    assert compile_mapper(Target)(source) == Target(id=1, name='game', tags=['a'])
+
+
+def test_maps_dict_with_aliases_and_missing_keys() -> None:
+    mapper = compile_mapper(Target, from_dict=True, aliases=(('id', '_id'),))
+
+    target: Target = mapper({'_id': 1, 'name': 'game'})
+
+    assert (target.id, target.name, target.tags) == (1, 'game', None)
+
+
+def test_applies_converters() -> None:
+    mapper = compile_mapper(Target, converters=(('tags', list),))
+    target: Target = mapper(SimpleNamespace(id=1, name='game', tags=('a', 'b')))
+
+    assert target.tags == ['a', 'b']
+
+
+def test_maps_into_non_dataclass_target() -> None:
+    mapper = compile_mapper(Document, fields_of=Target)
+    document: Document = mapper(Target(id=1, name='game', tags=['a']))
+
+    assert document.kwargs == {'id': 1, 'name': 'game', 'tags': ['a']}
+
+
+def test_mapper_is_cached() -> None:
+    assert compile_mapper(Target) is compile_mapper(Target)
+    assert compile_mapper(Target) is not compile_mapper(Target, from_dict=True)
@@ -0,0 +1,61 @@
+"""
+test_serialization.py: File, containing tests for json serialization with optional orjson.
+"""
+
+
+from datetime import (
+    date,
+    datetime,
+)
+from uuid import UUID
+
+import pytest
+
+from shared.utils import serialization
+from shared.utils.serialization import (
+    json_dumps,
+    json_loads,
+)
+
+
+PAYLOAD: dict = {
+    'id': 1,
+    'title': 'стрим',
+    'tags': ['English', 'PC'],
+    'started_at': datetime(2024, 5, 1, 12, 30, 0, 123456),
+    'day': date(2024, 5, 1),
+    'event_id': UUID('12345678-1234-5678-1234-567812345678'),
+    'cursor': None,
+}
+
+EXPECTED: bytes = (
+    '{"id":1,"title":"стрим","tags":["English","PC"],'
+    '"started_at":"2024-05-01T12:30:00.123456","day":"2024-05-01",'
+    '"event_id":"12345678-1234-5678-1234-567812345678","cursor":null}'
+).encode('utf-8')
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == 'stdlib':
+        monkeypatch.setattr(serialization, 'orjson', None)
+
+    return request.param
+
+
+def test_orjson_is_used_when_installed() -> None:
+    assert serialization.orjson is not None
+
+
+def test_dumps_compact_utf8_json(backend: str) -> None:
+    assert json_dumps(PAYLOAD) == EXPECTED
+
+
+def test_loads_str_and_bytes(backend: str) -> None:
+    assert json_loads(EXPECTED) == json_loads(EXPECTED.decode('utf-8'))
+    assert json_loads(EXPECTED)['title'] == 'стрим'
+
+
+def test_dumps_rejects_unsupported_type(backend: str) -> None:
+    with pytest.raises(TypeError):
+        json_dumps({'value': object()})